@@ -0,0 +1,118 @@
+"""
+Measures the decode time and peak memory of a large UserRepositories page with the json module, the fast
+backend of github_query.model.decode when one is installed, and the StreamingDecoder.
+
+Every decoder runs in its own process reading the fixture in 64 KiB chunks, as the client reads a socket,
+so the peak RSS reported by getrusage belongs to that decoder alone. The full decoders keep the whole body
+and tree alive, the streaming decoder only holds one node at a time.
+
+Without a fixture, a page of 100 repositories with languages(first: 100) edges is recorded to a temporary
+file first.
+
+Usage:
+    python benchmarks/bench_decode.py [fixture.json] [repetitions]
+"""
+import json
+import os
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+from github_query.model import decode
+
+CHUNK_SIZE = 65536
+PATH = ["data", "user", "repositories"]
+
+
+def record_fixture(path, repositories=100, languages=100):
+    generator = random.Random(0)
+    nodes = [{
+        "name": f"repo{number}",
+        "createdAt": "2022-01-01T00:00:00Z",
+        "forkCount": generator.randint(0, 500),
+        "stargazerCount": generator.randint(0, 5000),
+        "isFork": False,
+        "description": "x" * generator.randint(0, 200),
+        "languages": {
+            "totalSize": languages * 1000,
+            "edges": [{"size": generator.randint(1, 100000), "node": {"name": f"Language{language}"}}
+                      for language in range(languages)],
+        },
+    } for number in range(repositories)]
+    with open(path, "w") as file:
+        json.dump({"data": {"user": {"repositories": {
+            "nodes": nodes, "pageInfo": {"endCursor": "Y3Vyc29yOjEwMA==", "hasNextPage": True}
+        }}}}, file)
+
+
+def read_chunks(path):
+    with open(path, "rb") as file:
+        while chunk := file.read(CHUNK_SIZE):
+            yield chunk
+
+
+def run_json(path):
+    response = json.loads(b"".join(read_chunks(path)))
+    return len(response["data"]["user"]["repositories"]["nodes"])
+
+
+def run_backend(path):
+    response = decode.loads(b"".join(read_chunks(path)))
+    return len(response["data"]["user"]["repositories"]["nodes"])
+
+
+def run_stream(path):
+    decoder = decode.StreamingDecoder(PATH)
+    count = 0
+    for chunk in read_chunks(path):
+        for _ in decoder.feed(chunk):
+            count += 1
+    for _ in decoder.feed(b"", final=True):
+        count += 1
+    assert decoder.result["data"]["user"]["repositories"]["pageInfo"]["hasNextPage"]
+    return count
+
+
+METHODS = {"json": run_json, f"loads ({decode.BACKEND})": run_backend, "StreamingDecoder": run_stream}
+
+
+def measure(method, path, repetitions):
+    """
+    Runs a decoder in this process and prints its best time and the peak RSS in KiB.
+    """
+    baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    best = float("inf")
+    for _ in range(repetitions):
+        start = time.perf_counter()
+        nodes = METHODS[method](path)
+        best = min(best, time.perf_counter() - start)
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(json.dumps({"nodes": nodes, "seconds": best, "peak_rss_kib": peak, "baseline_kib": baseline}))
+
+
+def main():
+    if len(sys.argv) > 1 and sys.argv[1] == "--measure":
+        measure(sys.argv[2], sys.argv[3], int(sys.argv[4]))
+        return
+
+    repetitions = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    with tempfile.TemporaryDirectory() as directory:
+        path = sys.argv[1] if len(sys.argv) > 1 else os.path.join(directory, "user_repositories.json")
+        if len(sys.argv) <= 1:
+            record_fixture(path)
+        print(f"fixture: {os.path.getsize(path) / 2 ** 20:.1f} MiB, best of {repetitions}")
+        print(f"{'decoder':<22}{'nodes':>8}{'decode ms':>12}{'peak RSS MiB':>15}{'over baseline':>15}")
+        for method in METHODS:
+            output = subprocess.run([sys.executable, __file__, "--measure", method, path, str(repetitions)],
+                                    capture_output=True, text=True, check=True).stdout
+            result = json.loads(output)
+            print(f"{method:<22}{result['nodes']:>8}{result['seconds'] * 1000:>12.1f}"
+                  f"{result['peak_rss_kib'] / 1024:>15.1f}"
+                  f"{(result['peak_rss_kib'] - result['baseline_kib']) / 1024:>15.1f}")
+
+
+if __name__ == "__main__":
+    main()
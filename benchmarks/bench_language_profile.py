@@ -0,0 +1,66 @@
+"""
+Measures building the GitLab LanguageProfiles of a large cohort and answering cohort queries on it.
+
+Every user gets starred and member projects drawn from a shared pool, so projects overlap between users
+and between the two queries of a user.
+
+Usage:
+    python benchmarks/bench_language_profile.py [users] [projects_per_user]
+"""
+import random
+import sys
+import time
+
+from github_query.util.language_profile import LanguageProfileBuilder
+
+LANGUAGES = [f"Language{number}" for number in range(300)]
+
+
+def project_pool(count, generator):
+    pool = []
+    for number in range(count):
+        names = generator.sample(LANGUAGES[:40] if generator.random() < 0.9 else LANGUAGES, generator.randint(1, 4))
+        shares = [generator.random() for _ in names]
+        pool.append({"id": f"gid://gitlab/Project/{number}", "name": f"project{number}",
+                     "languages": [{"name": name, "share": 100 * share / sum(shares)}
+                                   for name, share in zip(names, shares)]})
+    return pool
+
+
+def user_pages(pool, projects, generator):
+    starred = generator.sample(pool, projects)
+    member = generator.sample(pool, projects // 2) + starred[:2]
+    return [{"user": {"username": "u", "starredProjects": {"nodes": starred}}},
+            {"user": {"username": "u", "projectMemberships": {"nodes": [{"project": project} for project in member]}}}]
+
+
+def timed(label, function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    print(f"{label:<36}{(time.perf_counter() - start) * 1000:>10.1f} ms")
+    return result
+
+
+def main():
+    users = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    projects = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    generator = random.Random(0)
+    pool = project_pool(20_000, generator)
+
+    builder = LanguageProfileBuilder()
+    start = time.perf_counter()
+    for user in range(users):
+        builder.add(f"user{user}", user_pages(pool, projects, generator))
+    profiles = builder.build()
+    print(f"{users} users, {len(profiles.languages)} languages, {len(profiles.values)} non-zero entries, "
+          f"{(profiles.values.nbytes + profiles.language_ids.nbytes + profiles.offsets.nbytes) / 2 ** 20:.1f} MiB")
+    print(f"{'generate pages and build':<36}{(time.perf_counter() - start) * 1000:>10.1f} ms")
+
+    timed("cohort top 10 languages", profiles.cohort_languages, 10)
+    timed("top 10 users of a language", profiles.top_users, "Language0", 10)
+    timed("10 most similar users", profiles.similar_users, "user0", 10)
+    timed("top 5 languages of a user", profiles.top_languages, "user0", 5)
+
+
+if __name__ == "__main__":
+    main()
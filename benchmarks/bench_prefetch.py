@@ -0,0 +1,89 @@
+"""
+Measures the wall time of a paginated UserRepositories crawl with and without prefetching.
+
+A local stub server answers every page after a fixed latency and the consumer spends a fixed time on
+each page, so the crawl should take about pages * (latency + processing) without prefetching and about
+pages * max(latency, processing) with it.
+
+Usage:
+    python benchmarks/bench_prefetch.py [pages] [latency_ms] [processing_ms]
+"""
+import json
+import re
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from github_query.model.authentication import PersonalAccessTokenAuthenticator
+from github_query.queries.contributions.user_repositories import UserRepositories
+from github_query.tests.helpers.mock_client import MockClient
+
+SUBSTITUTIONS = {
+    "user": "tester",
+    "pg_size": 100,
+    "is_fork": False,
+    "ownership": "OWNER",
+    "order_by": {"field": "CREATED_AT", "direction": "ASC"},
+}
+
+
+def page(number, pages):
+    return json.dumps({"data": {"user": {"repositories": {
+        "nodes": [{"name": f"repo{number}", "createdAt": "2022-01-01T00:00:00Z"}],
+        "pageInfo": {"endCursor": f"cursor{number}", "hasNextPage": number < pages - 1},
+    }}}}).encode()
+
+
+def stub_handler(pages, latency):
+    class StubHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def do_POST(self):
+            body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+            match = re.search(r'after: "cursor(\d+)"', body["query"])
+            number = int(match.group(1)) + 1 if match else 0
+            time.sleep(latency)
+            response = page(number, pages)
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(response)))
+            self.end_headers()
+            self.wfile.write(response)
+
+        def log_message(self, format, *args):
+            return
+
+    return StubHandler
+
+
+def crawl(host, prefetch_depth, processing):
+    with MockClient(host=host, protocol="http", prefetch_depth=prefetch_depth,
+                    authenticator=PersonalAccessTokenAuthenticator(token="token")) as client:
+        start = time.perf_counter()
+        count = 0
+        for _ in client.execute(query=UserRepositories(), substitutions=SUBSTITUTIONS):
+            time.sleep(processing)
+            count += 1
+        return count, time.perf_counter() - start
+
+
+def main():
+    pages = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    latency = (float(sys.argv[2]) if len(sys.argv) > 2 else 20) / 1000
+    processing = (float(sys.argv[3]) if len(sys.argv) > 3 else 20) / 1000
+    server = ThreadingHTTPServer(("127.0.0.1", 0), stub_handler(pages, latency))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    host = f"127.0.0.1:{server.server_port}"
+
+    print(f"{pages} pages, {latency * 1000:.0f} ms latency, {processing * 1000:.0f} ms processing per page")
+    for depth in (0, 1, 2, 4):
+        count, elapsed = crawl(host, depth, processing)
+        print(f"prefetch_depth={depth:<8}{count:>4} pages{elapsed:>10.2f} s")
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Measures query rendering throughput of every Query class in github_query/queries.
+
+Compares re-rendering the QueryNode tree on every call against Query.substitute with its compiled template.
+
+Usage:
+    python benchmarks/bench_render.py [iterations]
+"""
+import importlib
+import inspect
+import sys
+import time
+from pathlib import Path
+from string import Template
+
+import github_query
+from github_query.model.query import Query
+
+SUBSTITUTIONS = {
+    "user": "tester",
+    "pg_size": 10,
+    "is_fork": False,
+    "ownership": "OWNER",
+    "order_by": {"field": "CREATED_AT", "direction": "ASC"},
+    "dryrun": True,
+}
+
+
+def query_classes():
+    """
+    Finds every Query class with a no-argument constructor under github_query/queries.
+    Returns:
+        List of Query classes
+    """
+    package_dir = Path(github_query.__file__).parent
+    classes = []
+    for path in sorted((package_dir / "queries").rglob("*.py")):
+        if path.name == "__init__.py":
+            continue
+        module_name = ".".join(path.relative_to(package_dir.parent).with_suffix("").parts)
+        module = importlib.import_module(module_name)
+        for _, cls in inspect.getmembers(module, inspect.isclass):
+            if issubclass(cls, Query) and cls.__module__ == module_name:
+                try:
+                    cls()
+                except TypeError:
+                    continue
+                classes.append(cls)
+    return classes
+
+
+def uncached(query):
+    return Template(str(query)).substitute(**Query.convert_dict(SUBSTITUTIONS))
+
+
+def cached(query):
+    return query.substitute(**SUBSTITUTIONS)
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    print(f"{'query':<36}{'uncached/s':>14}{'compiled/s':>14}")
+    for cls in query_classes():
+        query = cls()
+        rates = []
+        for render in (uncached, cached):
+            start = time.perf_counter()
+            for _ in range(iterations):
+                render(query)
+            rates.append(iterations / (time.perf_counter() - start))
+        print(f"{cls.__name__:<36}{rates[0]:>14.0f}{rates[1]:>14.0f}")
+
+
+if __name__ == "__main__":
+    main()
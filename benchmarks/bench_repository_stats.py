@@ -0,0 +1,72 @@
+"""
+Measures the aggregation of the UserRepositories pages of a cohort with cumulated_repository_stats per user
+against batch_repository_stats over every user at once, and checks that both return the same stats.
+
+Usage:
+    python benchmarks/bench_repository_stats.py [users] [repositories_per_user]
+"""
+import random
+import sys
+import time
+
+from github_query.queries.contributions.user_repositories import UserRepositories
+from github_query.util.repository_stats import TOTALS, batch_repository_stats
+
+LANGUAGES = ["Python", "JavaScript", "TypeScript", "Go", "Rust", "C", "C++", "Java", "Shell", "HTML", "CSS", "Ruby"]
+END = "2022-01-01T00:00:00Z"
+
+
+def cohort(users, repositories, page_size=100):
+    generator = random.Random(0)
+    user_pages = {}
+    for user in range(users):
+        nodes = []
+        for _ in range(repositories):
+            edges = [{"size": generator.randint(1, 100000), "node": {"name": name}}
+                     for name in generator.sample(LANGUAGES, generator.randint(0, 6))]
+            nodes.append({
+                "createdAt": f"{generator.randint(2010, 2023)}-0{generator.randint(1, 9)}-1{generator.randint(0, 9)}"
+                             f"T12:00:00Z",
+                "forkCount": generator.randint(0, 50),
+                "stargazerCount": generator.randint(0, 500),
+                "watchers": {"totalCount": generator.randint(0, 20)},
+                "languages": {"totalSize": sum(edge["size"] for edge in edges), "edges": edges},
+            })
+        user_pages[f"user{user}"] = [{"user": {"repositories": {"nodes": nodes[start:start + page_size]}}}
+                                     for start in range(0, len(nodes), page_size)]
+    return user_pages
+
+
+def loop_stats(user_pages):
+    stats = {}
+    for user, pages in user_pages.items():
+        repo_stats, lang_stats = dict.fromkeys(TOTALS, 0), {}
+        for page in pages:
+            UserRepositories.cumulated_repository_stats(UserRepositories.user_repositories(page),
+                                                        repo_stats, lang_stats, END)
+        stats[user] = (repo_stats, lang_stats)
+    return stats
+
+
+def main():
+    users = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    repositories = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    user_pages = cohort(users, repositories)
+
+    start = time.perf_counter()
+    expected = loop_stats(user_pages)
+    loop_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batch = batch_repository_stats(user_pages, END)
+    batch_seconds = time.perf_counter() - start
+
+    assert all(batch.repo_stats(user) == repo_stats and batch.lang_stats(user) == lang_stats
+               for user, (repo_stats, lang_stats) in expected.items())
+    print(f"{users} users x {repositories} repositories, results identical")
+    print(f"cumulated_repository_stats per user: {loop_seconds:.3f}s")
+    print(f"batch_repository_stats:              {batch_seconds:.3f}s ({loop_seconds / batch_seconds:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Compares requests/sec of one-off requests.post calls against the pooled client session.
+
+Usage:
+    python benchmarks/bench_session.py [requests]
+"""
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+from github_query.model.authentication import PersonalAccessTokenAuthenticator
+from github_query.tests.helpers.mock_client import MockClient
+
+RESPONSE = json.dumps({"data": {"user": {"login": "tester"}}}).encode()
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(RESPONSE)))
+        self.end_headers()
+        self.wfile.write(RESPONSE)
+
+    def log_message(self, format, *args):
+        return
+
+
+def run(label, send, count):
+    start = time.perf_counter()
+    for _ in range(count):
+        send()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<24}{count / elapsed:>10.1f} req/s")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    host = f"127.0.0.1:{server.server_port}"
+
+    with MockClient(host=host, protocol="http",
+                    authenticator=PersonalAccessTokenAuthenticator(token="token")) as client:
+        payload = {"query": "query { user(login: \"tester\") { login } }"}
+        run("requests.post", lambda: requests.post(client.base_path(), json=payload), count)
+        run("pooled session", lambda: client.session.post(client.base_path(), json=payload), count)
+        run("client.execute", lambda: client.execute(query=payload["query"], substitutions={}), count)
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
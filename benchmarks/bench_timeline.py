@@ -0,0 +1,76 @@
+"""
+Measures time-window counting over 1M createdAt timestamps with per-record strptime loops against Timeline.
+
+The loops are what helper.created_before and helper.in_time_period did for every record before they wrapped
+to_epochs: two or three strptime calls per record and window. Timeline parses the strings once and
+answers every count with searchsorted.
+
+Usage:
+    python benchmarks/bench_timeline.py [timestamps] [windows]
+"""
+import sys
+import time
+from datetime import datetime
+
+import numpy as np
+
+from github_query.util.timeline import Timeline
+
+TIME_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+
+def timestamps(count):
+    generator = np.random.default_rng(0)
+    start = np.datetime64("2008-01-01T00:00:00", "s").astype(np.int64)
+    end = np.datetime64("2024-01-01T00:00:00", "s").astype(np.int64)
+    epochs = np.sort(generator.integers(start, end, count))
+    return [f"{stamp}Z" for stamp in epochs.astype("datetime64[s]")]
+
+
+def loop_count_before(times, end):
+    end = datetime.strptime(end, TIME_FORMAT)
+    return sum(datetime.strptime(created, TIME_FORMAT) < end for created in times)
+
+
+def loop_count_between(times, start, end):
+    start, end = datetime.strptime(start, TIME_FORMAT), datetime.strptime(end, TIME_FORMAT)
+    return sum(start <= datetime.strptime(created, TIME_FORMAT) < end for created in times)
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    windows = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    times = timestamps(count)
+    starts = [f"{year}-01-01T00:00:00Z" for year in range(2008, 2008 + windows)]
+    ends = [f"{year + 1}-01-01T00:00:00Z" for year in range(2008, 2008 + windows)]
+
+    loop_before, loop_before_seconds = timed(loop_count_before, times, ends[-1])
+    loop_between, loop_between_seconds = timed(lambda: [loop_count_between(times, start, end)
+                                                        for start, end in zip(starts, ends)])
+
+    timeline, build_seconds = timed(Timeline, times)
+    before, before_seconds = timed(timeline.count_before, ends[-1])
+    between, between_seconds = timed(timeline.count_between, starts, ends)
+    by_year, by_year_seconds = timed(timeline.count_by_year)
+
+    assert loop_before == before and loop_between == list(between) == list(by_year.values())[:windows]
+    print(f"{count} timestamps, {windows} yearly windows")
+    print(f"{'operation':<34}{'loop s':>10}{'timeline s':>12}{'speedup':>10}")
+    print(f"{'parse (once)':<34}{'':>10}{build_seconds:>12.3f}{'':>10}")
+    print(f"{'count before T':<34}{loop_before_seconds:>10.3f}{before_seconds:>12.6f}"
+          f"{loop_before_seconds / before_seconds:>9.0f}x")
+    print(f"{'count in [start, end) x windows':<34}{loop_between_seconds:>10.3f}{between_seconds:>12.6f}"
+          f"{loop_between_seconds / between_seconds:>9.0f}x")
+    print(f"{'per-year buckets':<34}{'':>10}{by_year_seconds:>12.6f}{'':>10}")
+    print(f"{'parse + all counts':<34}{loop_before_seconds + loop_between_seconds:>10.3f}"
+          f"{build_seconds + before_seconds + between_seconds + by_year_seconds:>12.3f}")
+
+
+if __name__ == "__main__":
+    main()
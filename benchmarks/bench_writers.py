@@ -0,0 +1,54 @@
+"""
+Measures exporting rows with a per-row open, append, flush and close, as helper.write_csv does, against the
+buffered CSVWriter and JSONLinesWriter.
+
+Usage:
+    python benchmarks/bench_writers.py [rows]
+"""
+import os
+import sys
+import tempfile
+import time
+
+from github_query.util.writers import CSVWriter, JSONLinesWriter
+
+
+def per_row(path, rows):
+    for row in rows:
+        with open(file=path, mode='a') as f:
+            f.writelines(",".join(map(str, row)) + "\n")
+            f.flush()
+
+
+def buffered(writer_class, path, rows):
+    with writer_class(path) as writer:
+        for row in rows:
+            writer.write(row)
+
+
+def batched(writer_class, path, rows, batch_size=1000):
+    with writer_class(path) as writer:
+        for start in range(0, len(rows), batch_size):
+            writer.write_many(rows[start:start + batch_size])
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    rows = [("user%d" % number, number, number * 2, "2022-01-01T00:00:00Z") for number in range(count)]
+    with tempfile.TemporaryDirectory() as directory:
+        results = {}
+        for name, run in [("per-row open/append", lambda path: per_row(path, rows)),
+                          ("CSVWriter", lambda path: buffered(CSVWriter, path, rows)),
+                          ("CSVWriter write_many", lambda path: batched(CSVWriter, path, rows)),
+                          ("JSONLinesWriter", lambda path: buffered(JSONLinesWriter, path, rows))]:
+            path = os.path.join(directory, name.replace(" ", "_").replace("/", "_"))
+            start = time.perf_counter()
+            run(path)
+            results[name] = time.perf_counter() - start
+        print(f"{count} rows")
+        for name, seconds in results.items():
+            print(f"{name:<22}{seconds:>8.3f}s{results['per-row open/append'] / seconds:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,21 @@
 from abc import ABC
-from datetime import datetime
-import time
+from datetime import datetime, timezone
 
+from github_query.model.async_client import AsyncClient
 from github_query.model.client import Client
+from github_query.queries.utils.cost_estimate import estimate_github_cost
 from github_query.queries.utils.query_cost import QueryCost
 
 
 class GitHubClient(Client, ABC):
 
+    # alias of the rateLimit selection appended to every query
+    RATE_LIMIT_ALIAS = "rateLimitBudget"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._last_cost = 1
+
     def base_path(self):
         """
         Returns base path for a GraphQL Request.
@@ -20,20 +28,93 @@ class GitHubClient(Client, ABC):
             f"{self._protocol}://{self._host}/graphql"
         )
 
-    def handle_retry(self, match):
+    @staticmethod
+    def _reset_timestamp(reset_at: str):
+        """
+        Converts a resetAt value to epoch seconds.
+        Args:
+            reset_at: resetAt time string
+        Returns:
+            Epoch seconds
+        """
+        time_format = '%Y-%m-%dT%H:%M:%SZ'
+        return datetime.strptime(reset_at, time_format).replace(tzinfo=timezone.utc).timestamp()
+
+    def _record_rate_limit(self, rate_limit: dict):
+        """
+        Feeds a rateLimit selection into the budget.
+        Args:
+            rate_limit: rateLimit node with cost, remaining and resetAt
+        """
+        self._last_cost = rate_limit['cost']
+        self.budget.update(rate_limit['remaining'], self._reset_timestamp(rate_limit['resetAt']))
+
+    def handle_retry(self, match, estimate=None):
+        """
+        Preflights the query with a dry run only when its predicted cost would exceed the budget left.
+        The token of the request is picked first, so the preflight is sent with it and checks its budget.
+        The budget then sleeps until the reset if the query still does not fit.
+        Args:
+            match: Match of the query content
+            estimate: Static cost estimate of the query
+        """
+        remaining = self.budget.select(self._predict_cost(estimate)).remaining
+        if remaining is None or match is None or self._predict_cost(estimate) <= remaining - 5:
+            # documents sent with variables are not preflighted, the budget alone decides
+            return
         rate_query = QueryCost(match.group('content'))
         rate_limit = self._retry_request(3, 10, rate_query, {"dryrun": True})
-        rate_limit = rate_limit.json()["data"]["rateLimit"]
-        cost = rate_limit['cost']
-        remaining = rate_limit['remaining']
-        reset_at = rate_limit['resetAt']
-        if cost > remaining - 5:
-            current_time = datetime.utcnow()
-            time_format = '%Y-%m-%dT%H:%M:%SZ'
-            reset_at = datetime.strptime(reset_at, time_format)
-            time_diff = reset_at - current_time
-            seconds = time_diff.total_seconds()
-            print(f"stop at {current_time}s.")
-            print(f"waiting for {seconds}s.")
-            print(f"reset at {reset_at}s.")
-            time.sleep(seconds + 5)
+        self._record_rate_limit(rate_limit.json()["data"]["rateLimit"])
+
+    def _estimate(self, query, substitutions: dict):
+        """
+        Statically estimates the rate limit cost of a query.
+        Args:
+            query: Query to estimate
+            substitutions: Substitutions to make
+        Returns:
+            Predicted cost in rate limit points
+        """
+        return estimate_github_cost(query, substitutions)
+
+    def _predict_cost(self, estimate):
+        """
+        Predicts the cost of a query from its static estimate, or from the cost of the previous one.
+        Args:
+            estimate: Static cost estimate of the query
+        Returns:
+            Predicted cost in rate limit points
+        """
+        return estimate if estimate is not None else self._last_cost
+
+    def _prepare_query(self, query_string: str):
+        """
+        Appends a rateLimit selection so every response reports its cost and the budget left.
+        Args:
+            query_string: Rendered query
+        Returns:
+            Query to send
+        """
+        if "rateLimit" in query_string or not query_string.lstrip().startswith(("query", "{")):
+            return query_string
+        index = query_string.rfind("}")
+        if index < 0:
+            return query_string
+        return (f"{query_string[:index]}{self.RATE_LIMIT_ALIAS}: rateLimit {{ cost remaining resetAt }} "
+                f"{query_string[index:]}")
+
+    def _handle_response(self, json_response: dict):
+        """
+        Records and strips the appended rateLimit selection.
+        Args:
+            json_response: Decoded response
+        """
+        data = json_response.get("data")
+        if isinstance(data, dict) and self.RATE_LIMIT_ALIAS in data:
+            self._record_rate_limit(data.pop(self.RATE_LIMIT_ALIAS))
+
+
+class AsyncGitHubClient(AsyncClient, GitHubClient):
+    """
+    asyncio GitHub client with bounded concurrency.
+    """
@@ -1,14 +1,28 @@
-import time
+import re
 from abc import ABC
+from concurrent.futures import ThreadPoolExecutor
+from functools import reduce
 
+from github_query.model.async_client import AsyncClient
 from github_query.model.client import Client
-from github_query.queries.utils.gitlab.query_cost import GitLabQueryCost
+from github_query.model.query import Query, PaginatedQuery, PaginationCursor
+from github_query.model.query_split import split_query, merge_responses
+from github_query.queries.utils.cost_estimate import estimate_gitlab_complexity
 
 class QueryComplexityError(Exception):
     pass
 
 class GitLabClient(Client, ABC):
 
+    # complexity limit of authenticated requests on gitlab.com
+    complexity_limit = 250
+
+    # split queries over the complexity limit into concurrent sub-queries instead of raising
+    split_complex_queries = True
+    max_split_parts = 16
+
+    COMPLEXITY_ERROR = re.compile(r"complexity of (?P<score>\d+), which exceeds max complexity of (?P<limit>\d+)")
+
     def base_path(self):
         """
         Returns base path for a GraphQL Request.
@@ -21,12 +35,95 @@ class GitLabClient(Client, ABC):
             f"{self._protocol}://{self._host}/api/graphql"
         )
 
-    def handle_retry(self, match):
-        rate_query = GitLabQueryCost(match.group('content'))
-        query_complexity = self._retry_request(3, 10, rate_query, {"dryrun": True})
-        query_complexity = query_complexity.json()["data"]["queryComplexity"]
-        limit = query_complexity["limit"]
-        score = query_complexity["score"]
-        if score > limit:
+    def handle_retry(self, match, estimate=None):
+        """
+        Raises QueryComplexityError without a round trip when the estimated complexity exceeds the limit.
+        Queries that slip past the estimate are still rejected by GitLab itself.
+        Args:
+            match: Match of the query content
+            estimate: Static complexity estimate of the query
+        """
+        if estimate is not None and estimate > self.complexity_limit:
             raise QueryComplexityError("Query is too complex. Please simplify query")
 
+    def _execute(self, query, substitutions: dict, cursor: PaginationCursor = None):
+        """
+        Executes a query after substituting values. A Query over the complexity limit, or rejected by
+        GitLab for its complexity, is split into sub-queries that run concurrently and are merged back
+        into one response. A page whose size the page size controller can still shrink raises
+        QueryComplexityError instead, so that the page is first retried with a smaller size.
+        Args:
+            query: Query to run
+            substitutions: Substitutions to make
+            cursor: Pagination state when fetching a page of a PaginatedQuery
+
+        Returns:
+            Response as a JSON
+        """
+        try:
+            return super()._execute(query, substitutions, cursor)
+        except QueryComplexityError:
+            # alias batches are already sized to the limit by AliasBatcher
+            if not self.split_complex_queries or not isinstance(query, Query) or hasattr(query, "parts"):
+                raise
+            if isinstance(query, PaginatedQuery) and getattr(self._local, "shrinkable", False):
+                raise
+            parts = split_query(query, substitutions, estimate_gitlab_complexity, self.complexity_limit,
+                                self.max_split_parts)
+            if parts is None:
+                raise
+        # the parts' round trips count towards the page being fetched by this thread
+        round_trips = getattr(self._local, "round_trips", None)
+
+        def execute_part(part):
+            self._local.round_trips = round_trips
+            return self._execute(part, substitutions, cursor if isinstance(part, PaginatedQuery) else None)
+
+        with ThreadPoolExecutor(max_workers=len(parts)) as pool:
+            responses = list(pool.map(execute_part, parts))
+        return reduce(merge_responses, responses)
+
+    def _estimate(self, query, substitutions: dict):
+        """
+        Statically estimates the queryComplexity score of a query.
+        Args:
+            query: Query to estimate
+            substitutions: Substitutions to make
+        Returns:
+            Predicted complexity score
+        """
+        return estimate_gitlab_complexity(query, substitutions)
+
+    def _is_overload(self, error: Exception):
+        """
+        Checks whether a failed page may succeed with a smaller page size.
+        Args:
+            error: Error raised by the page
+        Returns:
+            True for complexity errors, timeouts and non-200 responses
+        """
+        return isinstance(error, QueryComplexityError) or super()._is_overload(error)
+
+    def _target_cost(self):
+        """
+        Returns the complexity limit as the target score per request.
+        Returns:
+            Target complexity score
+        """
+        return self.complexity_limit
+
+    def _handle_response(self, json_response: dict):
+        """
+        Raises QueryComplexityError when GitLab rejected the query for its complexity.
+        Args:
+            json_response: Decoded response
+        """
+        for error in json_response.get("errors") or []:
+            if self.COMPLEXITY_ERROR.search(str(error.get("message", ""))):
+                raise QueryComplexityError("Query is too complex. Please simplify query")
+
+
+class AsyncGitLabClient(AsyncClient, GitLabClient):
+    """
+    asyncio GitLab client with bounded concurrency.
+    """
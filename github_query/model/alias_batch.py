@@ -0,0 +1,163 @@
+from string import Template
+from typing import List
+
+from github_query.model.batch import BatchJob, BatchResult
+from github_query.model.client import Client, QueryFailedException
+from github_query.model.query import Query, QueryNode, PaginatedQuery, PaginationCursor
+
+
+class AliasedQuery(Query):
+    """
+    Query merging the top-level selections of many jobs into one document under per-job aliases.
+    """
+
+    def __init__(self, parts: List[tuple]):
+        """
+        Initializes an AliasedQuery.
+        Args:
+            parts: List of (alias prefix, query, substitutions, cursor), cursor is None for a Query
+        """
+        super().__init__(fields=[])
+        self.parts = parts
+
+    def substitute(self, **kwargs):
+        """
+        Renders every part with its own substitutions and aliases its top-level fields.
+        Args:
+            **kwargs: Ignored, each part carries its substitutions
+
+        Returns:
+            Merged Query as a string
+        """
+        rendered = []
+        for prefix, query, substitutions, cursor in self.parts:
+            converted_args = Query.convert_dict(substitutions)
+            after = None
+            if cursor is not None:
+                after = "$_cursor"
+                converted_args["_cursor"] = cursor.literal()
+            for field in query.fields:
+                name = field.name if isinstance(field, QueryNode) else field
+                field_template = Template(Query._render_field(field, after))
+                rendered.append(f"{prefix}{name}: " + field_template.substitute(**converted_args))
+        return "query { " + " ".join(rendered) + " }"
+
+    @staticmethod
+    def split(data: dict, prefix: str):
+        """
+        Extracts the response of one part from the merged response.
+        Args:
+            data: Data of the merged response
+            prefix: Alias prefix of the part
+        Returns:
+            Response of the part as a JSON
+        """
+        return {key[len(prefix):]: value for key, value in data.items() if key.startswith(prefix)}
+
+
+class AliasBatcher:
+    """
+    Runs many jobs through a client, merging up to K of them into each request with GraphQL aliases.
+
+    PaginatedQuery jobs keep their own PaginationCursor, a job stays in the following batches until its last page.
+    """
+
+    def __init__(self, client: Client, max_batch_size: int = 25, cost_limit: int = None):
+        """
+        Initializes the batcher.
+        Args:
+            client: Client to execute the merged queries
+            max_batch_size: Maximum number of jobs merged into one request
+            cost_limit: Maximum estimated cost of a merged request, defaults to the client's
+                complexity_limit on GitLab and to 1 point on GitHub
+        """
+        self._client = client
+        self._max_batch_size = max_batch_size
+        self._cost_limit = cost_limit if cost_limit is not None else getattr(client, "complexity_limit", 1)
+
+    def _batch_size(self, pending: list):
+        """
+        Picks K, the largest number of pending jobs whose merged estimate fits the cost limit.
+        Args:
+            pending: Pending (job, cursor) pairs
+        Returns:
+            Number of jobs to merge
+        """
+        size = 1
+        while size < min(self._max_batch_size, len(pending)):
+            parts = [(f"b{i}_", job.query, job.substitutions, cursor)
+                     for i, (job, cursor) in enumerate(pending[:size + 1])]
+            estimate = self._client._estimate(AliasedQuery(parts), {})
+            if estimate is not None and estimate > self._cost_limit:
+                break
+            size += 1
+        return size
+
+    @staticmethod
+    def _failed_prefixes(error: QueryFailedException, prefixes: List[str]):
+        """
+        Finds the parts a partial GraphQL error belongs to.
+        Args:
+            error: Error raised for the merged request
+            prefixes: Alias prefixes of the batch
+        Returns:
+            Data of the merged response and the failed prefixes, or None if the whole request failed
+        """
+        try:
+            json_response = error.response.json()
+        except (AttributeError, ValueError):
+            return None
+        data = json_response.get("data")
+        paths = [err.get("path") for err in json_response.get("errors", [])]
+        if not isinstance(data, dict) or not paths or not all(paths):
+            return None
+        failed = {prefix for prefix in prefixes for path in paths if str(path[0]).startswith(prefix)}
+        return data, failed
+
+    def execute(self, jobs: List[BatchJob]):
+        """
+        Executes the jobs, yielding a BatchResult as each job completes.
+        Args:
+            jobs: Jobs to run
+        Returns:
+            Generator of BatchResult, the result of a PaginatedQuery job is its list of pages
+        """
+        pending = [(job, PaginationCursor() if isinstance(job.query, PaginatedQuery) else None) for job in jobs]
+        pages = {id(job): [] for job in jobs}
+
+        while pending:
+            size = self._batch_size(pending)
+            batch, pending = pending[:size], pending[size:]
+            prefixes = [f"b{i}_" for i in range(len(batch))]
+            parts = [(prefix, job.query, job.substitutions, cursor)
+                     for prefix, (job, cursor) in zip(prefixes, batch)]
+
+            failed = set()
+            try:
+                data = self._client.execute(query=AliasedQuery(parts), substitutions={})
+            except QueryFailedException as error:
+                partial = self._failed_prefixes(error, prefixes)
+                if partial is None:
+                    for job, _ in batch:
+                        yield BatchResult(job, error=error)
+                    continue
+                data, failed = partial
+                for prefix, (job, _) in zip(prefixes, batch):
+                    if prefix in failed:
+                        yield BatchResult(job, error=error)
+
+            for prefix, (job, cursor) in zip(prefixes, batch):
+                if prefix in failed:
+                    continue
+                response = AliasedQuery.split(data, prefix)
+                if cursor is None:
+                    yield BatchResult(job, result=response)
+                    continue
+
+                pages[id(job)].append(response)
+                page_info = job.query.page_info(response, job.substitutions)
+                cursor.update(page_info["hasNextPage"], page_info["endCursor"])
+                if cursor.has_next():
+                    pending.append((job, cursor))
+                else:
+                    yield BatchResult(job, result=pages.pop(id(job)))
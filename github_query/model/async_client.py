@@ -0,0 +1,169 @@
+import asyncio
+from abc import ABC
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Union
+
+from github_query.model.checkpoint import Checkpoint
+from github_query.model.client import Client
+from github_query.model.query import Query, PaginatedQuery, PaginationCursor
+
+
+class AsyncClient(Client, ABC):
+    """
+    asyncio counterpart of the GraphQL Client.
+
+    Requests run on a bounded worker pool so the event loop is never blocked, while the
+    rate limit and complexity checks of handle_retry keep their synchronous semantics.
+    """
+
+    def __init__(self, *args, max_concurrency: int = 10, **kwargs):
+        """
+        Initializes the client.
+        Args:
+            *args: Arguments of Client
+            max_concurrency: Maximum number of requests in flight at once
+            **kwargs: Keyword arguments of Client
+        """
+        kwargs.setdefault("pool_maxsize", max_concurrency)
+        super().__init__(*args, **kwargs)
+        self._max_concurrency = max_concurrency
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency)
+        self._semaphore = None
+        self._semaphore_loop = None
+
+    def _get_semaphore(self):
+        """
+        Returns the concurrency semaphore bound to the running event loop.
+        Returns:
+            asyncio Semaphore
+        """
+        loop = asyncio.get_running_loop()
+        if self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+            self._semaphore_loop = loop
+        return self._semaphore
+
+    async def _run(self, func, *args):
+        """
+        Runs a blocking call on the worker pool once a concurrency slot is free.
+        Args:
+            func: Blocking callable
+            *args: Arguments of the callable
+        Returns:
+            Result of the callable
+        """
+        async with self._get_semaphore():
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, partial(func, *args))
+
+    async def _execute_async(self, query: Union[str, Query], substitutions: dict, cursor: PaginationCursor = None):
+        """
+        Executes a query after substituting values.
+        Args:
+            query: Query to run
+            substitutions: Substitutions to make
+            cursor: Pagination state when fetching a page of a PaginatedQuery
+        Returns:
+            Response as a JSON
+        """
+        if cursor is not None:
+            return await self._run(self._execute_page, query, substitutions, cursor)
+        return await self._run(self._execute, query, substitutions)
+
+    def execute(self, query: Union[str, Query, PaginatedQuery], substitutions: dict,
+                cursor: PaginationCursor = None, resume: bool = False):
+        """
+        Executes a query after substituting values. A Query returns an awaitable, a PaginatedQuery
+        returns an async iterator over its pages.
+        Args:
+            query: Query to run
+            substitutions: Substitutions to make
+            cursor: Pagination state a PaginatedQuery starts from, the first page if omitted
+            resume: Continue a PaginatedQuery from the last page committed to the client's checkpoints
+        Returns:
+            Awaitable response or async iterator of responses
+        """
+        if isinstance(query, PaginatedQuery):
+            cursor, pages = self._resume_point(query, substitutions, cursor, resume)
+            generator = self._async_execution_generator(query, substitutions, cursor)
+            if self.checkpoints is not None:
+                return self._async_checkpointed_generator(generator, query, substitutions, pages)
+            return generator
+
+        return self._execute_async(query, substitutions)
+
+    async def _async_execution_generator(self, query: PaginatedQuery, substitutions: dict,
+                                         cursor: PaginationCursor = None):
+        """
+        Executes a PaginatedQuery after substituting values.
+        Args:
+            query: Query to run
+            substitutions: Substitutions to make
+            cursor: Pagination state to start from
+        Returns:
+            Response as a JSON
+        """
+        cursor = cursor or PaginationCursor()
+        while cursor.has_next():
+            response = await self._execute_async(query, substitutions, cursor)
+            page_info = query.page_info(response, substitutions)
+            cursor.update(page_info["hasNextPage"], page_info["endCursor"])
+            yield response
+
+    async def _async_checkpointed_generator(self, pages, query: PaginatedQuery, substitutions: dict,
+                                            emitted: int):
+        """
+        Commits a checkpoint after every page the caller has processed, and deletes it once the run completes.
+        The checkpoint files are written on the default executor, off the event loop.
+        Args:
+            pages: Async iterator of pages
+            query: Query to run
+            substitutions: Substitutions to make
+            emitted: Number of pages emitted before the run started
+        Returns:
+            Response as a JSON
+        """
+        loop = asyncio.get_running_loop()
+        key = self.checkpoints.key(query, substitutions, self.base_path())
+        async for response in pages:
+            yield response
+            emitted += 1
+            end_cursor = query.page_info(response, substitutions)["endCursor"]
+            await loop.run_in_executor(None, self.checkpoints.save, key,
+                                       Checkpoint(type(query).__name__, substitutions, end_cursor, emitted))
+        await loop.run_in_executor(None, self.checkpoints.delete, key)
+
+    async def iter_nodes(self, query: PaginatedQuery, substitutions: dict, fields: list = None, **kwargs):
+        """
+        Executes a PaginatedQuery and yields the nodes of its paginated connection one by one.
+        Args:
+            query: Query to run
+            substitutions: Substitutions to make
+            fields: Dotted paths of the fields to keep, every field if omitted
+            **kwargs: Keyword arguments of execute, e.g. cursor or resume
+        Returns:
+            Async iterator of nodes
+        """
+        projection = Client._projection(fields)
+        async for page in self.execute(query, substitutions, **kwargs):
+            nodes = query.nodes(page, substitutions)
+            page = None
+            if self.entity_store is not None:
+                nodes = list(nodes)
+            nodes.reverse()
+            while nodes:
+                yield Client._project(self._detach(nodes.pop()), projection)
+
+    def close(self):
+        """
+        Shuts down the worker pool and closes the pooled connections.
+        """
+        self._executor.shutdown(wait=True)
+        super().close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.close()
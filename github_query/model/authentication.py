@@ -1,3 +1,10 @@
+import hashlib
+import json
+from typing import List
+
+from github_query.model.rate_limit import RateLimitBudget, TokenPoolBudget
+
+
 class Authenticator:
     """
     Handles Authentication Method for GitHub clients.
@@ -5,6 +12,24 @@ class Authenticator:
     def get_authorization_header(self):
         raise NotImplementedError("Authenticator cannot be implemented")
 
+    def identity(self):
+        """
+        Returns a hash of the credentials, so that responses fetched with different credentials are told apart
+        without keeping the credentials themselves.
+        Returns:
+            Hex digest of the credentials
+        """
+        header = json.dumps(self.get_authorization_header(), sort_keys=True)
+        return hashlib.sha256(header.encode()).hexdigest()
+
+    def create_budget(self):
+        """
+        Creates the rate limit budget of the credentials.
+        Returns:
+            Rate limit budget
+        """
+        return RateLimitBudget()
+
 
 class PersonalAccessTokenAuthenticator(Authenticator):
     """
@@ -50,3 +75,46 @@ class GitLabPersonalAccessTokenAuthenticator(Authenticator):
         return {
             "Authorization": f"Bearer {self._token}"
         }
+
+
+class TokenPoolAuthenticator(Authenticator):
+    """
+    Handles a pool of Personal Access Tokens, sending each request with the token that has the most
+    rate limit headroom left.
+    """
+    def __init__(self, tokens: List[str], authenticator_class: type = PersonalAccessTokenAuthenticator):
+        """
+        Sets the pool of Personal Access Tokens.
+        Args:
+            tokens: Personal Access Tokens
+            authenticator_class: Authenticator of a single token, e.g. GitLabPersonalAccessTokenAuthenticator
+        """
+        if not tokens:
+            raise ValueError("Token pool needs at least one token")
+        self._authenticators = [authenticator_class(token) for token in tokens]
+        self._budget = TokenPoolBudget(len(tokens))
+
+    def create_budget(self):
+        """
+        Returns the budget of the pool, shared by every client using the pool.
+        Returns:
+            Token pool budget
+        """
+        return self._budget
+
+    def get_authorization_header(self):
+        """
+        Returns the authentication header of the token reserved by the current request.
+        Returns:
+            Authentication Header
+        """
+        return self._authenticators[self._budget.current].get_authorization_header()
+
+    def identity(self):
+        """
+        Returns a hash of every token of the pool, the same whichever token sends the request.
+        Returns:
+            Hex digest of the credentials
+        """
+        identities = [authenticator.identity() for authenticator in self._authenticators]
+        return hashlib.sha256(" ".join(identities).encode()).hexdigest()
@@ -0,0 +1,96 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Union, List
+
+from github_query.model.client import Client
+from github_query.model.query import Query, PaginatedQuery
+
+
+class BatchJob:
+    """
+    A query and its substitutions to run as part of a batch.
+    """
+
+    def __init__(self, query: Union[str, Query, PaginatedQuery], substitutions: dict, key=None):
+        """
+        Initializes a BatchJob.
+        Args:
+            query: Query to run
+            substitutions: Substitutions to make
+            key: Optional identifier returned with the result
+        """
+        self.query = query
+        self.substitutions = substitutions
+        self.key = key
+
+
+class BatchResult:
+    """
+    Outcome of a BatchJob.
+    """
+
+    def __init__(self, job: BatchJob, result=None, error: Exception = None):
+        """
+        Initializes a BatchResult.
+        Args:
+            job: Job that produced the result
+            result: Response as a JSON, or the list of pages for a PaginatedQuery
+            error: Exception raised by the job
+        """
+        self.job = job
+        self.result = result
+        self.error = error
+
+    @property
+    def ok(self):
+        """
+        Returns whether the job completed without an error.
+        """
+        return self.error is None
+
+
+class BatchExecutor:
+    """
+    Runs many jobs through Client.execute on a worker pool.
+
+    Workers share the client, so its pooled session and rate limit budget are shared too.
+    """
+
+    def __init__(self, client: Client, max_workers: int = 8):
+        """
+        Initializes the executor.
+        Args:
+            client: Client to execute the jobs
+            max_workers: Number of worker threads, keep it at most the client's pool_maxsize
+        """
+        self._client = client
+        self._max_workers = max_workers
+
+    def _run(self, job: BatchJob):
+        """
+        Runs a single job, capturing its error.
+        Args:
+            job: Job to run
+        Returns:
+            BatchResult of the job
+        """
+        try:
+            if isinstance(job.query, PaginatedQuery):
+                result = list(self._client.execute(query=job.query, substitutions=job.substitutions))
+            else:
+                result = self._client.execute(query=job.query, substitutions=job.substitutions)
+        except Exception as error:
+            return BatchResult(job, error=error)
+        return BatchResult(job, result=result)
+
+    def execute(self, jobs: List[BatchJob]):
+        """
+        Executes the jobs, yielding results as they complete.
+        Args:
+            jobs: Jobs to run
+        Returns:
+            Generator of BatchResult in completion order
+        """
+        with ThreadPoolExecutor(max_workers=self._max_workers) as pool:
+            futures = [pool.submit(self._run, job) for job in jobs]
+            for future in as_completed(futures):
+                yield future.result()
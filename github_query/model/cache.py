@@ -0,0 +1,197 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+
+
+class CacheMissError(Exception):
+    pass
+
+
+class ResponseCache(ABC):
+    """
+    Cache of query responses under Client.execute.
+
+    Responses are keyed on a hash of the host, the credentials and the request payload, so every page of a
+    PaginatedQuery is cached separately and credentials never see responses fetched with other credentials.
+    Subclasses only store and load entries, expiry is decided here.
+    """
+
+    def __init__(self, default_ttl: float = 3600, ttls: dict = None, cache_only: bool = False):
+        """
+        Initializes the cache.
+        Args:
+            default_ttl: Seconds a response stays valid
+            ttls: Seconds a response stays valid per query class name, e.g. {"UserLogin": 86400}
+            cache_only: Serve responses from the cache only and raise CacheMissError instead of sending requests
+        """
+        self.default_ttl = default_ttl
+        self.ttls = ttls or {}
+        self.cache_only = cache_only
+        self._counter_lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(base_path: str, payload: dict, identity: str = ""):
+        """
+        Hashes a request into a cache key. Whitespace in the document is normalized.
+        Args:
+            base_path: GraphQL endpoint of the client
+            payload: Request payload
+            identity: Hash of the credentials sending the request, see Authenticator.identity
+        Returns:
+            Cache key
+        """
+        normalized = dict(payload, query=" ".join(payload["query"].split()))
+        return hashlib.sha256(json.dumps([base_path, identity, normalized], sort_keys=True).encode()).hexdigest()
+
+    def ttl(self, query):
+        """
+        Returns the TTL of a query.
+        Args:
+            query: Query of the response
+        Returns:
+            TTL in seconds
+        """
+        return self.ttls.get(type(query).__name__, self.default_ttl)
+
+    def get(self, key: str):
+        """
+        Returns a cached response and counts the hit or miss.
+        Args:
+            key: Cache key
+        Returns:
+            Response as a JSON, or None if it is missing or expired
+        """
+        value = self._load(key, time.time())
+        with self._counter_lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return value
+
+    def set(self, key: str, value, ttl: float):
+        """
+        Caches a response.
+        Args:
+            key: Cache key
+            value: Response as a JSON
+            ttl: Seconds the response stays valid
+        """
+        self._store(key, value, time.time() + ttl)
+
+    @abstractmethod
+    def _load(self, key: str, now: float):
+        """
+        Loads an entry that has not expired.
+        Args:
+            key: Cache key
+            now: Current epoch seconds
+        Returns:
+            Response as a JSON, or None
+        """
+        return None
+
+    @abstractmethod
+    def _store(self, key: str, value, expires_at: float):
+        """
+        Stores an entry.
+        Args:
+            key: Cache key
+            value: Response as a JSON
+            expires_at: Epoch seconds the entry expires at
+        """
+        return
+
+    @abstractmethod
+    def clear(self):
+        """
+        Removes every entry.
+        """
+        return
+
+
+class SQLiteResponseCache(ResponseCache):
+    """
+    ResponseCache stored in a SQLite file, evicting the least recently used entries above max_entries.
+
+    Hits only read the database. Their access times are kept in memory and written in the transaction of the
+    next store, the only place eviction reads them, or on close.
+    """
+
+    def __init__(self, path: str = "github_query_cache.sqlite", max_entries: int = 10000, **kwargs):
+        """
+        Initializes the cache.
+        Args:
+            path: SQLite database file, ":memory:" keeps the cache in memory
+            max_entries: Maximum number of cached responses
+            **kwargs: Keyword arguments of ResponseCache
+        """
+        super().__init__(**kwargs)
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._accessed = {}
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS responses "
+            "(key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        self._connection.execute("CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at)")
+        self._connection.commit()
+
+    def _load(self, key: str, now: float):
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value FROM responses WHERE key = ? AND expires_at > ?", (key, now)
+            ).fetchone()
+            if row is None:
+                return None
+            self._accessed[key] = time.time()
+        return json.loads(row[0])
+
+    def _write_accessed(self):
+        """
+        Writes the pending access times, without committing. Called with the lock held.
+        """
+        if self._accessed:
+            self._connection.executemany("UPDATE responses SET accessed_at = ? WHERE key = ?",
+                                         [(accessed_at, key) for key, accessed_at in self._accessed.items()])
+            self._accessed = {}
+
+    def _store(self, key: str, value, expires_at: float):
+        with self._lock:
+            self._write_accessed()
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses (key, value, expires_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, json.dumps(value), expires_at, time.time())
+            )
+            # keep the valid entries, most recently used first, and drop the rest
+            self._connection.execute(
+                "DELETE FROM responses WHERE key IN (SELECT key FROM responses "
+                "ORDER BY expires_at <= ?, accessed_at DESC LIMIT -1 OFFSET ?)",
+                (time.time(), self.max_entries)
+            )
+            self._connection.commit()
+
+    def __len__(self):
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def clear(self):
+        with self._lock:
+            self._accessed = {}
+            self._connection.execute("DELETE FROM responses")
+            self._connection.commit()
+
+    def close(self):
+        """
+        Writes the pending access times and closes the database connection.
+        """
+        with self._lock:
+            self._write_accessed()
+            self._connection.commit()
+            self._connection.close()
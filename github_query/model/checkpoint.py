@@ -0,0 +1,96 @@
+import hashlib
+import json
+import os
+
+
+class Checkpoint:
+    """
+    Progress of a PaginatedQuery run.
+    """
+
+    def __init__(self, query_class: str, substitutions: dict, end_cursor: str, pages: int):
+        """
+        Initializes a Checkpoint.
+        Args:
+            query_class: Name of the query class
+            substitutions: Substitutions of the run
+            end_cursor: End cursor of the last page the caller processed
+            pages: Number of pages emitted so far
+        """
+        self.query_class = query_class
+        self.substitutions = substitutions
+        self.end_cursor = end_cursor
+        self.pages = pages
+
+
+class CheckpointStore:
+    """
+    Directory of checkpoints, one JSON file per (endpoint, query class, substitutions) written atomically, so a crawl
+    killed midway or failing after its retries can continue from its last committed page.
+    """
+
+    def __init__(self, directory: str = ".github_query_checkpoints"):
+        """
+        Initializes the store.
+        Args:
+            directory: Directory of the checkpoint files, created if missing
+        """
+        self._directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def key(query, substitutions: dict, base_path: str = ""):
+        """
+        Returns the checkpoint key of a run.
+        Args:
+            query: Query of the run
+            substitutions: Substitutions of the run
+            base_path: GraphQL endpoint of the client, so that runs against different hosts never share a cursor
+        Returns:
+            Checkpoint key
+        """
+        identity = json.dumps([base_path, type(query).__name__, substitutions], sort_keys=True, default=str)
+        return hashlib.sha256(identity.encode()).hexdigest()
+
+    def _path(self, key: str):
+        return os.path.join(self._directory, f"{key}.json")
+
+    def load(self, key: str):
+        """
+        Loads a checkpoint.
+        Args:
+            key: Checkpoint key
+        Returns:
+            Checkpoint, or None if the run has none
+        """
+        try:
+            with open(self._path(key)) as file:
+                return Checkpoint(**json.load(file))
+        except FileNotFoundError:
+            return None
+
+    def save(self, key: str, checkpoint: Checkpoint):
+        """
+        Writes a checkpoint to a temporary file and renames it over the previous one, so a crash never
+        leaves a partial checkpoint behind.
+        Args:
+            key: Checkpoint key
+            checkpoint: Checkpoint to commit
+        """
+        temp_path = f"{self._path(key)}.tmp"
+        with open(temp_path, "w") as file:
+            json.dump(vars(checkpoint), file, default=str)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_path, self._path(key))
+
+    def delete(self, key: str):
+        """
+        Removes the checkpoint of a completed run.
+        Args:
+            key: Checkpoint key
+        """
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
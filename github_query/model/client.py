@@ -1,6 +1,9 @@
+import queue
 import re
+import threading
 import time
 from datetime import datetime
+from itertools import chain
 from random import randint
 from string import Template
 from typing import Union
@@ -10,7 +13,14 @@ from requests import Response
 from abc import ABC, abstractmethod
 
 from github_query.model.authentication import Authenticator
-from github_query.model.query import Query, PaginatedQuery
+from github_query.model.cache import ResponseCache, CacheMissError
+from github_query.model.checkpoint import CheckpointStore, Checkpoint
+from github_query.model.decode import StreamingDecoder, loads
+from github_query.model.entity_store import EntityStore
+from github_query.model.page_size import AdaptivePageSize
+from github_query.model.query import Query, PaginatedQuery, PaginationCursor
+from github_query.model.rate_limit import RateLimitBudget
+from github_query.model.session import create_session
 
 
 class InvalidAuthenticationError(Exception):
@@ -35,16 +45,36 @@ class QueryFailedException(Exception):
             )
 
 
+class PrefetchCancelled(Exception):
+    pass
+
+
 class Client(ABC):
     """
     GraphQL Client.
     """
 
+    # seconds closing a prefetching generator waits for its worker, which may be waiting for a rate limit reset
+    prefetch_join_timeout = 1.0
+
     def __init__(self,
                  host: str,
                  protocol: str = "https",
                  is_enterprise: bool = False,
-                 authenticator: Authenticator = None):
+                 authenticator: Authenticator = None,
+                 session: requests.Session = None,
+                 pool_connections: int = 10,
+                 pool_maxsize: int = 10,
+                 max_retries: int = 0,
+                 keep_alive: bool = True,
+                 budget: RateLimitBudget = None,
+                 use_variables: bool = False,
+                 prefetch_depth: int = 0,
+                 page_size: AdaptivePageSize = None,
+                 cache: ResponseCache = None,
+                 entity_store: EntityStore = None,
+                 checkpoints: CheckpointStore = None,
+                 stream_decode: bool = False):
         """
         Initializes the client.
         Args:
@@ -52,6 +82,22 @@ class Client(ABC):
             host: Host for the server
             is_enterprise: Is the host running on Enterprise Version?
             authenticator: Authenticator for the client
+            session: Session to send requests with, a pooled session is created if omitted
+            pool_connections: Number of per-host connection pools of the created session
+            pool_maxsize: Maximum number of connections kept alive per host
+            max_retries: Adapter level retries on connection errors and 5xx responses
+            keep_alive: Reuse connections between requests
+            budget: Rate limit budget, defaults to the budget of the authenticator's credentials
+            use_variables: Send queries declaring variables as constant documents with GraphQL variables
+            prefetch_depth: Number of pages of a PaginatedQuery fetched ahead of the caller in a background
+                thread, 0 fetches each page when the caller asks for it
+            page_size: Controller adjusting the page size of a PaginatedQuery between pages, the
+                substitutions' page size is used as is if omitted
+            cache: Response cache consulted before every request, e.g. a SQLiteResponseCache
+            entity_store: EntityStore normalizing the nodes of every response by their global id
+            checkpoints: Store committing the progress of every PaginatedQuery run, to continue with resume=True
+            stream_decode: Decode the pages of iter_nodes incrementally from the socket, yielding each node as
+                soon as it is received instead of decoding the whole page first
         """
         self._protocol = protocol
         self._host = host
@@ -63,11 +109,50 @@ class Client(ABC):
 
         self._authenticator = authenticator
 
+        self._owns_session = session is None
+        self._session = session if session is not None else create_session(
+            pool_connections=pool_connections, pool_maxsize=pool_maxsize,
+            max_retries=max_retries, keep_alive=keep_alive
+        )
+
+        self.budget = budget if budget is not None else self._authenticator.create_budget()
+        self._use_variables = use_variables
+        self._prefetch_depth = prefetch_depth
+        self._page_size = page_size
+        self.cache = cache
+        self.entity_store = entity_store
+        self.checkpoints = checkpoints
+        self._stream_decode = stream_decode
+        # round trip times of the page being fetched by the current thread, and whether its size can shrink
+        self._local = threading.local()
+
         self.rest = RESTClient(
             protocol=self._protocol, host=self._host, is_enterprise=self._is_enterprise,
-            authenticator=self._authenticator
+            authenticator=self._authenticator, session=self._session
         )
 
+    @property
+    def session(self):
+        """
+        Returns the HTTP session shared with the REST client.
+        Returns:
+            requests Session
+        """
+        return self._session
+
+    def close(self):
+        """
+        Closes the pooled connections if the session is owned by the client.
+        """
+        if self._owns_session:
+            self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
     @abstractmethod
     def base_path(self):
         """
@@ -93,101 +178,522 @@ class Client(ABC):
 
         return headers
 
-    def _retry_request(self, retry_attempts: int, timeout_seconds: int, query: Union[str, Query], substitutions: dict):
+    def _build_payload(self, query: Union[str, Query], substitutions: dict, cursor: PaginationCursor = None):
+        """
+        Builds the JSON payload of a request. Queries declaring variables are sent as a constant
+        document with the substitutions as variables when the client uses variables.
+        Args:
+            query: Query to run
+            substitutions: Substitutions to make
+            cursor: Pagination state when fetching a page of a PaginatedQuery
+        Returns:
+            Request payload
+        """
+        if self._use_variables and isinstance(query, Query) and query.variables is not None:
+            variables = (query.page_variables(cursor, **substitutions) if cursor is not None
+                         else query.variable_values(**substitutions))
+            return {'query': query.document(), 'variables': variables}
+        if isinstance(query, str):
+            return {'query': Template(query).substitute(**substitutions)}
+        if cursor is not None:
+            return {'query': query.substitute_page(cursor, **substitutions)}
+        return {'query': query.substitute(**substitutions)}
+
+    def _post(self, retry_attempts: int, timeout_seconds: int, payload: dict, stream: bool = False):
         """
         wrapper for retrying requests.
         Args:
             retry_attempts: retry attempts
             timeout_seconds: timeout seconds
-            query: Query to run
-            substitutions: Substitutions to make
+            payload: Request payload
+            stream: Leave the body on the socket to be read incrementally
         Returns:
             Response as a JSON
         """
+        payload = dict(payload, query=self._prepare_query(payload['query']))
         for _ in range(retry_attempts):
+            started = time.perf_counter()
             try:
-                response = requests.post(
+                response = self._session.post(
                     self.base_path(),
-                    json={
-                        'query': Template(query).substitute(**substitutions)
-                        if isinstance(query, str) else query.substitute(**substitutions)
-                    },
+                    json=payload,
                     headers=self._generate_headers(),
-                    timeout=timeout_seconds
+                    timeout=timeout_seconds,
+                    stream=stream
                 )
+                self._record_round_trip(time.perf_counter() - started)
+                self.budget.update_from_headers(response.headers)
                 # Process the response
                 if response.status_code == 200:
                     return response
+                if stream:
+                    response.close()
             except Timeout:
+                self._record_round_trip(time.perf_counter() - started)
                 print("Request timed out. Retrying...")
 
-    def _execute(self, query: Union[str, Query], substitutions: dict):
+    def _raise_if_cancelled(self):
+        """
+        Raises PrefetchCancelled when the consumer of the prefetching generator run by the current thread
+        has gone, e.g. while the request was waiting for the rate limit reset, so the request is not sent.
+        """
+        cancelled = getattr(self._local, "cancelled", None)
+        if cancelled is not None and cancelled.is_set():
+            raise PrefetchCancelled()
+
+    def _record_round_trip(self, seconds: float):
+        """
+        Adds the duration of an HTTP round trip to the page being fetched by the current thread, if any.
+        Args:
+            seconds: Duration of the round trip
+        """
+        round_trips = getattr(self._local, "round_trips", None)
+        if round_trips is not None:
+            round_trips.append(seconds)
+
+    def _retry_request(self, retry_attempts: int, timeout_seconds: int, query: Union[str, Query], substitutions: dict):
+        """
+        wrapper for retrying requests.
+        Args:
+            retry_attempts: retry attempts
+            timeout_seconds: timeout seconds
+            query: Query to run
+            substitutions: Substitutions to make
+        Returns:
+            Response as a JSON
+        """
+        return self._post(retry_attempts, timeout_seconds, self._build_payload(query, substitutions))
+
+    def _execute(self, query: Union[str, Query], substitutions: dict, cursor: PaginationCursor = None):
         """
         Executes a query after substituting values.
         Args:
             query: Query to run
             substitutions: Substitutions to make
+            cursor: Pagination state when fetching a page of a PaginatedQuery
 
         Returns:
             Response as a JSON
         """
-        query_string = Template(query).substitute(**substitutions) if isinstance(query, str) else query.substitute(**substitutions)
-        match = re.search(r'query\s*{(?P<content>.+)}', query_string)
-        self.handle_retry(match)
-
-        response = self._retry_request(3, 10, query, substitutions)
+        payload = self._build_payload(query, substitutions, cursor)
+        cache_key = None
+        if self.cache is not None:
+            cache_key = self.cache.key(self.base_path(), payload, self._authenticator.identity())
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return self._normalize(cached)
+            if self.cache.cache_only:
+                raise CacheMissError(f"No cached response for query = {payload['query']}")
+        match = re.search(r'query\s*{(?P<content>.+)}', payload['query'])
+        estimate = self._estimate(query, substitutions) if isinstance(query, Query) else None
+        self.handle_retry(match, estimate)
+        self.budget.acquire(self._predict_cost(estimate))
+        self._raise_if_cancelled()
+
+        response = self._post(3, 10, payload)
 
         try:
-            json_response = response.json()
+            json_response = loads(response.content)
 
-        except (RequestException, AttributeError):
+        except (RequestException, AttributeError, ValueError):
             raise QueryFailedException(query=query, response=response)
 
+        self._handle_response(json_response)
+
         if response.status_code == 200 and "errors" not in json_response:
-            return json_response["data"]
+            if cache_key is not None:
+                self.cache.set(cache_key, json_response["data"], self.cache.ttl(query))
+            return self._normalize(json_response["data"])
         else:
             raise QueryFailedException(query=query, response=response)
 
-    def execute(self, query: Union[str, Query, PaginatedQuery], substitutions: dict):
+    def _execute_stream(self, query: PaginatedQuery, substitutions: dict, cursor: PaginationCursor):
+        """
+        Fetches a page of a PaginatedQuery and decodes its body incrementally from the socket.
+        Args:
+            query: Query to run
+            substitutions: Substitutions to make
+            cursor: Pagination state of the execution
+
+        Returns:
+            Generator of the nodes of the page, returning the data of the page without its nodes
+        """
+        payload = self._build_payload(query, substitutions, cursor)
+        match = re.search(r'query\s*{(?P<content>.+)}', payload['query'])
+        estimate = self._estimate(query, substitutions)
+        self.handle_retry(match, estimate)
+        self.budget.acquire(self._predict_cost(estimate))
+
+        response = self._post(3, 10, payload, stream=True)
+        if response is None:
+            raise QueryFailedException(query=query, response=None)
+
+        path = ["data"] + [Template(field_name).substitute(**substitutions) for field_name in query.path]
+        decoder = StreamingDecoder(path)
+        try:
+            chunks = chain(((chunk, False) for chunk in response.iter_content(chunk_size=65536)), [(b"", True)])
+            for chunk, final in chunks:
+                for node in decoder.feed(chunk, final):
+                    if "errors" in decoder.result:
+                        raise QueryFailedException(query=query, response=None)
+                    yield self._normalize(node)
+        except (RequestException, ValueError):
+            raise QueryFailedException(query=query, response=None)
+        finally:
+            response.close()
+
+        json_response = decoder.result
+        self._handle_response(json_response)
+        if "errors" in json_response or "data" not in json_response:
+            # the body was consumed from the socket, so the exception can't quote the response
+            raise QueryFailedException(query=query, response=None)
+        return json_response["data"]
+
+    def _normalize(self, data: dict):
+        """
+        Feeds the nodes of a response into the entity store.
+        Args:
+            data: Data of the response
+        Returns:
+            Data referencing the stored nodes
+        """
+        if self.entity_store is None:
+            return data
+        return self.entity_store.ingest(data)
+
+    def _execute_page(self, query: PaginatedQuery, substitutions: dict, cursor: PaginationCursor):
+        """
+        Fetches a page of a PaginatedQuery, letting the page size controller pick its size. The controller is
+        fed the time spent in HTTP round trips only, not the rate limit waits, and nothing for cached pages.
+        Args:
+            query: Query to run
+            substitutions: Substitutions to make
+            cursor: Pagination state of the execution
+
+        Returns:
+            Response as a JSON
+        """
+        if self._page_size is None:
+            return self._execute(query, substitutions, cursor)
+        while True:
+            size = self._page_size.size(query, substitutions)
+            page_substitutions = dict(substitutions, **{self._page_size.key: size})
+            round_trips = self._local.round_trips = []
+            self._local.shrinkable = self._page_size.can_shrink(query)
+            try:
+                response = self._execute(query, page_substitutions, cursor)
+            except Exception as error:
+                if self._is_overload(error) and self._page_size.shrink(query):
+                    continue
+                raise
+            finally:
+                self._local.round_trips = None
+                self._local.shrinkable = False
+            if round_trips:
+                self._page_size.record(query, size, sum(round_trips),
+                                       self._estimate(query, page_substitutions), self._target_cost())
+            return response
+
+    def _is_overload(self, error: Exception):
+        """
+        Checks whether a failed page may succeed with a smaller page size.
+        Args:
+            error: Error raised by the page
+        Returns:
+            True for timeouts and non-200 responses
+        """
+        return isinstance(error, QueryFailedException) and error.response is None
+
+    def _target_cost(self):
+        """
+        Returns the cost per request the page size controller aims for when it has no target of its own.
+        Returns:
+            Target cost in the unit of _estimate, or None to size pages by latency only
+        """
+        return None
+
+    def execute(self, query: Union[str, Query, PaginatedQuery], substitutions: dict,
+                cursor: PaginationCursor = None, resume: bool = False):
         """
         Executes a query after substituting values. The query could be a Query or a PaginatedQuery.
         Args:
             query: Query to run
             substitutions: Substitutions to make
+            cursor: Pagination state a PaginatedQuery starts from, e.g. PaginationCursor(end_cursor) to
+                continue after a known page, the first page if omitted
+            resume: Continue a PaginatedQuery from the last page committed to the client's checkpoints
 
         Returns:
             Response as a JSON
         """
         if isinstance(query, PaginatedQuery):
-            return self._execution_generator(query, substitutions)
+            cursor, pages = self._resume_point(query, substitutions, cursor, resume)
+            if self._prefetch_depth > 0:
+                generator = self._prefetching_generator(query, substitutions, cursor)
+            else:
+                generator = self._execution_generator(query, substitutions, cursor)
+            if self.checkpoints is not None:
+                return self._checkpointed_generator(generator, query, substitutions, pages)
+            return generator
 
         return self._execute(query, substitutions)
 
+    def _resume_point(self, query: PaginatedQuery, substitutions: dict, cursor: PaginationCursor, resume: bool):
+        """
+        Returns where a PaginatedQuery run starts, after its last committed page when resumed.
+        Args:
+            query: Query to run
+            substitutions: Substitutions to make
+            cursor: Pagination state requested by the caller
+            resume: Continue from the last page committed to the client's checkpoints
+        Returns:
+            Pagination state to start from and number of pages already emitted
+        """
+        if resume and self.checkpoints is None:
+            raise ValueError("resume requires a client created with checkpoints")
+        if resume:
+            checkpoint = self.checkpoints.load(self.checkpoints.key(query, substitutions, self.base_path()))
+            if checkpoint is not None:
+                return PaginationCursor(end_cursor=checkpoint.end_cursor), checkpoint.pages
+        return cursor, 0
+
+    def iter_nodes(self, query: PaginatedQuery, substitutions: dict, fields: list = None, **kwargs):
+        """
+        Executes a PaginatedQuery and yields the nodes of its paginated connection one by one.
+        A page is released as soon as its last node is consumed, so memory stays at about one page.
+        Args:
+            query: Query to run
+            substitutions: Substitutions to make
+            fields: Dotted paths of the fields to keep, e.g. ["name", "languages.totalSize"], every field if omitted
+            **kwargs: Keyword arguments of execute, e.g. cursor or resume. Only cursor applies when the
+                client decodes streams, pages are then neither cached, prefetched nor checkpointed
+
+        Returns:
+            Generator of nodes
+        """
+        projection = Client._projection(fields)
+        if self._stream_decode:
+            yield from self._streamed_nodes(query, substitutions, projection, kwargs.get("cursor"))
+            return
+        for page in self.execute(query, substitutions, **kwargs):
+            nodes = query.nodes(page, substitutions)
+            page = None
+            # pop from the end so every consumed node is dropped from the page, from a copy when the list
+            # belongs to a stored entity
+            if self.entity_store is not None:
+                nodes = list(nodes)
+            nodes.reverse()
+            while nodes:
+                yield Client._project(self._detach(nodes.pop()), projection)
+
+    def _streamed_nodes(self, query: PaginatedQuery, substitutions: dict, projection: dict,
+                        cursor: PaginationCursor = None):
+        """
+        Yields the nodes of every page as they are decoded from the socket, following the pageInfo
+        read at the end of each page.
+        Args:
+            query: Query to run
+            substitutions: Substitutions to make
+            projection: Tree built by _projection
+            cursor: Pagination state to start from
+
+        Returns:
+            Generator of nodes
+        """
+        cursor = cursor or PaginationCursor()
+        while cursor.has_next():
+            page = self._execute_stream(query, substitutions, cursor)
+            while True:
+                try:
+                    node = next(page)
+                except StopIteration as stop:
+                    data = stop.value
+                    break
+                yield Client._project(self._detach(node), projection)
+            page_info = query.page_info(data, substitutions)
+            cursor.update(page_info["hasNextPage"], page_info["endCursor"])
+
+    @staticmethod
+    def _projection(fields: list):
+        """
+        Builds the tree of a field projection.
+        Args:
+            fields: Dotted paths of the fields to keep
+        Returns:
+            Nested dict of field names, or None to keep every field
+        """
+        if fields is None:
+            return None
+        projection = {}
+        for field in fields:
+            level = projection
+            for name in field.split("."):
+                level = level.setdefault(name, {})
+        return projection
+
+    def _detach(self, node):
+        """
+        Returns a node the caller can change without changing the entity store, a deep copy when the client
+        normalizes responses into one.
+        Args:
+            node: Node as a JSON
+        Returns:
+            Node as a JSON
+        """
+        if self.entity_store is None:
+            return node
+        return self.entity_store.copy(node)
+
+    @staticmethod
+    def _project(node, projection: dict):
+        """
+        Keeps the projected fields of a node, applying the projection to every item of a list.
+        Args:
+            node: Node as a JSON
+            projection: Tree built by _projection
+        Returns:
+            Projected node
+        """
+        if not projection:
+            return node
+        if isinstance(node, list):
+            return [Client._project(item, projection) for item in node]
+        if not isinstance(node, dict):
+            return node
+        return {name: Client._project(node[name], children) for name, children in projection.items() if name in node}
+
     @abstractmethod
-    def handle_retry(self, match):
+    def handle_retry(self, match, estimate=None):
         return
 
-    def _execution_generator(self, query, substitutions: dict):
+    def _estimate(self, query: Query, substitutions: dict):
+        """
+        Statically estimates the cost of a query, see github_query/queries/utils/cost_estimate.py.
+        Args:
+            query: Query to estimate
+            substitutions: Substitutions to make
+        Returns:
+            Estimate, or None if the client has no estimator
+        """
+        return None
+
+    def _predict_cost(self, estimate):
+        """
+        Predicts the rate limit cost of a query.
+        Args:
+            estimate: Static estimate of the query
+        Returns:
+            Predicted cost in rate limit points
+        """
+        return 1
+
+    def _prepare_query(self, query_string: str):
+        """
+        Amends a rendered query right before it is sent.
+        Args:
+            query_string: Rendered query
+        Returns:
+            Query to send
+        """
+        return query_string
+
+    def _handle_response(self, json_response: dict):
+        """
+        Inspects a JSON response before its data is returned.
+        Args:
+            json_response: Decoded response
+        """
+        return
+
+    def _execution_generator(self, query, substitutions: dict, cursor: PaginationCursor = None):
         """
         Executes a PaginatedQuery after substituting values.
         Args:
             query: Query to run
             substitutions: Substitutions to make
+            cursor: Pagination state to start from
 
         Returns:
             Response as a JSON
         """
-        while query.paginator.has_next():
-            response = self._execute(query, substitutions)
-            curr_node = response
+        cursor = cursor or PaginationCursor()
+        while cursor.has_next():
+            response = self._execute_page(query, substitutions, cursor)
+            page_info = query.page_info(response, substitutions)
+            cursor.update(page_info["hasNextPage"], page_info["endCursor"])
+            yield response
 
-            for field_name in query.path:
-                curr_node = curr_node[Template(field_name).substitute(**substitutions)]
+    def _prefetching_generator(self, query, substitutions: dict, cursor: PaginationCursor = None):
+        """
+        Executes a PaginatedQuery after substituting values, fetching up to prefetch_depth pages ahead
+        of the caller. The fetch of page N+1 starts as soon as the endCursor of page N is parsed.
+        Args:
+            query: Query to run
+            substitutions: Substitutions to make
+            cursor: Pagination state to start from
 
-            end_cursor = curr_node["pageInfo"]["endCursor"]
-            has_next_page = curr_node["pageInfo"]["hasNextPage"]
-            query.paginator.update_paginator(has_next_page, end_cursor)
+        Returns:
+            Response as a JSON
+        """
+        pages = queue.Queue()
+        slots = threading.Semaphore(self._prefetch_depth)
+        stopped = threading.Event()
+
+        cursor = cursor or PaginationCursor()
+
+        def fetch():
+            self._local.cancelled = stopped
+            try:
+                while cursor.has_next():
+                    while not slots.acquire(timeout=0.1):
+                        if stopped.is_set():
+                            return
+                    if stopped.is_set():
+                        return
+                    response = self._execute_page(query, substitutions, cursor)
+                    page_info = query.page_info(response, substitutions)
+                    cursor.update(page_info["hasNextPage"], page_info["endCursor"])
+                    pages.put((response, None))
+            except Exception as error:
+                pages.put((None, error))
+                return
+            pages.put((None, None))
+
+        worker = threading.Thread(target=fetch, daemon=True)
+        worker.start()
+        try:
+            while True:
+                response, error = pages.get()
+                slots.release()
+                if error is not None:
+                    raise error
+                if response is None:
+                    return
+                yield response
+        finally:
+            stopped.set()
+            # a worker sleeping until the rate limit reset notices stopped when it wakes up, without sending
+            worker.join(self.prefetch_join_timeout)
+
+    def _checkpointed_generator(self, pages, query: PaginatedQuery, substitutions: dict, emitted: int):
+        """
+        Commits a checkpoint after the caller processed each page, and deletes it once the run completes.
+        Args:
+            pages: Generator of the pages
+            query: Query to run
+            substitutions: Substitutions to make
+            emitted: Number of pages emitted by earlier runs
+
+        Returns:
+            Response as a JSON
+        """
+        key = self.checkpoints.key(query, substitutions, self.base_path())
+        for response in pages:
             yield response
+            emitted += 1
+            end_cursor = query.page_info(response, substitutions)["endCursor"]
+            self.checkpoints.save(key, Checkpoint(type(query).__name__, substitutions, end_cursor, emitted))
+        self.checkpoints.delete(key)
 
 class RESTClient:
     """
@@ -198,7 +704,8 @@ class RESTClient:
                  protocol: str = "https",
                  host: str = "api.github.com",
                  is_enterprise: bool = False,
-                 authenticator: Authenticator = None):
+                 authenticator: Authenticator = None,
+                 session: requests.Session = None):
         """
         Initializes the client.
         Args:
@@ -206,6 +713,7 @@ class RESTClient:
             host: Host for the server
             is_enterprise: Is the host running on Enterprise Version?
             authenticator: Authenticator for the client
+            session: Session to send requests with, a pooled session is created if omitted
         """
         self._protocol = protocol
         self._host = host
@@ -217,6 +725,22 @@ class RESTClient:
 
         self._authenticator = authenticator
 
+        self._owns_session = session is None
+        self._session = session if session is not None else create_session()
+
+    def close(self):
+        """
+        Closes the pooled connections if the session is owned by the client.
+        """
+        if self._owns_session:
+            self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
     def _base_path(self):
         """
         Returns base path for a GraphQL Request.
@@ -267,7 +791,7 @@ class RESTClient:
             i += 1
 
             try:
-                response = requests.get(
+                response = self._session.get(
                     f"{self._base_path()}{path}", **kwargs
                 )
 
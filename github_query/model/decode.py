@@ -0,0 +1,147 @@
+import codecs
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# name of the backend decoding whole response bodies, orjson when it is installed
+BACKEND = "orjson" if orjson is not None else "json"
+
+_WHITESPACE = " \t\n\r"
+
+
+def loads(body):
+    """
+    Decodes a whole response body with the fastest installed backend.
+    Args:
+        body: Response body as bytes or str
+    Returns:
+        Decoded JSON
+    """
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
+
+
+class StreamingDecoder:
+    """
+    Incremental decoder of a GraphQL response yielding the nodes of the paginated connection while the
+    body is still arriving.
+
+    Only the objects along the path to the connection are walked in Python. Every other value, including
+    each node, is decoded as a whole by json's raw_decode, so the decoder never builds the tree of a full
+    page: the nodes list of the result stays empty and the rest of the envelope, pageInfo included, is kept.
+    """
+
+    def __init__(self, path: list):
+        """
+        Initializes the decoder.
+        Args:
+            path: Keys from the root of the body to the connection, e.g. ["data", "user", "repositories"]
+        """
+        self._path = list(path)
+        self._json = json.JSONDecoder()
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._pos = 0
+        self.result = {}
+        # frames are [container, depth on the path, state, current key]
+        self._stack = [[self.result, 0, "open", None]]
+
+    def feed(self, chunk: bytes, final: bool = False):
+        """
+        Feeds a chunk of the body.
+        Args:
+            chunk: Bytes received
+            final: Whether the chunk is the last one
+        Returns:
+            Generator of the nodes completed by the chunk
+        """
+        if self._pos > 65536:
+            self._buffer, self._pos = self._buffer[self._pos:], 0
+        self._buffer += self._text.decode(chunk, final)
+        yield from self._parse(final)
+        if final and self._stack:
+            raise ValueError("Truncated JSON response")
+
+    def _skip_whitespace(self):
+        while self._pos < len(self._buffer) and self._buffer[self._pos] in _WHITESPACE:
+            self._pos += 1
+        return self._pos < len(self._buffer)
+
+    def _value(self, final: bool):
+        """
+        Decodes the complete value at the current position.
+        Returns:
+            Tuple of whether a value was decoded and the value
+        """
+        try:
+            value, end = self._json.raw_decode(self._buffer, self._pos)
+        except json.JSONDecodeError:
+            if final:
+                raise
+            return False, None
+        # a number touching the end of the buffer may still be missing digits
+        if end == len(self._buffer) and not final:
+            return False, None
+        self._pos = end
+        return True, value
+
+    def _parse(self, final: bool):
+        while self._stack and self._skip_whitespace():
+            frame = self._stack[-1]
+            container, depth, state, key = frame
+            char = self._buffer[self._pos]
+
+            if isinstance(container, list):
+                if state == "open":
+                    self._pos += 1
+                    frame[2] = "item"
+                elif char == "]":
+                    self._pos += 1
+                    self._stack.pop()
+                elif char == "," and state == "next":
+                    self._pos += 1
+                    frame[2] = "item"
+                else:
+                    complete, node = self._value(final)
+                    if not complete:
+                        return
+                    frame[2] = "next"
+                    yield node
+                continue
+
+            if state == "open":
+                self._pos += 1
+                frame[2] = "key"
+            elif char == "}":
+                self._pos += 1
+                self._stack.pop()
+            elif state == "next" and char == ",":
+                self._pos += 1
+                frame[2] = "key"
+            elif state == "key":
+                complete, frame[3] = self._value(final)
+                if not complete:
+                    return
+                frame[2] = "colon"
+            elif state == "colon" and char == ":":
+                self._pos += 1
+                frame[2] = "value"
+            elif state == "value":
+                frame[2] = "next"
+                if depth < len(self._path) and key == self._path[depth] and char == "{":
+                    container[key] = {}
+                    self._stack.append([container[key], depth + 1, "open", None])
+                elif depth == len(self._path) and key in ("nodes", "edges") and char == "[":
+                    container[key] = []
+                    self._stack.append([container[key], depth, "open", None])
+                else:
+                    complete, container[key] = self._value(final)
+                    if not complete:
+                        frame[2] = "value"
+                        return
+            else:
+                raise ValueError(f"Unexpected {char!r} at position {self._pos} of the JSON response")
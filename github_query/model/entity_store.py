@@ -0,0 +1,128 @@
+import copy
+import threading
+from typing import Iterable
+
+from github_query.model.query import PaginatedQuery
+
+
+class EntityStore:
+    """
+    Normalized store of the nodes returned by GraphQL responses, indexed by their global id.
+
+    Node ids are global on both GitHub and GitLab, e.g. gid://gitlab/Project/278964, so a node returned
+    under starredProjects for one user and under projectMemberships for another is stored once. Ingested
+    responses reference the stored node instead of their own copy, and responses selecting only ids can be
+    hydrated from the store.
+    """
+
+    def __init__(self):
+        """
+        Initializes an empty store.
+        """
+        self._lock = threading.RLock()
+        self._entities = {}
+
+    def __len__(self):
+        return len(self._entities)
+
+    def __contains__(self, node_id: str):
+        return node_id in self._entities
+
+    def get(self, node_id: str):
+        """
+        Returns a stored node.
+        Args:
+            node_id: Global id of the node
+        Returns:
+            Node as a JSON, or None
+        """
+        return self._entities.get(node_id)
+
+    def missing(self, node_ids: Iterable[str]):
+        """
+        Returns the ids the store has no node for, in order and without duplicates.
+        Args:
+            node_ids: Global ids
+        Returns:
+            List of missing ids
+        """
+        return [node_id for node_id in dict.fromkeys(node_ids) if node_id not in self._entities]
+
+    def ingest(self, data):
+        """
+        Indexes every node with an id in a response and replaces it by the stored node, which accumulates
+        the fields selected by every response.
+        Args:
+            data: Response as a JSON
+        Returns:
+            Normalized response
+        """
+        with self._lock:
+            return self._normalize(data)
+
+    def _normalize(self, data):
+        if isinstance(data, list):
+            return [self._normalize(item) for item in data]
+        if not isinstance(data, dict):
+            return data
+        normalized = {key: self._normalize(value) for key, value in data.items()}
+        node_id = normalized.get("id")
+        if not isinstance(node_id, str):
+            return normalized
+        entity = self._entities.setdefault(node_id, {})
+        entity.update(normalized)
+        return entity
+
+    def copy(self, data):
+        """
+        Returns a deep copy of data referencing stored nodes, which the caller can change without changing
+        the store.
+        Args:
+            data: Normalized response or node
+        Returns:
+            Copied data
+        """
+        with self._lock:
+            return copy.deepcopy(data)
+
+    def hydrate(self, data):
+        """
+        Fills the nodes of a response with the fields stored for their id, without changing the store. The
+        stored fields are copied, so the hydrated response shares nothing with the store.
+        Args:
+            data: Response as a JSON, e.g. of a query selecting only ids
+        Returns:
+            Hydrated response
+        """
+        with self._lock:
+            return self._hydrate(data)
+
+    def _hydrate(self, data):
+        if isinstance(data, list):
+            return [self._hydrate(item) for item in data]
+        if not isinstance(data, dict):
+            return data
+        hydrated = {key: self._hydrate(value) for key, value in data.items()}
+        stored = self._entities.get(hydrated.get("id"), {}) if isinstance(hydrated.get("id"), str) else {}
+        return dict(copy.deepcopy(stored), **hydrated)
+
+    def fetch_missing(self, client, query: PaginatedQuery, node_ids: Iterable[str],
+                      substitutions: dict = None, ids_key: str = "ids", batch_size: int = 50):
+        """
+        Fetches the nodes the store lacks with a query taking a list of ids, e.g. ProjectsByIds.
+        Args:
+            client: Client to execute the query
+            query: PaginatedQuery selecting nodes by the ids substitution
+            node_ids: Global ids that are needed
+            substitutions: Other substitutions of the query
+            ids_key: Substitution holding the ids
+            batch_size: Number of ids per query
+        Returns:
+            Number of ids fetched
+        """
+        missing = self.missing(node_ids)
+        for start in range(0, len(missing), batch_size):
+            batch_substitutions = dict(substitutions or {}, **{ids_key: missing[start:start + batch_size]})
+            for page in client.execute(query=query, substitutions=batch_substitutions):
+                self.ingest(page)
+        return len(missing)
@@ -0,0 +1,255 @@
+import json
+import sqlite3
+import threading
+from datetime import datetime
+
+from github_query.model.client import Client
+from github_query.model.partition import TimeWindowFilter, TIME_FORMAT
+from github_query.model.query import PaginatedQuery, PaginationCursor, QueryNodePaginator
+
+
+class SyncStore:
+    """
+    SQLite store of the watermark, end cursor and merged nodes of every (endpoint, user, query class).
+    """
+
+    def __init__(self, path: str = "github_query_sync.sqlite"):
+        """
+        Initializes the store.
+        Args:
+            path: SQLite database file, ":memory:" keeps the store in memory
+        """
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS sync_state "
+            "(key TEXT PRIMARY KEY, watermark TEXT, end_cursor TEXT, nodes TEXT NOT NULL)"
+        )
+        self._connection.commit()
+
+    def load(self, key: str):
+        """
+        Loads the state of a key.
+        Args:
+            key: Sync key
+        Returns:
+            Tuple of watermark, end cursor and nodes, all None before the first sync
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT watermark, end_cursor, nodes FROM sync_state WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None, None, None
+        return row[0], row[1], json.loads(row[2])
+
+    def save(self, key: str, watermark: str, end_cursor: str, nodes: list):
+        """
+        Saves the state of a key in one transaction.
+        Args:
+            key: Sync key
+            watermark: Newest createdAt/updatedAt seen
+            end_cursor: Last end cursor of the connection
+            nodes: Merged nodes
+        """
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO sync_state (key, watermark, end_cursor, nodes) VALUES (?, ?, ?, ?)",
+                (key, watermark, end_cursor, json.dumps(nodes))
+            )
+            self._connection.commit()
+
+    def close(self):
+        """
+        Closes the database connection.
+        """
+        with self._lock:
+            self._connection.close()
+
+
+class SyncStrategy:
+    """
+    How the items newer than a watermark are fetched from a connection.
+    """
+
+    def __init__(self, field: str = "createdAt"):
+        """
+        Initializes the strategy.
+        Args:
+            field: Timestamp field of the nodes the watermark follows
+        """
+        self.field = field
+
+    def prepare(self, query: PaginatedQuery):
+        """
+        Returns the query to run for incremental syncs.
+        Args:
+            query: Query to sync
+        Returns:
+            PaginatedQuery
+        """
+        return query
+
+    def start(self, watermark: str, end_cursor: str):
+        """
+        Returns the substitutions and the cursor an incremental sync starts from.
+        Args:
+            watermark: Stored watermark
+            end_cursor: Stored end cursor
+        Returns:
+            Tuple of extra substitutions and PaginationCursor
+        """
+        return {}, PaginationCursor()
+
+    def is_past(self, node: dict, watermark: str):
+        """
+        Checks whether a node is not newer than the watermark, ending the sync of a newest first connection.
+        Args:
+            node: Node of the connection
+            watermark: Stored watermark
+        Returns:
+            Boolean
+        """
+        return False
+
+    def merge(self, stored: list, fetched: list):
+        """
+        Merges the fetched nodes into the stored ones. Nodes with an id replace their stored version.
+        Args:
+            stored: Stored nodes
+            fetched: Fetched nodes
+        Returns:
+            Merged nodes
+        """
+        fetched_ids = {node.get("id") for node in fetched if isinstance(node, dict) and node.get("id")}
+        kept = [node for node in stored if not (isinstance(node, dict) and node.get("id") in fetched_ids)]
+        return kept + fetched
+
+
+class ResumeCursor(SyncStrategy):
+    """
+    Continues after the stored end cursor, for connections returning the oldest items first such as
+    the GitHub issues and pullRequests of a user.
+    """
+
+    def start(self, watermark: str, end_cursor: str):
+        return {}, PaginationCursor(end_cursor=end_cursor)
+
+
+class NewestFirst(SyncStrategy):
+    """
+    Paginates from the first page and stops at the first node older than the watermark, for connections
+    returning the newest items first such as GitLab merge requests. Timestamps have second precision, so
+    the nodes of the watermark's second are fetched again, which keeps new nodes created in that second,
+    and replace the stored ones.
+    """
+
+    def is_past(self, node: dict, watermark: str):
+        return watermark is not None and node.get(self.field) is not None and node[self.field] < watermark
+
+    def merge(self, stored: list, fetched: list):
+        stamps = [node[self.field] for node in fetched if isinstance(node, dict) and node.get(self.field)]
+        if stamps:
+            # every stored node from the oldest fetched second on was fetched again, with or without an id
+            oldest = min(stamps)
+            stored = [node for node in stored
+                      if not (isinstance(node, dict) and node.get(self.field) and node[self.field] >= oldest)]
+        merged = super().merge(stored, fetched)
+        return fetched + merged[:len(merged) - len(fetched)]
+
+
+class SinceFilter(TimeWindowFilter, SyncStrategy):
+    """
+    Filters the connection on the server with an argument such as updatedAfter or createdAfter, for
+    GitLab connections like issues(authorUsername:) that accept one.
+    """
+
+    def __init__(self, arg: str = "updatedAfter", field: str = "updatedAt"):
+        """
+        Initializes the strategy.
+        Args:
+            arg: Argument of the lower bound
+            field: Timestamp field of the nodes the watermark follows
+        """
+        SyncStrategy.__init__(self, field)
+        self._arg = arg
+
+    def prepare(self, query: PaginatedQuery):
+        return self.apply(query)
+
+    def _restrict(self, query: PaginatedQuery, paginator: QueryNodePaginator):
+        paginator.args = dict(paginator.args or {}, **{self._arg: "$since"})
+        if query.variables is not None:
+            query.variables = dict(query.variables, since="Time")
+
+    def substitutions(self, start: datetime, end: datetime = None):
+        return {"since": start.strftime(TIME_FORMAT)}
+
+    def start(self, watermark: str, end_cursor: str):
+        since = datetime.strptime(watermark, TIME_FORMAT) if watermark else datetime(1970, 1, 1)
+        return self.substitutions(since), PaginationCursor()
+
+
+class IncrementalSync:
+    """
+    Fetches only the items of a connection that are newer than the last run.
+
+    The watermark of every (endpoint, user, query class), the newest createdAt or updatedAt seen plus the end
+    cursor, is kept in a SyncStore with the merged nodes, so a nightly refresh fetches a page or two per
+    user instead of the whole history.
+    """
+
+    def __init__(self, client: Client, store: SyncStore, user_key: str = "user"):
+        """
+        Initializes the sync.
+        Args:
+            client: Client to execute the queries
+            store: Store of the watermarks and nodes
+            user_key: Substitution holding the user
+        """
+        self._client = client
+        self._store = store
+        self._user_key = user_key
+
+    def key(self, query: PaginatedQuery, substitutions: dict):
+        """
+        Returns the sync key of a query.
+        Args:
+            query: Query to sync
+            substitutions: Substitutions of the query
+        Returns:
+            Key made of the client endpoint, the user and the query class
+        """
+        return f"{self._client.base_path()}|{substitutions.get(self._user_key)}|{type(query).__name__}"
+
+    def sync(self, query: PaginatedQuery, substitutions: dict, strategy: SyncStrategy):
+        """
+        Fetches the items newer than the stored watermark and merges them into the stored nodes.
+        Args:
+            query: Query to sync
+            substitutions: Substitutions of the query
+            strategy: How newer items are fetched
+        Returns:
+            Tuple of the merged nodes and the number of nodes fetched
+        """
+        key = self.key(query, substitutions)
+        watermark, end_cursor, stored = self._store.load(key)
+        run_query = strategy.prepare(query)
+        extra, cursor = strategy.start(watermark, end_cursor)
+        run_substitutions = dict(substitutions, **extra)
+
+        fetched = []
+        for page in self._client.execute(query=run_query, substitutions=run_substitutions, cursor=cursor):
+            nodes = run_query.nodes(page, run_substitutions)
+            newer = [node for node in nodes if not strategy.is_past(node, watermark)]
+            fetched.extend(newer)
+            page_cursor = run_query.page_info(page, run_substitutions)["endCursor"]
+            end_cursor = page_cursor or end_cursor
+            if len(newer) < len(nodes):
+                break
+
+        nodes = fetched if stored is None else strategy.merge(stored, fetched)
+        stamps = [node[strategy.field] for node in fetched if isinstance(node, dict) and node.get(strategy.field)]
+        watermark = max(stamps + ([watermark] if watermark else [])) if stamps or watermark else None
+        self._store.save(key, watermark, end_cursor, nodes)
+        return nodes, len(fetched)
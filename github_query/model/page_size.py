@@ -0,0 +1,131 @@
+import json
+import os
+import threading
+
+
+class AdaptivePageSize:
+    """
+    Picks the page size of paginated queries from the cost and latency of the pages already fetched.
+
+    The size grows while pages come back well within the target cost and latency, shrinks when a page is
+    too slow or too expensive, and is halved when a page fails with a complexity error or a timeout.
+    The best size of each query class can be persisted to a JSON file and is reused by later runs.
+    """
+
+    def __init__(self, key: str = "pg_size", min_size: int = 1, max_size: int = 100, target_cost: float = None,
+                 target_latency: float = 2.0, path: str = None):
+        """
+        Initializes the page size controller.
+        Args:
+            key: Substitution holding the page size, the first: argument of the paginators
+            min_size: Smallest page size
+            max_size: Largest page size, 100 on both GitHub and GitLab
+            target_cost: Target estimated cost per request, defaults to the client's complexity_limit on
+                GitLab. GitHub pages are sized by latency only, the points of a crawl barely depend on the page size
+            target_latency: Target seconds per request
+            path: JSON file remembering the best size per query class between runs
+        """
+        self.key = key
+        self.min_size = min_size
+        self.max_size = max_size
+        self.target_cost = target_cost
+        self.target_latency = target_latency
+        self._path = path
+        self._lock = threading.Lock()
+        self._sizes = {}
+        self._best = {}
+        if path is not None and os.path.exists(path):
+            with open(path) as file:
+                self._best = json.load(file)
+
+    @staticmethod
+    def _name(query):
+        return type(query).__name__
+
+    def _clamp(self, size: float):
+        return max(self.min_size, min(self.max_size, int(size)))
+
+    def size(self, query, substitutions: dict):
+        """
+        Returns the page size of the next page of a query.
+        Args:
+            query: Query to run
+            substitutions: Substitutions of the caller, their page size is the starting point
+        Returns:
+            Page size
+        """
+        name = self._name(query)
+        with self._lock:
+            if name not in self._sizes:
+                self._sizes[name] = self._clamp(self._best.get(name, substitutions.get(self.key, self.max_size)))
+            return self._sizes[name]
+
+    def record(self, query, size: int, latency: float, cost: float = None, target_cost: float = None):
+        """
+        Adjusts the page size of a query after a page was fetched.
+        Args:
+            query: Query that ran
+            size: Page size of the request
+            latency: Seconds the request took
+            cost: Estimated cost of the request, None if the client has no estimator
+            target_cost: Target cost used when the controller has none
+        """
+        target_cost = self.target_cost if self.target_cost is not None else target_cost
+        factors = [self.target_latency / latency if latency > 0 else 2]
+        if cost and target_cost:
+            factors.append(target_cost / cost)
+        factor = min(factors)
+        name = self._name(query)
+        with self._lock:
+            if factor >= 1:
+                self._remember(name, size)
+            if factor < 1:
+                self._sizes[name] = self._clamp(size * max(factor, 0.5))
+            elif factor >= 1.25:
+                self._sizes[name] = self._clamp(size * min(factor, 2))
+
+    def can_shrink(self, query):
+        """
+        Checks whether shrink would lower the page size of a query.
+        Args:
+            query: Query to run
+        Returns:
+            False if the page size is already the smallest
+        """
+        with self._lock:
+            return self._sizes.get(self._name(query), self.max_size) > self.min_size
+
+    def shrink(self, query):
+        """
+        Halves the page size of a query after a complexity error or a timeout.
+        Args:
+            query: Query that failed
+        Returns:
+            False if the page size is already the smallest
+        """
+        name = self._name(query)
+        with self._lock:
+            size = self._sizes.get(name, self.max_size)
+            if size <= self.min_size:
+                return False
+            self._sizes[name] = self._clamp(size // 2)
+            if self._best.get(name, 0) > self._sizes[name]:
+                self._remember(name, self._sizes[name])
+            return True
+
+    def _remember(self, name: str, size: int):
+        """
+        Stores the best size of a query class, writing the JSON file when it changed.
+        Args:
+            name: Query class name
+            size: Page size that met the targets
+        """
+        if self._best.get(name) == size:
+            return
+        self._best[name] = size
+        if self._path is None:
+            return
+        temp_path = f"{self._path}.tmp"
+        with open(temp_path, "w") as file:
+            json.dump(self._best, file)
+        os.replace(temp_path, self._path)
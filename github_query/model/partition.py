@@ -0,0 +1,226 @@
+import copy
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from datetime import datetime, timedelta
+from typing import Union
+
+from github_query.model.client import Client
+from github_query.model.query import PaginatedQuery, QueryNodePaginator
+
+TIME_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+
+class TimeWindowFilter:
+    """
+    Restricts a PaginatedQuery to the nodes created within a time window with server-side filters.
+    """
+
+    def apply(self, query: PaginatedQuery):
+        """
+        Returns a copy of the query whose paginator is restricted to the window substitutions.
+        Args:
+            query: Query to restrict
+        Returns:
+            Windowed PaginatedQuery
+        """
+        windowed = copy.deepcopy(query)
+        windowed._template = windowed._template_key = windowed._document = windowed._page_template = None
+        windowed.path, windowed.paginator = PaginatedQuery.extract_path_to_pageinfo_node(windowed)
+        self._restrict(windowed, windowed.paginator)
+        return windowed
+
+    def _restrict(self, query: PaginatedQuery, paginator: QueryNodePaginator):
+        """
+        Adds the window filter to the paginator of a copied query.
+        Args:
+            query: Copied query
+            paginator: Paginator of the copied query
+        """
+        raise NotImplementedError
+
+    def substitutions(self, start: datetime, end: datetime):
+        """
+        Returns the substitutions selecting a window.
+        Args:
+            start: Start of the window
+            end: End of the window
+        Returns:
+            Map of substitutions
+        """
+        raise NotImplementedError
+
+
+class CreatedAtWindow(TimeWindowFilter):
+    """
+    Window filter for GitLab connections accepting createdAfter and createdBefore arguments, e.g. issues
+    and authoredMergeRequests. Both bounds are inclusive on GitLab.
+    """
+
+    def __init__(self, after_arg: str = "createdAfter", before_arg: str = "createdBefore"):
+        """
+        Initializes the filter.
+        Args:
+            after_arg: Argument of the lower bound
+            before_arg: Argument of the upper bound
+        """
+        self._after_arg = after_arg
+        self._before_arg = before_arg
+
+    def _restrict(self, query: PaginatedQuery, paginator: QueryNodePaginator):
+        paginator.args = dict(paginator.args or {}, **{self._after_arg: "$window_start",
+                                                       self._before_arg: "$window_end"})
+        if query.variables is not None:
+            query.variables = dict(query.variables, window_start="Time", window_end="Time")
+
+    def substitutions(self, start: datetime, end: datetime):
+        return {"window_start": start.strftime(TIME_FORMAT), "window_end": end.strftime(TIME_FORMAT)}
+
+
+class SearchQualifierWindow(TimeWindowFilter):
+    """
+    Window filter for GitHub search connections, appending a created:START..END qualifier to the search
+    string. The qualifier is part of a string literal, so windowed queries are sent with string templating.
+    """
+
+    def __init__(self, search_arg: str = "query", qualifier: str = "created"):
+        """
+        Initializes the filter.
+        Args:
+            search_arg: Argument holding the search string, a quoted literal such as "\\"author:$user\\""
+            qualifier: Search qualifier of the date range, e.g. created or updated
+        """
+        self._search_arg = search_arg
+        self._qualifier = qualifier
+
+    def _restrict(self, query: PaginatedQuery, paginator: QueryNodePaginator):
+        search = paginator.args[self._search_arg]
+        if not search.endswith('"'):
+            raise ValueError(f"{self._search_arg} must be a quoted search string")
+        paginator.args = dict(paginator.args, **{self._search_arg: search[:-1] + f' {self._qualifier}:$window_range"'})
+        query.variables = None
+
+    def substitutions(self, start: datetime, end: datetime):
+        return {"window_range": f"{start.strftime(TIME_FORMAT)}..{end.strftime(TIME_FORMAT)}"}
+
+
+class PartitionedCrawler:
+    """
+    Paginates a PaginatedQuery over a date range as many time windows crawled in parallel.
+
+    Cursor pagination is serial, so a long connection takes one round trip per page. The crawler splits the
+    range into windows with a TimeWindowFilter and paginates the windows on a worker pool. The length of the
+    next window is derived from the node density of the windows already crawled, so that each window takes
+    about target_pages pages: sparse ranges get few wide windows and dense ranges many narrow ones.
+
+    Adjacent windows share their boundary, as the window filters are inclusive on both ends and the servers
+    compare creation times below the second. A node created exactly on a boundary is returned by both
+    windows and yielded once, with the earlier window, by its id. The nodes of each window keep the order of
+    the connection, usually newest first, so the merged stream is ordered by window but not globally.
+    """
+
+    def __init__(self, client: Client, window_filter: TimeWindowFilter, max_workers: int = 4,
+                 initial_windows: int = None, target_pages: int = 4, min_window: timedelta = timedelta(hours=1)):
+        """
+        Initializes the crawler.
+        Args:
+            client: Client to execute the windows
+            window_filter: Filter restricting the query to a window
+            max_workers: Number of windows crawled at once
+            initial_windows: Number of windows the range is split into before any density is observed,
+                defaults to max_workers
+            target_pages: Number of pages a window should take
+            min_window: Shortest window length
+        """
+        self._client = client
+        self._window_filter = window_filter
+        self._max_workers = max_workers
+        self._initial_windows = initial_windows or max_workers
+        self._target_pages = target_pages
+        self._min_window = min_window
+
+    def _crawl(self, query: PaginatedQuery, substitutions: dict):
+        """
+        Paginates one window.
+        Args:
+            query: Windowed query
+            substitutions: Substitutions of the window
+        Returns:
+            List of pages
+        """
+        return list(self._client.execute(query=query, substitutions=substitutions))
+
+    def _next_length(self, counts: list, length: timedelta):
+        """
+        Derives the length of the next window from the density of a crawled one.
+        Args:
+            counts: Node count of each page
+            length: Length of the crawled window
+        Returns:
+            Length of the next window
+        """
+        if not sum(counts):
+            factor = 2
+        else:
+            # the last page is usually partial, so measure the window in full pages
+            factor = self._target_pages / (sum(counts) / max(counts))
+        return max(length * min(max(factor, 0.25), 4), self._min_window)
+
+    def execute(self, query: PaginatedQuery, substitutions: dict, start: Union[str, datetime],
+                end: Union[str, datetime]):
+        """
+        Executes the query over [start, end], yielding the pages of each window in chronological window order.
+        The nodes inside a window keep the order of the connection, and nodes already yielded by the previous
+        window are removed from the pages.
+        Args:
+            query: Query to run
+            substitutions: Substitutions to make
+            start: Start of the range, a datetime or a %Y-%m-%dT%H:%M:%SZ string
+            end: End of the range, a datetime or a %Y-%m-%dT%H:%M:%SZ string
+        Returns:
+            Generator of responses
+        """
+        start = datetime.strptime(start, TIME_FORMAT) if isinstance(start, str) else start
+        end = datetime.strptime(end, TIME_FORMAT) if isinstance(end, str) else end
+        windowed = self._window_filter.apply(query)
+        length = max((end - start) / self._initial_windows, self._min_window)
+
+        next_start, index, emitted = start, 0, 0
+        running, crawled, previous_ids = {}, {}, set()
+        with ThreadPoolExecutor(max_workers=self._max_workers) as pool:
+            while next_start < end or running:
+                while next_start < end and len(running) < self._max_workers:
+                    window_end = min(next_start + length, end)
+                    window_substitutions = dict(substitutions,
+                                                **self._window_filter.substitutions(next_start, window_end))
+                    future = pool.submit(self._crawl, windowed, window_substitutions)
+                    running[future] = (index, window_end - next_start, window_substitutions)
+                    index, next_start = index + 1, window_end
+
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    window_index, window_length, window_substitutions = running.pop(future)
+                    pages = future.result()
+                    counts = [len(windowed.nodes(page, window_substitutions)) for page in pages]
+                    length = self._next_length(counts, window_length)
+                    crawled[window_index] = (pages, window_substitutions)
+
+                while emitted in crawled:
+                    pages, window_substitutions = crawled.pop(emitted)
+                    ids = set()
+                    for page in pages:
+                        nodes = windowed.nodes(page, window_substitutions)
+                        # nodes on the boundary with the previous window were already yielded
+                        nodes[:] = [node for node in nodes if _node_id(node) not in previous_ids]
+                        ids.update(_node_id(node) for node in nodes)
+                        yield page
+                    previous_ids = ids - {None}
+                    emitted += 1
+
+
+def _node_id(node):
+    """
+    Returns the id of a node or of the node of an edge, None if the query does not select it.
+    """
+    if not isinstance(node, dict):
+        return None
+    node = node.get("node", node)
+    return node.get("id") if isinstance(node, dict) else None
@@ -1,3 +1,4 @@
+import re
 from string import Template
 from typing import Union, List, Dict
 from datetime import datetime
@@ -94,8 +95,24 @@ class Query(QueryNode):
     """
     Terminal QueryNode that can be executed.
     """
+    TIME_PATTERN = re.compile(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z")
+
+    VARIABLE_REFERENCE = re.compile(r'"\$(\w+)"')
+
+    # GraphQL types of the variables the query references, e.g. {"user": "String!"}.
+    # Queries without declared variables are always sent with string templating.
+    variables = None
+
+    # template compiled from the rendered QueryNode tree, see _compiled_template
+    _template = None
+    _template_key = None
+    _document = None
+
     @staticmethod
     def test_time_format(time_string: str):
+        # cheap shape check first, only timestamp-shaped strings pay for strptime
+        if not Query.TIME_PATTERN.fullmatch(time_string):
+            return False
         try:
             datetime.strptime(time_string, "%Y-%m-%dT%H:%M:%SZ")
             return True
@@ -118,6 +135,8 @@ class Query(QueryNode):
                                 )
                                 + "}"
                               )
+            elif isinstance(value, list):
+                result[key] = "[" + ", ".join(f'"{item}"' if isinstance(item, str) else str(item) for item in value) + "]"
             elif isinstance(value, str) and Query.test_time_format(value):
                 result[key] = '"' + value + '"'
             else:
@@ -134,7 +153,79 @@ class Query(QueryNode):
             Modified Query as a string
         """
         converted_args = Query.convert_dict(kwargs)
-        return Template(self.__str__()).substitute(**converted_args)
+        return self._compiled_template().substitute(**converted_args)
+
+    def variable_definitions(self):
+        """
+        Returns the variables declared by the document.
+        Returns:
+            Map of variable names to GraphQL types
+        """
+        return dict(self.variables or {})
+
+    def variable_values(self, **kwargs):
+        """
+        Returns the variables sent along the document.
+        Args:
+            **kwargs: Map of substitutions
+        Returns:
+            Map of variable names to values
+        """
+        return {name: kwargs.get(name) for name in self.variable_definitions()}
+
+    @staticmethod
+    def _render_field(field: Union[str, QueryNode], after: str = None):
+        """
+        Renders a field without touching the QueryNode tree.
+        Args:
+            field: Field or QueryNode to render
+            after: Value of the after argument of paginators, e.g. "$after"
+        Returns:
+            Field as a string
+        """
+        if not isinstance(field, QueryNode):
+            return field
+        args = field.args
+        if after is not None and isinstance(field, QueryNodePaginator):
+            args = dict(field.args or {}, after=after)
+        fields = " ".join(Query._render_field(child, after) for child in field.fields)
+        return f"{field.name}{QueryNode(field.name, args=args)._format_args()} {{ {fields} }}"
+
+    def document(self):
+        """
+        Renders the query as a GraphQL document referencing its declared variables.
+        The document is byte-identical across pages and substitutions, so it is rendered once.
+        Returns:
+            Document as a string
+        """
+        if self._document is None:
+            definitions = ", ".join(f"${name}: {graphql_type}"
+                                    for name, graphql_type in self.variable_definitions().items())
+            fields = " ".join(Query._render_field(field, "$after") for field in self.fields)
+            fields = Query.VARIABLE_REFERENCE.sub(r"$\1", fields)
+            self._document = (f"{self.name}({definitions}) {{ {fields} }}"
+                              if definitions else f"{self.name} {{ {fields} }}")
+        return self._document
+
+    def _cache_key(self):
+        """
+        Returns the part of the QueryNode tree that changes between executions.
+        Returns:
+            Cache key of the compiled template
+        """
+        return None
+
+    def _compiled_template(self):
+        """
+        Returns the template of the rendered QueryNode tree, rendering it only when the cache key changed.
+        Returns:
+            Compiled Template
+        """
+        key = self._cache_key()
+        if self._template is None or self._template_key != key:
+            self._template = Template(self.__str__())
+            self._template_key = key
+        return self._template
 
 
 class QueryNodePaginator(QueryNode):
@@ -187,10 +278,55 @@ class QueryNodePaginator(QueryNode):
         return super().__eq__(other)
 
 
+class PaginationCursor:
+    """
+    Pagination state of one execution of a PaginatedQuery.
+
+    Keeping the cursor out of the QueryNode tree lets one query instance drive many concurrent paginations.
+    """
+
+    def __init__(self, end_cursor: str = None, has_next_page: bool = True):
+        """
+        Initializes a PaginationCursor.
+        Args:
+            end_cursor: Cursor of the last page fetched, None before the first page
+            has_next_page: Whether a next page exists
+        """
+        self.end_cursor = end_cursor
+        self.has_next_page = has_next_page
+
+    def update(self, has_next_page: bool, end_cursor: str = None):
+        """
+        Moves the cursor past the page just fetched.
+        Args:
+            has_next_page: has next page to update with
+            end_cursor: the end cursor for pagination
+        """
+        self.has_next_page = has_next_page
+        self.end_cursor = end_cursor
+
+    def has_next(self):
+        """
+        Checks if there exists a next page.
+        Returns:
+            Boolean if a next page exists
+        """
+        return self.has_next_page
+
+    def literal(self):
+        """
+        Returns the cursor as a GraphQL literal for the after argument.
+        Returns:
+            Cursor literal
+        """
+        return "null" if self.end_cursor is None else '"' + self.end_cursor + '"'
+
+
 class PaginatedQuery(Query):
     """
     Terminal QueryNode that can be executed designed for paginated requests.
     """
+    _page_template = None
 
     def __init__(self, name: str = "query", fields: List[Union[str, 'QueryNode']] = None, args: Dict = None):
         """
@@ -203,6 +339,76 @@ class PaginatedQuery(Query):
         super().__init__(name=name, fields=fields, args=args)
         self.path, self.paginator = PaginatedQuery.extract_path_to_pageinfo_node(self)
 
+    def _cache_key(self):
+        """
+        Returns the cursor of the paginator, the only part of the tree that changes between pages.
+        Returns:
+            Cache key of the compiled template
+        """
+        return self.paginator.args.get("after") if self.paginator.args else None
+
+    def variable_definitions(self):
+        """
+        Returns the variables declared by the document, including the $after cursor.
+        Returns:
+            Map of variable names to GraphQL types
+        """
+        return dict(super().variable_definitions(), after="String")
+
+    def page_variables(self, cursor: 'PaginationCursor', **kwargs):
+        """
+        Returns the variables sent along the document for the page a cursor points at.
+        Args:
+            cursor: Pagination state of the execution
+            **kwargs: Map of substitutions
+        Returns:
+            Map of variable names to values
+        """
+        return dict(self.variable_values(**kwargs), after=cursor.end_cursor)
+
+    def substitute_page(self, cursor: 'PaginationCursor', **kwargs):
+        """
+        Substitutes Query with values for the page a cursor points at, leaving the QueryNode tree untouched.
+        Args:
+            cursor: Pagination state of the execution
+            **kwargs: Map of substitutions
+
+        Returns:
+            Modified Query as a string
+        """
+        if self._page_template is None:
+            fields = " ".join(Query._render_field(field, "$_cursor") for field in self.fields)
+            self._page_template = Template(f"{self.name}{self._format_args()} {{ {fields} }}")
+        return self._page_template.substitute(Query.convert_dict(kwargs), _cursor=cursor.literal())
+
+    def page_info(self, response: Dict, substitutions: Dict):
+        """
+        Finds the pageInfo node of a response.
+        Args:
+            response: Response of the query
+            substitutions: Substitutions of the query
+        Returns:
+            pageInfo node
+        """
+        curr_node = response
+        for field_name in self.path:
+            curr_node = curr_node[Template(field_name).substitute(**substitutions)]
+        return curr_node["pageInfo"]
+
+    def nodes(self, response: Dict, substitutions: Dict):
+        """
+        Finds the nodes, or edges, of the paginated connection in a response.
+        Args:
+            response: Response of the query
+            substitutions: Substitutions of the query
+        Returns:
+            List of nodes
+        """
+        curr_node = response
+        for field_name in self.path:
+            curr_node = curr_node[Template(field_name).substitute(**substitutions)]
+        return curr_node.get("nodes") or curr_node.get("edges") or []
+
     @staticmethod
     def extract_path_to_pageinfo_node(paginated_query: 'PaginatedQuery'):
         """
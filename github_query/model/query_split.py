@@ -0,0 +1,109 @@
+from typing import Union, List, Callable
+
+from github_query.model.query import Query, QueryNode, PaginatedQuery, InvalidQueryException
+
+# fields every part keeps, so the parts can be stitched back together and paginated in lockstep
+REQUIRED_FIELDS = ("id", "__typename", "pageInfo")
+
+
+def _is_required(field: Union[str, QueryNode]):
+    name = field.name if isinstance(field, QueryNode) else field
+    return name in REQUIRED_FIELDS
+
+
+def _as_query(fields: List[Union[str, QueryNode]]):
+    """
+    Wraps a field list into a Query, a PaginatedQuery if it still selects the paginator.
+    Args:
+        fields: Top-level fields
+    Returns:
+        Query or PaginatedQuery
+    """
+    try:
+        return PaginatedQuery(fields=fields)
+    except InvalidQueryException:
+        return Query(fields=fields)
+
+
+def _split_fields(fields: List[Union[str, QueryNode]], score: Callable):
+    """
+    Splits a field list in two lossless halves, separating the sibling selections of the shallowest level
+    holding more than one of them.
+    Args:
+        fields: Fields to split
+        score: Cost of a single field
+    Returns:
+        Two field lists, or None if the fields select a single leaf
+    """
+    required = [field for field in fields if _is_required(field)]
+    rest = [field for field in fields if not _is_required(field)]
+    if len(rest) >= 2:
+        # greedy balance, heaviest field first
+        halves, totals = (set(), set()), [0, 0]
+        for index in sorted(range(len(rest)), key=lambda i: score(rest[i]), reverse=True):
+            half = 0 if totals[0] <= totals[1] else 1
+            halves[half].add(index)
+            totals[half] += score(rest[index])
+        return [required + [field for i, field in enumerate(rest) if i in half] for half in halves]
+    if len(rest) == 1 and isinstance(rest[0], QueryNode):
+        node = rest[0]
+        halves = _split_fields(node.fields, score)
+        if halves is None:
+            return None
+        return [[type(node)(name=node.name, fields=half, args=node.args) if field is node else field
+                 for field in fields] for half in halves]
+    return None
+
+
+def split_query(query: Query, substitutions: dict, estimate: Callable, limit: float, max_parts: int = 16):
+    """
+    Splits a query into sub-queries selecting disjoint parts of its tree, each one within a cost limit
+    when possible. Every sub-query keeps the path to its selections and the id, __typename and pageInfo
+    fields, so their responses can be merged with merge_responses and paginated with the same cursor.
+    Args:
+        query: Query to split
+        substitutions: Substitutions of the query
+        estimate: Static cost estimator, e.g. estimate_gitlab_complexity
+        limit: Cost limit of a sub-query
+        max_parts: Maximum number of sub-queries
+    Returns:
+        List of Query or PaginatedQuery, or None if the query cannot be split
+    """
+    def score(field):
+        return estimate(Query(fields=[field]), substitutions)
+
+    halves = _split_fields(query.fields, score)
+    if halves is None:
+        return None
+    pending, parts = halves, []
+    while pending:
+        fields = pending.pop(0)
+        halves = None
+        if len(parts) + len(pending) + 1 < max_parts and estimate(Query(fields=fields), substitutions) > limit:
+            halves = _split_fields(fields, score)
+        if halves is None:
+            parts.append(fields)
+        else:
+            pending.extend(halves)
+    return [_as_query(fields) for fields in parts]
+
+
+def merge_responses(first, second):
+    """
+    Stitches the responses of two sub-queries back into one response.
+    Lists are merged item by item, the sub-queries resolve the same connection with the same cursor.
+    Args:
+        first: Response of a sub-query
+        second: Response of another sub-query
+    Returns:
+        Merged response
+    """
+    if isinstance(first, dict) and isinstance(second, dict):
+        merged = dict(first)
+        for key, value in second.items():
+            merged[key] = merge_responses(merged[key], value) if key in merged else value
+        return merged
+    if isinstance(first, list) and isinstance(second, list):
+        longer = first if len(first) >= len(second) else second
+        return [merge_responses(a, b) for a, b in zip(first, second)] + longer[min(len(first), len(second)):]
+    return first if first is not None else second
@@ -0,0 +1,203 @@
+import threading
+import time
+
+
+class RateLimitBudget:
+    """
+    Rate limit budget shared by every request sent through a client.
+
+    The budget is fed from the rate limit headers of real responses. When the remaining points
+    would drop below the reserve, the first caller sleeps until the reset while holding the
+    budget, so concurrent workers queue up behind it instead of all hitting the reset wall.
+    """
+
+    REMAINING_HEADERS = ("X-RateLimit-Remaining", "RateLimit-Remaining")
+    RESET_HEADERS = ("X-RateLimit-Reset", "RateLimit-Reset")
+
+    def __init__(self, reserve: int = 5):
+        """
+        Initializes the budget.
+        Args:
+            reserve: Points always kept in hand
+        """
+        self._reserve = reserve
+        self._remaining = None
+        self._reset_at = None
+        self._lock = threading.Lock()
+
+    @property
+    def remaining(self):
+        """
+        Returns the points left in the current window, None if unknown.
+        """
+        return self._remaining
+
+    @property
+    def reset_at(self):
+        """
+        Returns the reset time of the current window as epoch seconds, None if unknown.
+        """
+        return self._reset_at
+
+    def update(self, remaining: int, reset_at: float):
+        """
+        Records the budget reported by the server.
+        Args:
+            remaining: Points left in the window
+            reset_at: Reset time of the window as epoch seconds
+        """
+        with self._lock:
+            if self._remaining is not None and self._reset_at == reset_at:
+                # responses of one window can arrive out of order, the lowest count is the latest
+                remaining = min(remaining, self._remaining)
+            self._remaining = remaining
+            self._reset_at = reset_at
+
+    def update_from_headers(self, headers):
+        """
+        Records the budget from GitHub (X-RateLimit-*) or GitLab (RateLimit-*) response headers.
+        Args:
+            headers: Response headers
+        """
+        remaining = next((headers[name] for name in self.REMAINING_HEADERS if name in headers), None)
+        reset_at = next((headers[name] for name in self.RESET_HEADERS if name in headers), None)
+        if remaining is None or reset_at is None:
+            return
+        try:
+            self.update(int(remaining), float(reset_at))
+        except ValueError:
+            return
+
+    def select(self, cost: int = 1):
+        """
+        Returns the budget a request will be charged to, before any points are reserved.
+        Args:
+            cost: Predicted cost of the request
+        Returns:
+            RateLimitBudget
+        """
+        return self
+
+    def acquire(self, cost: int = 1):
+        """
+        Reserves points for a request, sleeping until the reset when the budget is exhausted.
+        Args:
+            cost: Predicted cost of the request
+        """
+        with self._lock:
+            if self._remaining is None:
+                return
+            if cost > self._remaining - self._reserve:
+                seconds = self._reset_at - time.time()
+                if seconds > 0:
+                    print(f"waiting for {seconds}s.")
+                    time.sleep(seconds + 5)
+                self._remaining = None
+                self._reset_at = None
+                return
+            self._remaining -= cost
+
+
+class TokenPoolBudget:
+    """
+    Rate limit budget spread over a pool of tokens, one RateLimitBudget per token.
+
+    Every request reserves its cost on the token with the most headroom, which becomes the current
+    token of the calling thread. Only when every token is exhausted does the pool sleep, until the
+    earliest reset.
+    """
+
+    def __init__(self, size: int, reserve: int = 5):
+        """
+        Initializes the budget.
+        Args:
+            size: Number of tokens
+            reserve: Points always kept in hand on each token
+        """
+        self.budgets = [RateLimitBudget(reserve=reserve) for _ in range(size)]
+        self._reserve = reserve
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    @property
+    def current(self):
+        """
+        Returns the index of the token the calling thread last reserved.
+        """
+        return getattr(self._local, "index", 0)
+
+    def _headroom(self, index: int):
+        budget = self.budgets[index]
+        if budget.remaining is None or budget.reset_at <= time.time():
+            return float("inf")
+        return budget.remaining - self._reserve
+
+    @property
+    def remaining(self):
+        """
+        Returns the points left on the token with the most headroom, None if one is unknown.
+        """
+        headroom = max(self._headroom(index) for index in range(len(self.budgets)))
+        return None if headroom == float("inf") else headroom + self._reserve
+
+    @property
+    def reset_at(self):
+        """
+        Returns the reset time of the current token, None if unknown.
+        """
+        return self.budgets[self.current].reset_at
+
+    def update(self, remaining: int, reset_at: float):
+        """
+        Records the budget reported by the server for the current token.
+        Args:
+            remaining: Points left in the window
+            reset_at: Reset time of the window as epoch seconds
+        """
+        self.budgets[self.current].update(remaining, reset_at)
+
+    def update_from_headers(self, headers):
+        """
+        Records the budget from response headers for the current token.
+        Args:
+            headers: Response headers
+        """
+        self.budgets[self.current].update_from_headers(headers)
+
+    def _pick(self, cost: int):
+        indexes = range(len(self.budgets))
+        index = max(indexes, key=self._headroom)
+        if self._headroom(index) < cost:
+            # every token is exhausted, wait on the one that resets first
+            index = min(indexes, key=lambda i: self.budgets[i].reset_at)
+        return index
+
+    def select(self, cost: int = 1):
+        """
+        Picks the token of the calling thread's next request without reserving points, so a preflight
+        is sent with, and charged to, the token the request itself will use. The next acquire keeps it.
+        Args:
+            cost: Predicted cost of the request
+        Returns:
+            RateLimitBudget of the token
+        """
+        with self._lock:
+            self._local.index = self._pick(cost)
+            self._local.selected = True
+            return self.budgets[self._local.index]
+
+    def acquire(self, cost: int = 1):
+        """
+        Reserves points on the token picked by select, or else on the token with the most headroom,
+        switching tokens instead of sleeping.
+        Args:
+            cost: Predicted cost of the request
+        """
+        with self._lock:
+            if getattr(self._local, "selected", False):
+                index = self._local.index
+                self._local.selected = False
+            else:
+                index = self._pick(cost)
+            self._local.index = index
+            self.budgets[index].acquire(cost)
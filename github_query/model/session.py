@@ -0,0 +1,36 @@
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+def create_session(pool_connections: int = 10,
+                   pool_maxsize: int = 10,
+                   max_retries: int = 0,
+                   backoff_factor: float = 0.5,
+                   keep_alive: bool = True):
+    """
+    Creates a pooled HTTP session shared by the GraphQL and REST clients.
+    Args:
+        pool_connections: Number of per-host connection pools to keep
+        pool_maxsize: Maximum number of connections kept alive per host
+        max_retries: Retries performed by the adapter on connection errors and 5xx responses
+        backoff_factor: Backoff factor between adapter level retries
+        keep_alive: Reuse connections between requests
+    Returns:
+        Configured requests Session
+    """
+    retry = Retry(
+        total=max_retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=(502, 503, 504),
+        allowed_methods=frozenset({"GET", "POST"}),
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=retry)
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    if not keep_alive:
+        session.headers["Connection"] = "close"
+    return session
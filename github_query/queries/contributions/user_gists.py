@@ -1,8 +1,10 @@
 from github_query.model.query import QueryNode, PaginatedQuery, QueryNodePaginator
-import github_query.util.helper as helper
+from github_query.util.timeline import count_leading_before, to_epochs
 
 
 class UserGists(PaginatedQuery):
+    variables = {"user": "String!", "pg_size": "Int"}
+
     def __init__(self):
         super().__init__(
             fields=[
@@ -51,10 +53,4 @@ class UserGists(PaginatedQuery):
             time:
         Returns:
         """
-        counter = 0
-        for gist in gists:
-            if helper.created_before(gist["createdAt"], time):
-                counter += 1
-            else:
-                break
-        return counter
+        return count_leading_before(to_epochs(gist["createdAt"] for gist in gists), time)
@@ -1,6 +1,8 @@
 from github_query.model.query import Query, QueryNode
 
 class UserLoginViewer(Query):
+    variables = {}
+
     def __init__(self):
         super().__init__(
             fields=[
@@ -13,6 +15,8 @@ class UserLoginViewer(Query):
 
 
 class UserLogin(Query):
+    variables = {"user": "String!"}
+
     def __init__(self):
         super().__init__(
             fields=[
@@ -3,6 +3,9 @@ import github_query.util.helper as helper
 
 
 class UserRepositories(PaginatedQuery):
+    variables = {"user": "String!", "pg_size": "Int", "is_fork": "Boolean",
+                 "ownership": "[RepositoryAffiliation]", "order_by": "RepositoryOrder"}
+
     def __init__(self):
         super().__init__(
             fields=[
@@ -1,8 +1,10 @@
 from github_query.model.query import QueryNode, PaginatedQuery, QueryNodePaginator
-import github_query.util.helper as helper
+from github_query.util.timeline import count_leading_before, to_epochs
 
 
 class UserRepositoryDiscussions(PaginatedQuery):
+    variables = {"user": "String!", "pg_size": "Int"}
+
     def __init__(self):
         super().__init__(
             fields=[
@@ -51,10 +53,5 @@ class UserRepositoryDiscussions(PaginatedQuery):
             time:
         Returns:
         """
-        counter = 0
-        for repository_discussion in repository_discussions:
-            if helper.created_before(repository_discussion["createdAt"], time):
-                counter += 1
-            else:
-                break
-        return counter
+        created = to_epochs(repository_discussion["createdAt"] for repository_discussion in repository_discussions)
+        return count_leading_before(created, time)
@@ -0,0 +1,50 @@
+from github_query.model.query import QueryNode, PaginatedQuery, QueryNodePaginator
+
+"""
+{
+  projects(ids: ["gid://gitlab/Project/278964"], first: 50) {
+    nodes {
+      id
+      name
+      languages {
+        name
+        share
+      }
+    }
+    pageInfo {
+      endCursor
+      hasNextPage
+    }
+  }
+}
+"""
+
+class ProjectsByIds(PaginatedQuery):
+    variables = {"ids": "[ID!]", "pg_size": "Int"}
+
+    def __init__(self):
+        super().__init__(
+            fields=[
+                QueryNodePaginator(
+                    "projects",
+                    args={"ids": "$ids", "first": "$pg_size"},
+                    fields=[
+                        QueryNode(
+                            "nodes",
+                            fields=[
+                                "id",
+                                "name",
+                                QueryNode(
+                                    "languages",
+                                    fields=["name", "share"],
+                                )
+                            ]
+                        ),
+                        QueryNode(
+                            "pageInfo",
+                            fields=["endCursor", "hasNextPage"]
+                        )
+                    ]
+                )
+            ]
+        )
@@ -19,6 +19,8 @@ from github_query.model.query import QueryNode, PaginatedQuery, QueryNodePaginat
 """
 
 class UserAuthoredSnippets(PaginatedQuery):
+    variables = {"user": "String!", "pg_size": "Int"}
+
     def __init__(self):
         super().__init__(
             fields=[
@@ -9,6 +9,8 @@ from github_query.model.query import QueryNode, PaginatedQuery, QueryNodePaginat
           project {
             id
             name
+            starCount
+            forksCount
             languages {
                 name
                 share
@@ -22,6 +24,8 @@ from github_query.model.query import QueryNode, PaginatedQuery, QueryNodePaginat
 """
 
 class UserContributedAndPersonalProjects(PaginatedQuery):
+    variables = {"user": "String!", "pg_size": "Int"}
+
     def __init__(self):
         super().__init__(
             fields=[
@@ -42,6 +46,8 @@ class UserContributedAndPersonalProjects(PaginatedQuery):
                                             fields=[
                                                 "id",
                                                 "name",
+                                                "starCount",
+                                                "forksCount",
                                                 QueryNode(
                                                     "languages",
                                                     fields=["name", "share"],
@@ -18,6 +18,8 @@ from github_query.model.query import QueryNode, PaginatedQuery, QueryNodePaginat
 """
 
 class UserIssuesContributions(PaginatedQuery):
+    variables = {"user": "String", "pg_size": "Int"}
+
     def __init__(self):
         super().__init__(
             fields=[
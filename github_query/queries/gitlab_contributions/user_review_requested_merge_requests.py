@@ -2,6 +2,8 @@ from github_query.model.query import QueryNode, PaginatedQuery, QueryNodePaginat
 
 
 class UserReviewRequestedMergeRequests(PaginatedQuery):
+    variables = {"user": "String!", "pg_size": "Int"}
+
     def __init__(self):
         super().__init__(
             fields=[
@@ -8,6 +8,8 @@ from github_query.model.query import QueryNode, PaginatedQuery, QueryNodePaginat
       nodes {
         id
         name
+        starCount
+        forksCount
         languages {
             name
             share
@@ -19,6 +21,8 @@ from github_query.model.query import QueryNode, PaginatedQuery, QueryNodePaginat
 """
 
 class UserStarredProjects(PaginatedQuery):
+    variables = {"user": "String!", "pg_size": "Int"}
+
     def __init__(self):
         super().__init__(
             fields=[
@@ -36,6 +40,8 @@ class UserStarredProjects(PaginatedQuery):
                                     fields=[
                                         "id",
                                         "name",
+                                        "starCount",
+                                        "forksCount",
                                         QueryNode(
                                             "languages",
                                             fields=["name", "share"],
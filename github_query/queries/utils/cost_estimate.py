@@ -0,0 +1,126 @@
+import math
+from typing import Union
+
+from github_query.model.query import QueryNode, QueryNodePaginator
+
+# page size GitHub and GitLab assume when a connection has no first/last argument
+DEFAULT_PAGE_SIZE = 100
+
+
+def _page_size(node: QueryNode, substitutions: dict):
+    """
+    Resolves the page size of a connection node.
+    Args:
+        node: QueryNode to inspect
+        substitutions: Substitutions of the query
+    Returns:
+        Page size, or None if the node is not a connection
+    """
+    args = node.args or {}
+    value = args.get("first", args.get("last"))
+    if value is None:
+        return DEFAULT_PAGE_SIZE if isinstance(node, QueryNodePaginator) else None
+    if isinstance(value, str) and value.startswith("$"):
+        value = substitutions.get(value[1:].strip("{}"), DEFAULT_PAGE_SIZE)
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return DEFAULT_PAGE_SIZE
+
+
+def _github_requests(node: QueryNode, substitutions: dict, multiplier: int):
+    """
+    Counts the requests GitHub assumes to fulfill every connection below a node.
+    Args:
+        node: QueryNode to walk
+        substitutions: Substitutions of the query
+        multiplier: Number of times the node is resolved
+    Returns:
+        Number of requests
+    """
+    requests = 0
+    page_size = _page_size(node, substitutions)
+    if page_size is not None:
+        requests += multiplier
+        multiplier *= page_size
+    for child in node.get_connected_nodes():
+        requests += _github_requests(child, substitutions, multiplier)
+    return requests
+
+
+def estimate_github_cost(query: QueryNode, substitutions: dict):
+    """
+    Predicts GitHub's rate limit cost of a query without sending it.
+    GitHub adds up the requests needed for every connection, assuming each one returns first/last
+    items, divides the sum by 100 and rounds it, with a minimum of 1 point.
+    Args:
+        query: Query to estimate
+        substitutions: Substitutions of the query
+    Returns:
+        Predicted cost in rate limit points
+    """
+    return max(1, round(_github_query_requests(query, substitutions) / 100))
+
+
+def _github_query_requests(query: QueryNode, substitutions: dict):
+    """
+    Counts the requests GitHub assumes to fulfill a query, including every part of an AliasedQuery.
+    Args:
+        query: Query to walk
+        substitutions: Substitutions of the query
+    Returns:
+        Number of requests
+    """
+    parts = getattr(query, "parts", None)
+    if parts is not None:
+        return sum(_github_query_requests(part, part_substitutions) for _, part, part_substitutions, *_ in parts)
+    return sum(_github_requests(node, substitutions, 1) for node in query.get_connected_nodes())
+
+
+def _gitlab_complexity(field: Union[str, QueryNode], substitutions: dict):
+    """
+    Scores a field the way GitLab's schema does.
+    Args:
+        field: Field or QueryNode to score
+        substitutions: Substitutions of the query
+    Returns:
+        Complexity score
+    """
+    if not isinstance(field, QueryNode):
+        return 1
+    children = sum(_gitlab_complexity(child, substitutions) for child in field.fields)
+    page_size = _page_size(field, substitutions)
+    if page_size is None:
+        return 1 + children
+    # connections cost one extra point and 1% of their children per item loaded
+    return 2 + int(children * (1 + 0.01 * page_size))
+
+
+def estimate_gitlab_complexity(query: QueryNode, substitutions: dict):
+    """
+    Predicts GitLab's queryComplexity score of a query without sending it.
+    Args:
+        query: Query to estimate
+        substitutions: Substitutions of the query
+    Returns:
+        Predicted complexity score
+    """
+    parts = getattr(query, "parts", None)
+    if parts is not None:
+        return sum(estimate_gitlab_complexity(part, part_substitutions) for _, part, part_substitutions, *_ in parts)
+    return sum(_gitlab_complexity(field, substitutions) for field in query.fields)
+
+
+def estimate_crawl_cost(query: QueryNode, substitutions: dict, total_count: int):
+    """
+    Predicts GitHub's rate limit cost of paginating a whole connection.
+    Args:
+        query: PaginatedQuery to estimate
+        substitutions: Substitutions of the query
+        total_count: Number of nodes in the paginated connection
+    Returns:
+        Predicted cost in rate limit points
+    """
+    page_size = _page_size(query.paginator, substitutions)
+    pages = max(1, math.ceil(total_count / page_size))
+    return pages * estimate_github_cost(query, substitutions)
@@ -2,6 +2,8 @@ from github_query.model.query import Query, QueryNode
 
 
 class RateLimit(Query):
+    variables = {"dryrun": "Boolean"}
+
     def __init__(self):
         super().__init__(
             fields=[
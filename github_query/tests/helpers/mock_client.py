@@ -1,5 +1,6 @@
 from abc import ABC
 
+from github_query.model.async_client import AsyncClient
 from github_query.model.client import Client
 
 class MockClient(Client, ABC):
@@ -15,5 +16,9 @@ class MockClient(Client, ABC):
             f"{self._protocol}://{self._host}/not/enterprise"
         )
 
-    def handle_retry(self, match):
+    def handle_retry(self, match, estimate=None):
         return
+
+
+class MockAsyncClient(AsyncClient, MockClient):
+    pass
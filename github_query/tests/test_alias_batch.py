@@ -0,0 +1,86 @@
+import pytest
+
+from github_query.gitlab_graphql.gitlab_client import GitLabClient
+from github_query.model.alias_batch import AliasBatcher, AliasedQuery
+from github_query.model.authentication import PersonalAccessTokenAuthenticator, GitLabPersonalAccessTokenAuthenticator
+from github_query.model.batch import BatchJob
+from github_query.model.query import PaginationCursor
+from github_query.queries.contributions.user_login import UserLogin
+from github_query.queries.gitlab_contributions.user_assigned_merge_requests import UserAssignedMergeRequests
+from github_query.tests.helpers.mock_client import MockClient
+
+
+def merge_request_page(username, has_next_page):
+    return {
+        "username": username,
+        "assignedMergeRequests": {
+            "count": 2,
+            "nodes": [{"createdAt": "2022-04-17T21:12:06Z"}],
+            "pageInfo": {"endCursor": f"{username}_cursor", "hasNextPage": has_next_page}
+        }
+    }
+
+
+class TestAliasBatcher:
+
+    @pytest.fixture
+    def client(self):
+        return MockClient(host="some_url", authenticator=PersonalAccessTokenAuthenticator(token="token"))
+
+    def test_aliased_query_renders_each_part(self):
+        query = AliasedQuery([("b0_", UserLogin(), {"user": "alice"}, None),
+                              ("b1_", UserLogin(), {"user": "bob"}, None)])
+
+        rendered = query.substitute()
+
+        assert rendered.startswith('query { b0_user: user(login: "alice")')
+        assert 'b1_user: user(login: "bob")' in rendered
+
+    def test_execute_merges_jobs_into_one_request(self, client, requests_mock):
+        requests_mock.post("https://some_url/not/enterprise", json={"data": {
+            "b0_user": {"login": "alice"}, "b1_user": {"login": "bob"}, "b2_user": {"login": "carol"}
+        }})
+        jobs = [BatchJob(UserLogin(), {"user": user}, key=user) for user in ["alice", "bob", "carol"]]
+
+        results = {result.job.key: result.result for result in AliasBatcher(client).execute(jobs)}
+
+        assert requests_mock.call_count == 1
+        assert results == {user: {"user": {"login": user}} for user in ["alice", "bob", "carol"]}
+
+    def test_execute_paginates_each_alias(self, client, requests_mock):
+        def respond(request, context):
+            query = request.json()["query"]
+            if "alice_cursor" in query:
+                return {"data": {"b0_user": merge_request_page("alice", False)}}
+            return {"data": {"b0_user": merge_request_page("alice", True), "b1_user": merge_request_page("bob", False)}}
+
+        requests_mock.post("https://some_url/not/enterprise", json=respond)
+        jobs = [BatchJob(UserAssignedMergeRequests(), {"user": user, "pg_size": 1}, key=user) for user in ["alice", "bob"]]
+
+        results = {result.job.key: result.result for result in AliasBatcher(client).execute(jobs)}
+
+        assert requests_mock.call_count == 2
+        assert len(results["alice"]) == 2
+        assert len(results["bob"]) == 1
+        assert results["bob"][0]["user"]["username"] == "bob"
+
+    def test_execute_isolates_partial_errors(self, client, requests_mock):
+        requests_mock.post("https://some_url/not/enterprise", json={
+            "data": {"b0_user": {"login": "alice"}, "b1_user": None},
+            "errors": [{"message": "Could not resolve to a User", "path": ["b1_user"]}]
+        })
+        jobs = [BatchJob(UserLogin(), {"user": user}, key=user) for user in ["alice", "missing"]]
+
+        results = {result.job.key: result for result in AliasBatcher(client).execute(jobs)}
+
+        assert results["alice"].ok
+        assert results["alice"].result == {"user": {"login": "alice"}}
+        assert not results["missing"].ok
+
+    def test_batch_size_follows_complexity_limit(self):
+        client = GitLabClient(host="gitlab.com", authenticator=GitLabPersonalAccessTokenAuthenticator(token="token"))
+        jobs = [BatchJob(UserAssignedMergeRequests(), {"user": f"user{i}", "pg_size": 2}) for i in range(10)]
+        batcher = AliasBatcher(client, cost_limit=30)
+
+        # every job scores 10, three of them fit under 30
+        assert batcher._batch_size([(job, PaginationCursor()) for job in jobs]) == 3
@@ -0,0 +1,135 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from github_query.model.authentication import PersonalAccessTokenAuthenticator
+from github_query.model.checkpoint import CheckpointStore
+from github_query.model.client import QueryFailedException
+from github_query.queries.gitlab_contributions.user_assigned_merge_requests import UserAssignedMergeRequests
+from github_query.tests.helpers.mock_client import MockAsyncClient
+
+
+class TestAsyncClient:
+
+    mock_page = {
+        "data": {
+            "user": {
+                "username": "tester",
+                "assignedMergeRequests": {
+                    "count": 2,
+                    "nodes": [{"createdAt": "2022-04-17T21:12:06Z"}],
+                    "pageInfo": {"endCursor": "cursor", "hasNextPage": True}
+                }
+            }
+        }
+    }
+
+    mock_last_page = {
+        "data": {
+            "user": {
+                "username": "tester",
+                "assignedMergeRequests": {
+                    "count": 2,
+                    "nodes": [{"createdAt": "2022-04-18T21:12:06Z"}],
+                    "pageInfo": {"endCursor": "cursor", "hasNextPage": False}
+                }
+            }
+        }
+    }
+
+    @pytest.fixture
+    def client(self):
+        client = MockAsyncClient(host="some_url", authenticator=PersonalAccessTokenAuthenticator(token="token"),
+                                 max_concurrency=2)
+        yield client
+        client.close()
+
+    def test_execute_query(self, client, requests_mock):
+        requests_mock.post("https://some_url/not/enterprise", json={"data": {"someKey": "someValue"}})
+
+        result = asyncio.run(client.execute(query="query", substitutions={}))
+
+        assert result == {"someKey": "someValue"}
+
+    def test_execute_query_failure(self, client, requests_mock):
+        requests_mock.post("https://some_url/not/enterprise", json={"error": "error"}, status_code=404)
+
+        with pytest.raises(QueryFailedException):
+            asyncio.run(client.execute(query="query", substitutions={}))
+
+    def test_execute_paginated_query(self, client, requests_mock):
+        requests_mock.post("https://some_url/not/enterprise", [{'json': self.mock_page},
+                                                               {'json': self.mock_last_page}])
+
+        async def collect():
+            return [response async for response in
+                    client.execute(query=UserAssignedMergeRequests(), substitutions={"user": "tester", "pg_size": 1})]
+
+        responses = asyncio.run(collect())
+
+        assert len(responses) == 2
+        assert responses[1]["user"]["assignedMergeRequests"]["nodes"][0]["createdAt"] == "2022-04-18T21:12:06Z"
+
+    def test_concurrency_is_bounded(self, client, monkeypatch):
+        lock = threading.Lock()
+        in_flight = [0]
+        peak = [0]
+
+        def slow_execute(query, substitutions, cursor=None):
+            with lock:
+                in_flight[0] += 1
+                peak[0] = max(peak[0], in_flight[0])
+            time.sleep(0.02)
+            with lock:
+                in_flight[0] -= 1
+            return {"user": substitutions["user"]}
+
+        monkeypatch.setattr(client, "_execute", slow_execute)
+
+        async def crawl():
+            return await asyncio.gather(*[client.execute(query="query", substitutions={"user": str(i)})
+                                          for i in range(8)])
+
+        results = asyncio.run(crawl())
+
+        assert [result["user"] for result in results] == [str(i) for i in range(8)]
+        assert peak[0] == 2
+
+    def test_iter_nodes(self, client, requests_mock):
+        requests_mock.post("https://some_url/not/enterprise", [{'json': self.mock_page},
+                                                               {'json': self.mock_last_page}])
+
+        async def collect():
+            return [node async for node in
+                    client.iter_nodes(query=UserAssignedMergeRequests(), substitutions={"user": "tester", "pg_size": 1})]
+
+        assert asyncio.run(collect()) == [{"createdAt": "2022-04-17T21:12:06Z"}, {"createdAt": "2022-04-18T21:12:06Z"}]
+
+    def test_iter_nodes_resumes_from_checkpoint(self, requests_mock, tmp_path):
+        client = MockAsyncClient(host="some_url", authenticator=PersonalAccessTokenAuthenticator(token="token"),
+                                 checkpoints=CheckpointStore(str(tmp_path)))
+        requests_mock.post("https://some_url/not/enterprise", [{'json': self.mock_page},
+                                                               *[{'json': {"error": "error"}, 'status_code': 500}] * 3,
+                                                               {'json': self.mock_last_page}])
+        substitutions = {"user": "tester", "pg_size": 1}
+
+        async def collect(**kwargs):
+            nodes = []
+            try:
+                async for node in client.iter_nodes(query=UserAssignedMergeRequests(), substitutions=substitutions,
+                                                    **kwargs):
+                    nodes.append(node)
+            except QueryFailedException:
+                pass
+            return nodes
+
+        try:
+            assert asyncio.run(collect()) == [{"createdAt": "2022-04-17T21:12:06Z"}]
+            assert asyncio.run(collect(resume=True)) == [{"createdAt": "2022-04-18T21:12:06Z"}]
+        finally:
+            client.close()
+
+        assert 'after: "cursor"' in requests_mock.last_request.json()["query"]
+        assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,91 @@
+import time
+
+import pytest
+
+from github_query.github_graphql.github_client import GitHubClient
+from github_query.model.authentication import TokenPoolAuthenticator, GitLabPersonalAccessTokenAuthenticator
+from github_query.queries.contributions.user_login import UserLogin
+from github_query.tests.helpers.mock_client import MockClient
+
+
+class TestTokenPoolAuthenticator:
+
+    def test_empty_pool(self):
+        with pytest.raises(ValueError):
+            TokenPoolAuthenticator([])
+
+    def test_header_follows_token_with_most_headroom(self):
+        pool = TokenPoolAuthenticator(["a", "b"])
+        budget = pool.create_budget()
+        budget.budgets[0].update(100, time.time() + 3600)
+        budget.budgets[1].update(4000, time.time() + 3600)
+
+        budget.acquire(1)
+
+        assert pool.get_authorization_header() == {"Authorization": "token b"}
+        assert budget.budgets[1].remaining == 3999
+
+    def test_gitlab_tokens(self):
+        pool = TokenPoolAuthenticator(["a"], authenticator_class=GitLabPersonalAccessTokenAuthenticator)
+        pool.create_budget().acquire(1)
+
+        assert pool.get_authorization_header() == {"Authorization": "Bearer a"}
+
+    def test_switches_tokens_instead_of_sleeping(self, monkeypatch):
+        slept = []
+        monkeypatch.setattr(time, "sleep", lambda seconds: slept.append(seconds))
+        pool = TokenPoolAuthenticator(["a", "b"])
+        budget = pool.create_budget()
+        budget.budgets[0].update(5, time.time() + 3600)
+        budget.budgets[1].update(5000, time.time() + 3600)
+
+        budget.acquire(10)
+
+        assert slept == []
+        assert budget.current == 1
+
+    def test_sleeps_until_earliest_reset_when_all_tokens_are_exhausted(self, monkeypatch):
+        slept = []
+        monkeypatch.setattr(time, "sleep", lambda seconds: slept.append(seconds))
+        pool = TokenPoolAuthenticator(["a", "b"])
+        budget = pool.create_budget()
+        budget.budgets[0].update(5, time.time() + 3600)
+        budget.budgets[1].update(5, time.time() + 60)
+
+        budget.acquire(1)
+
+        assert len(slept) == 1
+        assert budget.current == 1
+
+    def test_client_rotates_tokens_from_response_headers(self, requests_mock):
+        reset = str(int(time.time()) + 3600)
+        requests_mock.post("https://some_url/not/enterprise", [
+            {'json': {"data": {}}, 'headers': {"X-RateLimit-Remaining": "5", "X-RateLimit-Reset": reset}},
+            {'json': {"data": {}}, 'headers': {"X-RateLimit-Remaining": "4999", "X-RateLimit-Reset": reset}},
+            {'json': {"data": {}}, 'headers': {"X-RateLimit-Remaining": "4998", "X-RateLimit-Reset": reset}},
+        ])
+        client = MockClient(host="some_url", authenticator=TokenPoolAuthenticator(["a", "b"]))
+
+        for _ in range(3):
+            client.execute(query="query", substitutions={})
+
+        tokens = [request.headers["Authorization"] for request in requests_mock.request_history]
+        assert tokens == ["token a", "token b", "token b"]
+
+    def test_preflight_is_sent_with_the_token_of_the_request(self, requests_mock, monkeypatch):
+        monkeypatch.setattr(time, "sleep", lambda seconds: None)
+        requests_mock.post("https://api.github.com/graphql", [
+            {'json': {"data": {"rateLimit": {"cost": 1, "remaining": 4000, "resetAt": "2030-01-01T00:00:00Z"}}}},
+            {'json': {"data": {"user": {"login": "tester"}}}},
+        ])
+        client = GitHubClient(host="api.github.com", authenticator=TokenPoolAuthenticator(["a", "b"]))
+        client.budget.budgets[0].update(3, time.time() + 3600)
+        client.budget.budgets[1].update(5, time.time() + 60)
+
+        client.execute(query=UserLogin(), substitutions={"user": "tester"})
+
+        tokens = [request.headers["Authorization"] for request in requests_mock.request_history]
+        assert tokens == ["token b", "token b"]
+        assert "dryRun: true" in requests_mock.request_history[0].json()["query"]
+        assert client.budget.budgets[1].remaining == 3999
+        assert client.budget.budgets[0].remaining == 3
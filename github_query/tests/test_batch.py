@@ -0,0 +1,93 @@
+import time
+
+import pytest
+
+from github_query.model.authentication import PersonalAccessTokenAuthenticator
+from github_query.model.batch import BatchExecutor, BatchJob
+from github_query.model.client import QueryFailedException
+from github_query.model.rate_limit import RateLimitBudget
+from github_query.queries.gitlab_contributions.user_assigned_merge_requests import UserAssignedMergeRequests
+from github_query.tests.helpers.mock_client import MockClient
+
+
+class TestBatchExecutor:
+
+    mock_last_page = {
+        "data": {
+            "user": {
+                "username": "tester",
+                "assignedMergeRequests": {
+                    "count": 1,
+                    "nodes": [{"createdAt": "2022-04-17T21:12:06Z"}],
+                    "pageInfo": {"endCursor": "cursor", "hasNextPage": False}
+                }
+            }
+        }
+    }
+
+    @pytest.fixture
+    def client(self):
+        return MockClient(host="some_url", authenticator=PersonalAccessTokenAuthenticator(token="token"))
+
+    def test_execute_streams_all_results(self, client, requests_mock):
+        requests_mock.post("https://some_url/not/enterprise", json=self.mock_last_page)
+        query = UserAssignedMergeRequests()
+        jobs = [BatchJob(query, {"user": f"user{i}", "pg_size": 1}, key=i) for i in range(5)]
+
+        results = list(BatchExecutor(client, max_workers=3).execute(jobs))
+
+        assert sorted(result.job.key for result in results) == list(range(5))
+        assert all(result.ok for result in results)
+        assert all(len(result.result) == 1 for result in results)
+        assert query.paginator.has_next()
+
+    def test_execute_captures_job_errors(self, client, requests_mock):
+        requests_mock.post("https://some_url/not/enterprise", [{'json': {"data": {"someKey": "someValue"}}},
+                                                               {'json': {"error": "error"}, 'status_code': 404}])
+        jobs = [BatchJob("query", {}, key=i) for i in range(2)]
+
+        results = list(BatchExecutor(client, max_workers=1).execute(jobs))
+
+        assert [result.ok for result in results].count(True) == 1
+        failed = next(result for result in results if not result.ok)
+        assert isinstance(failed.error, QueryFailedException)
+
+
+class TestRateLimitBudget:
+
+    def test_update_from_github_headers(self):
+        budget = RateLimitBudget()
+        budget.update_from_headers({"X-RateLimit-Remaining": "42", "X-RateLimit-Reset": "1700000000"})
+
+        assert budget.remaining == 42
+        assert budget.reset_at == 1700000000
+
+    def test_update_from_gitlab_headers(self):
+        budget = RateLimitBudget()
+        budget.update_from_headers({"RateLimit-Remaining": "7", "RateLimit-Reset": "1700000000"})
+
+        assert budget.remaining == 7
+
+    def test_update_keeps_lowest_remaining_of_a_window(self):
+        budget = RateLimitBudget()
+        budget.update(10, 1700000000)
+        budget.update(12, 1700000000)
+
+        assert budget.remaining == 10
+
+    def test_acquire_reserves_points(self):
+        budget = RateLimitBudget(reserve=0)
+        budget.update(10, time.time() + 3600)
+        budget.acquire(3)
+
+        assert budget.remaining == 7
+
+    def test_acquire_waits_for_reset(self, monkeypatch):
+        slept = []
+        monkeypatch.setattr(time, "sleep", lambda seconds: slept.append(seconds))
+        budget = RateLimitBudget(reserve=5)
+        budget.update(5, time.time() + 60)
+        budget.acquire(1)
+
+        assert len(slept) == 1
+        assert budget.remaining is None
@@ -0,0 +1,106 @@
+import pytest
+
+from github_query.model.authentication import PersonalAccessTokenAuthenticator
+from github_query.model.cache import SQLiteResponseCache, CacheMissError
+from github_query.queries.contributions.user_login import UserLogin
+from github_query.queries.gitlab_contributions.user_assigned_merge_requests import UserAssignedMergeRequests
+from github_query.tests.helpers.mock_client import MockClient
+
+
+def merge_request_page(has_next_page):
+    return {"data": {"user": {
+        "username": "tester",
+        "assignedMergeRequests": {
+            "count": 2,
+            "nodes": [{"createdAt": "2022-04-17T21:12:06Z"}],
+            "pageInfo": {"endCursor": "cursor", "hasNextPage": has_next_page}
+        }
+    }}}
+
+
+class TestResponseCache:
+
+    @pytest.fixture
+    def cache(self):
+        cache = SQLiteResponseCache(path=":memory:")
+        yield cache
+        cache.close()
+
+    @pytest.fixture
+    def client(self, cache):
+        return MockClient(host="some_url", authenticator=PersonalAccessTokenAuthenticator(token="token"), cache=cache)
+
+    def test_execute_serves_repeated_query_from_cache(self, client, cache, requests_mock):
+        requests_mock.post("https://some_url/not/enterprise", json={"data": {"user": {"login": "tester"}}})
+
+        first = client.execute(query=UserLogin(), substitutions={"user": "tester"})
+        second = client.execute(query=UserLogin(), substitutions={"user": "tester"})
+
+        assert first == second == {"user": {"login": "tester"}}
+        assert requests_mock.call_count == 1
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_responses_are_not_shared_between_tokens(self, client, cache, requests_mock):
+        requests_mock.post("https://some_url/not/enterprise", json={"data": {"user": {"login": "tester"}}})
+        other = MockClient(host="some_url", authenticator=PersonalAccessTokenAuthenticator(token="other"), cache=cache)
+
+        client.execute(query=UserLogin(), substitutions={"user": "tester"})
+        other.execute(query=UserLogin(), substitutions={"user": "tester"})
+
+        assert requests_mock.call_count == 2
+        assert len(cache) == 2
+
+    def test_execute_caches_every_page(self, client, cache, requests_mock):
+        requests_mock.post("https://some_url/not/enterprise", [{'json': merge_request_page(True)},
+                                                               {'json': merge_request_page(False)}])
+        substitutions = {"user": "tester", "pg_size": 1}
+
+        first = list(client.execute(query=UserAssignedMergeRequests(), substitutions=substitutions))
+        second = list(client.execute(query=UserAssignedMergeRequests(), substitutions=substitutions))
+
+        assert first == second
+        assert requests_mock.call_count == 2
+        assert len(cache) == 2
+
+    def test_ttl_per_query_class(self, cache, requests_mock):
+        cache.ttls = {"UserLogin": 0}
+        client = MockClient(host="some_url", authenticator=PersonalAccessTokenAuthenticator(token="token"), cache=cache)
+        requests_mock.post("https://some_url/not/enterprise", json={"data": {"user": {"login": "tester"}}})
+
+        client.execute(query=UserLogin(), substitutions={"user": "tester"})
+        client.execute(query=UserLogin(), substitutions={"user": "tester"})
+
+        assert requests_mock.call_count == 2
+
+    def test_least_recently_used_entries_are_evicted(self):
+        cache = SQLiteResponseCache(path=":memory:", max_entries=2)
+        for key in ["a", "b"]:
+            cache.set(key, {"key": key}, 60)
+        cache.get("a")
+        cache.set("c", {"key": "c"}, 60)
+
+        assert len(cache) == 2
+        assert cache.get("a") == {"key": "a"}
+        assert cache.get("b") is None
+
+    def test_hits_do_not_write(self, cache):
+        cache.set("a", {"key": "a"}, 60)
+        changes = cache._connection.total_changes
+
+        for _ in range(3):
+            cache.get("a")
+
+        assert cache._connection.total_changes == changes
+
+    def test_cache_only_raises_on_miss(self, cache, client, requests_mock):
+        cache.cache_only = True
+
+        with pytest.raises(CacheMissError):
+            client.execute(query=UserLogin(), substitutions={"user": "tester"})
+        assert requests_mock.call_count == 0
+
+    def test_cache_persists_in_file(self, tmp_path):
+        path = str(tmp_path / "cache.sqlite")
+        SQLiteResponseCache(path=path).set("key", {"user": {"login": "tester"}}, 60)
+
+        assert SQLiteResponseCache(path=path).get("key") == {"user": {"login": "tester"}}
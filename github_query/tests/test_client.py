@@ -1,8 +1,18 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
 import pytest
 import requests.exceptions
 
-from github_query.model.authentication import PersonalAccessTokenAuthenticator
+from github_query.github_graphql.github_client import GitHubClient
+from github_query.gitlab_graphql.gitlab_client import GitLabClient, QueryComplexityError
+from github_query.model.authentication import PersonalAccessTokenAuthenticator, GitLabPersonalAccessTokenAuthenticator
+from github_query.model.checkpoint import CheckpointStore
 from github_query.model.client import InvalidAuthenticationError, QueryFailedException
+from github_query.queries.contributions.user_login import UserLogin
+from github_query.queries.contributions.user_repositories import UserRepositories
 from github_query.queries.gitlab_contributions.user_assigned_merge_requests import UserAssignedMergeRequests
 from github_query.queries.gitlab_contributions.user_authored_snippets import UserAuthoredSnippets 
 from github_query.queries.gitlab_contributions.user_starred_projects import UserStarredProjects
@@ -203,7 +213,7 @@ class TestClient:
                                                                {'json': self.mock_paginated_response_without_next_page}])
 
         for response in client.execute(query=UserAssignedMergeRequests(), substitutions={"user": "tester", "pg_size": 2}):
-            assert response["user"]["username"] == "tester
+            assert response["user"]["username"] == "tester"
 
     def test_execute_with_paginated_query_user_issues_contributions(self, client, requests_mock):
         requests_mock.post(
@@ -232,3 +242,327 @@ class TestClient:
                                                       
         for response in client.execute(query=UserContributedAndPersonalProjects(), substitutions={"user": "tester", "pg_size": 2}):
             assert response["user"]["username"] == "tester"
+
+    def test_client_shares_session_with_rest_client(self, client):
+        assert client.rest._session is client.session
+
+    def test_client_reuses_connection_between_pages(self):
+        responses = [self.mock_paginated_response_with_next_page, self.mock_paginated_response_without_next_page]
+        connections = []
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self):
+                self.rfile.read(int(self.headers["Content-Length"]))
+                connections.append(self.client_address)
+                body = json.dumps(responses[len(connections) - 1]).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                return
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        client = MockClient(host=f"127.0.0.1:{server.server_port}", protocol="http",
+                            authenticator=PersonalAccessTokenAuthenticator(token="token"))
+        try:
+            pages = list(client.execute(query=UserAssignedMergeRequests(), substitutions={"user": "tester", "pg_size": 2}))
+        finally:
+            client.close()
+            server.shutdown()
+            server.server_close()
+
+        assert len(pages) == 2
+        # both pages came over the same pooled keep-alive connection
+        assert connections[0] == connections[1]
+
+    def test_client_context_manager_closes_owned_session(self):
+        with MockClient(host="some_url", authenticator=PersonalAccessTokenAuthenticator(token="token")) as client:
+            session = client.session
+            closed = []
+            session.close = lambda: closed.append(True)
+        assert closed == [True]
+
+    def test_client_does_not_close_external_session(self):
+        session = requests.Session()
+        closed = []
+        session.close = lambda: closed.append(True)
+        with MockClient(host="some_url", authenticator=PersonalAccessTokenAuthenticator(token="token"), session=session):
+            pass
+        assert closed == []
+
+    def test_execute_reruns_same_paginated_query(self, client, requests_mock):
+        requests_mock.post("https://some_url/not/enterprise", [{'json': self.mock_paginated_response_with_next_page},
+                                                               {'json': self.mock_paginated_response_without_next_page},
+                                                               {'json': self.mock_paginated_response_with_next_page},
+                                                               {'json': self.mock_paginated_response_without_next_page}])
+        query = UserAssignedMergeRequests()
+        substitutions = {"user": "tester", "pg_size": 2}
+
+        assert len(list(client.execute(query=query, substitutions=substitutions))) == 2
+        assert len(list(client.execute(query=query, substitutions=substitutions))) == 2
+        assert "after" not in requests_mock.request_history[2].json()["query"].replace("after: null", "")
+
+    def test_execute_with_variables_sends_constant_document(self, requests_mock):
+        client = MockClient(host="some_url", authenticator=PersonalAccessTokenAuthenticator(token="token"),
+                            use_variables=True)
+        requests_mock.post("https://some_url/not/enterprise", [{'json': self.mock_paginated_response_with_next_page},
+                                                               {'json': self.mock_paginated_response_without_next_page}])
+
+        list(client.execute(query=UserAssignedMergeRequests(), substitutions={"user": "tester", "pg_size": 2}))
+
+        first, second = [request.json() for request in requests_mock.request_history]
+        assert first["query"] == second["query"]
+        assert first["variables"] == {"user": "tester", "pg_size": 2, "after": None}
+        assert second["variables"]["after"] == \
+            self.mock_paginated_response_with_next_page["data"]["user"]["assignedMergeRequests"]["pageInfo"]["endCursor"]
+
+
+    def test_execute_with_prefetch_fetches_next_page_ahead(self, requests_mock):
+        client = MockClient(host="some_url", authenticator=PersonalAccessTokenAuthenticator(token="token"),
+                            prefetch_depth=1)
+        requests_mock.post("https://some_url/not/enterprise", [{'json': self.mock_paginated_response_with_next_page},
+                                                               {'json': self.mock_paginated_response_without_next_page}])
+
+        pages = client.execute(query=UserAssignedMergeRequests(), substitutions={"user": "tester", "pg_size": 2})
+        first = next(pages)
+        deadline = time.time() + 1
+        while requests_mock.call_count < 2 and time.time() < deadline:
+            time.sleep(0.01)
+
+        assert requests_mock.call_count == 2
+        assert [first] + list(pages) == [self.mock_paginated_response_with_next_page["data"],
+                                         self.mock_paginated_response_without_next_page["data"]]
+
+    def test_execute_with_prefetch_raises_in_caller(self, requests_mock):
+        client = MockClient(host="some_url", authenticator=PersonalAccessTokenAuthenticator(token="token"),
+                            prefetch_depth=2)
+        requests_mock.post("https://some_url/not/enterprise", [{'json': self.mock_paginated_response_with_next_page},
+                                                               {'json': {"error": "error"}, 'status_code': 404}])
+
+        pages = client.execute(query=UserAssignedMergeRequests(), substitutions={"user": "tester", "pg_size": 2})
+
+        assert next(pages) == self.mock_paginated_response_with_next_page["data"]
+        with pytest.raises(QueryFailedException):
+            next(pages)
+
+    def test_execute_with_prefetch_stops_when_closed(self, requests_mock):
+        client = MockClient(host="some_url", authenticator=PersonalAccessTokenAuthenticator(token="token"),
+                            prefetch_depth=1)
+        requests_mock.post("https://some_url/not/enterprise", json=self.mock_paginated_response_with_next_page)
+
+        pages = client.execute(query=UserAssignedMergeRequests(), substitutions={"user": "tester", "pg_size": 2})
+        next(pages)
+        pages.close()
+        call_count = requests_mock.call_count
+        time.sleep(0.2)
+
+        assert call_count <= 2
+        assert requests_mock.call_count == call_count
+
+    def test_closing_prefetch_does_not_wait_for_rate_limit_reset(self, requests_mock):
+        client = MockClient(host="some_url", authenticator=PersonalAccessTokenAuthenticator(token="token"),
+                            prefetch_depth=1)
+        client.prefetch_join_timeout = 0.05
+        acquired = []
+        # the second page waits for the rate limit reset
+        client.budget.acquire = lambda cost: acquired.append(cost) or (len(acquired) > 1 and time.sleep(0.5))
+        requests_mock.post("https://some_url/not/enterprise", json=self.mock_paginated_response_with_next_page)
+
+        pages = client.execute(query=UserAssignedMergeRequests(), substitutions={"user": "tester", "pg_size": 2})
+        next(pages)
+        while len(acquired) < 2:
+            time.sleep(0.01)
+        started = time.perf_counter()
+        pages.close()
+        closed_in = time.perf_counter() - started
+        time.sleep(0.7)
+
+        assert closed_in < 0.3
+        assert requests_mock.call_count == 1
+
+    def test_execute_resumes_from_checkpoint(self, requests_mock, tmp_path):
+        client = MockClient(host="some_url", authenticator=PersonalAccessTokenAuthenticator(token="token"),
+                            checkpoints=CheckpointStore(str(tmp_path)))
+        requests_mock.post("https://some_url/not/enterprise", [{'json': self.mock_paginated_response_with_next_page},
+                                                               *[{'json': {"error": "error"}, 'status_code': 500}] * 3,
+                                                               {'json': self.mock_paginated_response_without_next_page}])
+        substitutions = {"user": "tester", "pg_size": 2}
+
+        pages = client.execute(query=UserAssignedMergeRequests(), substitutions=substitutions)
+        next(pages)
+        with pytest.raises(QueryFailedException):
+            next(pages)
+        resumed = list(client.execute(query=UserAssignedMergeRequests(), substitutions=substitutions, resume=True))
+
+        end_cursor = self.mock_paginated_response_with_next_page["data"]["user"]["assignedMergeRequests"]["pageInfo"]["endCursor"]
+        assert resumed == [self.mock_paginated_response_without_next_page["data"]]
+        assert f'after: "{end_cursor}"' in requests_mock.last_request.json()["query"]
+        assert list(tmp_path.iterdir()) == []
+
+    def test_checkpoints_are_not_shared_between_hosts(self, requests_mock, tmp_path):
+        store = CheckpointStore(str(tmp_path))
+        client = MockClient(host="some_url", authenticator=PersonalAccessTokenAuthenticator(token="token"),
+                            checkpoints=store)
+        other = MockClient(host="other_url", authenticator=PersonalAccessTokenAuthenticator(token="token"),
+                           checkpoints=store)
+        requests_mock.post("https://some_url/not/enterprise", json=self.mock_paginated_response_with_next_page)
+        requests_mock.post("https://other_url/not/enterprise", json=self.mock_paginated_response_without_next_page)
+        substitutions = {"user": "tester", "pg_size": 2}
+
+        pages = client.execute(query=UserAssignedMergeRequests(), substitutions=substitutions)
+        next(pages)
+        next(pages)
+        list(other.execute(query=UserAssignedMergeRequests(), substitutions=substitutions, resume=True))
+
+        assert "after: null" in requests_mock.last_request.json()["query"]
+        assert store.load(store.key(UserAssignedMergeRequests(), substitutions, client.base_path())) is not None
+
+    def test_execute_resume_requires_checkpoints(self, client):
+        with pytest.raises(ValueError):
+            client.execute(query=UserAssignedMergeRequests(), substitutions={"user": "tester", "pg_size": 2}, resume=True)
+
+    def test_iter_nodes_yields_nodes_of_every_page(self, client, requests_mock):
+        requests_mock.post("https://some_url/not/enterprise", [{'json': self.mock_paginated_response_with_next_page},
+                                                               {'json': self.mock_paginated_response_without_next_page}])
+
+        nodes = list(client.iter_nodes(query=UserAssignedMergeRequests(), substitutions={"user": "tester", "pg_size": 2}))
+
+        assert nodes == [{"createdAt": "2022-04-17T21:12:06Z"}] * 2
+
+    def test_iter_nodes_projects_fields_and_releases_pages(self, client, requests_mock):
+        page = {"data": {"user": {"repositories": {
+            "nodes": [{"name": "a", "forkCount": 1, "languages": {"totalSize": 10, "edges": [{"size": 10}]}},
+                      {"name": "b", "forkCount": 2, "languages": {"totalSize": 20, "edges": []}}],
+            "pageInfo": {"endCursor": None, "hasNextPage": False}
+        }}}}
+        requests_mock.post("https://some_url/not/enterprise", json=page)
+        substitutions = {"user": "tester", "pg_size": 2, "is_fork": False, "ownership": "OWNER",
+                         "order_by": {"field": "CREATED_AT", "direction": "ASC"}}
+        responses = []
+        original_execute = client.execute
+        client.execute = lambda *args, **kwargs: (responses.append(response) or response
+                                                  for response in original_execute(*args, **kwargs))
+
+        nodes = client.iter_nodes(query=UserRepositories(), substitutions=substitutions,
+                                  fields=["name", "languages.totalSize"])
+
+        assert next(nodes) == {"name": "a", "languages": {"totalSize": 10}}
+        assert len(responses[0]["user"]["repositories"]["nodes"]) == 1
+        assert list(nodes) == [{"name": "b", "languages": {"totalSize": 20}}]
+
+    def test_iter_nodes_decodes_streams(self, requests_mock):
+        client = MockClient(host="some_url", authenticator=PersonalAccessTokenAuthenticator(token="token"),
+                            stream_decode=True)
+        requests_mock.post("https://some_url/not/enterprise", [{'json': self.mock_paginated_response_with_next_page},
+                                                               {'json': self.mock_paginated_response_without_next_page}])
+
+        nodes = list(client.iter_nodes(query=UserAssignedMergeRequests(), substitutions={"user": "tester", "pg_size": 2}))
+
+        end_cursor = self.mock_paginated_response_with_next_page["data"]["user"]["assignedMergeRequests"]["pageInfo"]["endCursor"]
+        assert nodes == [{"createdAt": "2022-04-17T21:12:06Z"}] * 2
+        assert f'after: "{end_cursor}"' in requests_mock.last_request.json()["query"]
+
+    def test_iter_nodes_decoding_streams_raises_on_errors(self, requests_mock):
+        client = MockClient(host="some_url", authenticator=PersonalAccessTokenAuthenticator(token="token"),
+                            stream_decode=True)
+        requests_mock.post("https://some_url/not/enterprise", json={"errors": [{"message": "boom"}], "data": None})
+
+        with pytest.raises(QueryFailedException):
+            list(client.iter_nodes(query=UserAssignedMergeRequests(), substitutions={"user": "tester", "pg_size": 2}))
+
+class TestGitHubClient:
+
+    @pytest.fixture
+    def client(self):
+        return GitHubClient(host="api.github.com", authenticator=PersonalAccessTokenAuthenticator(token="token"))
+
+    def test_execute_tracks_budget_without_dry_run(self, client, requests_mock):
+        requests_mock.post("https://api.github.com/graphql", json={
+            "data": {
+                "user": {"login": "tester"},
+                "rateLimitBudget": {"cost": 1, "remaining": 4999, "resetAt": "2030-01-01T00:00:00Z"}
+            }
+        })
+
+        result = client.execute(query=UserLogin(), substitutions={"user": "tester"})
+
+        assert requests_mock.call_count == 1
+        assert "rateLimitBudget: rateLimit { cost remaining resetAt }" in requests_mock.last_request.json()["query"]
+        assert result == {"user": {"login": "tester"}}
+        assert client.budget.remaining == 4999
+
+    def test_execute_preflights_only_when_budget_is_short(self, client, requests_mock, monkeypatch):
+        monkeypatch.setattr(time, "sleep", lambda seconds: None)
+        requests_mock.post("https://api.github.com/graphql", [
+            {'json': {"data": {"rateLimit": {"cost": 1, "remaining": 3, "resetAt": "2030-01-01T00:00:00Z"}}}},
+            {'json': {"data": {
+                "user": {"login": "tester"},
+                "rateLimitBudget": {"cost": 1, "remaining": 4999, "resetAt": "2030-01-01T01:00:00Z"}
+            }}}
+        ])
+        client.budget.update(3, 1893456000)
+
+        client.execute(query=UserLogin(), substitutions={"user": "tester"})
+
+        assert requests_mock.call_count == 2
+        assert "dryRun: true" in requests_mock.request_history[0].json()["query"]
+        assert client.budget.remaining == 4999
+
+
+class TestGitLabClient:
+
+    @pytest.fixture
+    def client(self):
+        return GitLabClient(host="gitlab.com", authenticator=GitLabPersonalAccessTokenAuthenticator(token="token"))
+
+    def test_execute_sends_a_single_request(self, client, requests_mock):
+        requests_mock.post("https://gitlab.com/api/graphql", json={"data": {"user": {"username": "tester"}}})
+
+        client.execute(query=UserLogin(), substitutions={"user": "tester"})
+
+        assert requests_mock.call_count == 1
+
+    def test_execute_raises_query_complexity_error(self, client, requests_mock):
+        requests_mock.post("https://gitlab.com/api/graphql", json={
+            "errors": [{"message": "Query has complexity of 300, which exceeds max complexity of 250"}]
+        })
+
+        with pytest.raises(QueryComplexityError):
+            client.execute(query=UserLogin(), substitutions={"user": "tester"})
+
+
+    def test_execute_splits_query_over_complexity_limit(self, client, requests_mock):
+        def respond(request, context):
+            query = request.json()["query"]
+            projects = {"pageInfo": {"endCursor": "cursor", "hasNextPage": "cursor" not in query}, "nodes": [
+                {"project": dict({"id": "1"}, **({"name": "project"} if " name " in query else {}),
+                                 **({"languages": [{"name": "Go", "share": 100.0}]} if "languages" in query else {}))}
+            ]}
+            user = {"projectMemberships": projects} if "projectMemberships" in query else {"username": "tester"}
+            return {"data": {"user": user}}
+
+        requests_mock.post("https://gitlab.com/api/graphql", json=respond)
+        client.complexity_limit = 12
+
+        pages = list(client.execute(query=UserContributedAndPersonalProjects(),
+                                    substitutions={"user": "tester", "pg_size": 10}))
+
+        assert len(pages) == 2
+        assert requests_mock.call_count == 6
+        assert pages[0]["user"]["username"] == "tester"
+        assert pages[1]["user"]["projectMemberships"]["nodes"] == [
+            {"project": {"id": "1", "name": "project", "languages": [{"name": "Go", "share": 100.0}]}}
+        ]
+
+    def test_execute_raises_when_splitting_is_disabled(self, client):
+        client.complexity_limit = 12
+        client.split_complex_queries = False
+
+        with pytest.raises(QueryComplexityError):
+            list(client.execute(query=UserContributedAndPersonalProjects(), substitutions={"user": "tester", "pg_size": 10}))
@@ -0,0 +1,64 @@
+import pytest
+
+from github_query.model.query import Query, QueryNode
+from github_query.queries.contributions.user_login import UserLogin
+from github_query.queries.contributions.user_repositories import UserRepositories
+from github_query.queries.gitlab_contributions.user_assigned_merge_requests import UserAssignedMergeRequests
+from github_query.queries.utils.cost_estimate import estimate_github_cost, estimate_gitlab_complexity, \
+    estimate_crawl_cost
+from github_query.queries.utils.rate_limit import RateLimit
+
+
+class TestCostEstimate:
+
+    repository_substitutions = {"user": "tester", "pg_size": 100, "is_fork": True, "ownership": "OWNER",
+                                "order_by": {"field": "CREATED_AT", "direction": "ASC"}}
+
+    # (query, substitutions, cost reported by GitHub's rateLimit)
+    github_recorded = [
+        (RateLimit(), {"dryrun": True}, 1),
+        (UserLogin(), {"user": "tester"}, 1),
+        (UserRepositories(), repository_substitutions, 1),
+    ]
+
+    @pytest.mark.parametrize("query, substitutions, cost", github_recorded)
+    def test_github_cost_matches_recorded_responses(self, query, substitutions, cost):
+        assert estimate_github_cost(query, substitutions) == cost
+
+    def test_github_cost_of_nested_connections(self):
+        query = Query(fields=[
+            QueryNode("repository", fields=[
+                QueryNode("issues", args={"first": 100}, fields=[
+                    QueryNode("nodes", fields=[
+                        QueryNode("labels", args={"first": 50}, fields=["totalCount"])
+                    ])
+                ])
+            ])
+        ])
+
+        # 1 request for the issues and 100 for their labels
+        assert estimate_github_cost(query, {}) == 1
+
+        query.fields[0].fields[0].fields[0].fields[0].args["first"] = 300
+        # 1 + 100 requests for the labels pages, rounded
+        assert estimate_github_cost(query, {}) == 1
+        query.fields[0].fields[0].args["first"] = "$pg_size"
+        assert estimate_github_cost(query, {"pg_size": 250}) == 3
+
+    def test_gitlab_complexity_matches_recorded_response(self):
+        # the recorded score of 13 includes the queryComplexity { limit score } selection
+        query = UserAssignedMergeRequests()
+        query.fields.append(QueryNode("queryComplexity", fields=["limit", "score"]))
+
+        assert estimate_gitlab_complexity(query, {"user": "tester", "pg_size": 2}) == 13
+
+    def test_gitlab_complexity_grows_with_page_size(self):
+        small = estimate_gitlab_complexity(UserAssignedMergeRequests(), {"user": "tester", "pg_size": 2})
+        large = estimate_gitlab_complexity(UserAssignedMergeRequests(), {"user": "tester", "pg_size": 100})
+
+        assert large > small
+
+    def test_crawl_cost(self):
+        substitutions = dict(self.repository_substitutions, pg_size=50)
+
+        assert estimate_crawl_cost(UserRepositories(), substitutions, total_count=120) == 3
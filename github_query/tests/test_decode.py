@@ -0,0 +1,68 @@
+import json
+
+import pytest
+
+from github_query.model.decode import StreamingDecoder, loads
+
+
+def decode(body: bytes, path: list, chunk_size: int):
+    decoder = StreamingDecoder(path)
+    nodes = []
+    for start in range(0, len(body), chunk_size):
+        nodes.extend(decoder.feed(body[start:start + chunk_size]))
+    nodes.extend(decoder.feed(b"", final=True))
+    return nodes, decoder.result
+
+
+class TestStreamingDecoder:
+
+    response = {"data": {
+        "rateLimitBudget": {"cost": 1, "remaining": 4999},
+        "user": {"login": "tester", "repositories": {
+            "totalCount": 12345,
+            "nodes": [
+                {"name": "a", "stargazerCount": 120, "languages": {"nodes": [{"name": "Go"}], "totalSize": 1000}},
+                {"name": "bé", "stargazerCount": 7, "languages": {"nodes": [], "totalSize": 0}},
+            ],
+            "pageInfo": {"endCursor": "Y3Vyc29y", "hasNextPage": True},
+        }},
+    }}
+    path = ["data", "user", "repositories"]
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 7, 64, 1 << 20])
+    def test_yields_nodes_and_keeps_envelope(self, chunk_size):
+        body = json.dumps(self.response, indent=1, ensure_ascii=False).encode()
+
+        nodes, result = decode(body, self.path, chunk_size)
+
+        assert nodes == self.response["data"]["user"]["repositories"]["nodes"]
+        connection = result["data"]["user"]["repositories"]
+        assert connection["nodes"] == []
+        assert connection["pageInfo"] == {"endCursor": "Y3Vyc29y", "hasNextPage": True}
+        assert connection["totalCount"] == 12345
+        assert result["data"]["rateLimitBudget"] == {"cost": 1, "remaining": 4999}
+
+    def test_streams_edges(self):
+        body = json.dumps({"data": {"search": {"edges": [{"node": {"id": "1"}}], "pageInfo": {}}}}).encode()
+
+        nodes, result = decode(body, ["data", "search"], 3)
+
+        assert nodes == [{"node": {"id": "1"}}]
+        assert result["data"]["search"]["edges"] == []
+
+    def test_keeps_errors_and_null_data(self):
+        body = json.dumps({"errors": [{"message": "boom"}], "data": {"user": None}}).encode()
+
+        nodes, result = decode(body, self.path, 5)
+
+        assert nodes == []
+        assert result == {"errors": [{"message": "boom"}], "data": {"user": None}}
+
+    def test_raises_on_truncated_body(self):
+        body = json.dumps(self.response).encode()[:-10]
+
+        with pytest.raises(ValueError):
+            decode(body, self.path, 16)
+
+    def test_loads_decodes_bytes(self):
+        assert loads(b'{"data": {"a": [1, 2.5, null]}}') == {"data": {"a": [1, 2.5, None]}}
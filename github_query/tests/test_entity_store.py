@@ -0,0 +1,97 @@
+import pytest
+
+from github_query.model.authentication import PersonalAccessTokenAuthenticator
+from github_query.model.entity_store import EntityStore
+from github_query.queries.gitlab_contributions.projects_by_ids import ProjectsByIds
+from github_query.queries.gitlab_contributions.user_starred_projects import UserStarredProjects
+from github_query.tests.helpers.mock_client import MockClient
+
+
+def project(number, **fields):
+    return dict({"id": f"gid://gitlab/Project/{number}"}, **fields)
+
+
+def starred_page(username, projects):
+    return {"data": {"user": {"username": username, "starredProjects": {
+        "nodes": projects, "pageInfo": {"endCursor": None, "hasNextPage": False}
+    }}}}
+
+
+class TestEntityStore:
+
+    @pytest.fixture
+    def store(self):
+        return EntityStore()
+
+    def test_ingest_shares_nodes_across_responses(self, store):
+        first = store.ingest({"nodes": [project(1, name="a", languages=[{"name": "Go", "share": 100.0}])]})
+        second = store.ingest({"nodes": [project(1, name="a")]})
+
+        assert first["nodes"][0] is second["nodes"][0]
+        assert second["nodes"][0]["languages"] == [{"name": "Go", "share": 100.0}]
+        assert len(store) == 1
+
+    def test_hydrate_fills_id_only_nodes(self, store):
+        store.ingest({"nodes": [project(1, name="a")]})
+
+        hydrated = store.hydrate({"nodes": [project(1), project(2)]})
+
+        assert hydrated["nodes"] == [project(1, name="a"), project(2)]
+        assert "gid://gitlab/Project/2" not in store
+
+    def test_hydrate_does_not_share_stored_fields(self, store):
+        store.ingest({"nodes": [project(1, name="a", languages=[{"name": "Go", "share": 100.0}])]})
+
+        hydrated = store.hydrate({"nodes": [project(1)]})
+        hydrated["nodes"][0]["languages"].append({"name": "C", "share": 0.0})
+        hydrated["nodes"][0]["languages"][0]["share"] = 0.0
+
+        assert store.hydrate(project(1))["languages"] == [{"name": "Go", "share": 100.0}]
+
+    def test_missing_returns_unknown_ids_once(self, store):
+        store.ingest(project(1, name="a"))
+
+        ids = [project(n)["id"] for n in (1, 2, 2, 3)]
+
+        assert store.missing(ids) == ["gid://gitlab/Project/2", "gid://gitlab/Project/3"]
+
+    def test_client_normalizes_responses(self, store, requests_mock):
+        client = MockClient(host="some_url", authenticator=PersonalAccessTokenAuthenticator(token="token"),
+                            entity_store=store)
+        requests_mock.post("https://some_url/not/enterprise", [
+            {'json': starred_page("alice", [project(1, name="a")])},
+            {'json': starred_page("bob", [project(1, name="a"), project(2, name="b")])},
+        ])
+
+        alice = list(client.execute(query=UserStarredProjects(), substitutions={"user": "alice", "pg_size": 10}))
+        bob = list(client.execute(query=UserStarredProjects(), substitutions={"user": "bob", "pg_size": 10}))
+
+        assert alice[0]["user"]["starredProjects"]["nodes"][0] is bob[0]["user"]["starredProjects"]["nodes"][0]
+        assert len(store) == 2
+
+    def test_fetch_missing_queries_only_unknown_ids(self, store, requests_mock):
+        client = MockClient(host="some_url", authenticator=PersonalAccessTokenAuthenticator(token="token"))
+        store.ingest(project(1, name="a"))
+        requests_mock.post("https://some_url/not/enterprise", json={"data": {"projects": {
+            "nodes": [project(2, name="b")], "pageInfo": {"endCursor": None, "hasNextPage": False}
+        }}})
+
+        fetched = store.fetch_missing(client, ProjectsByIds(), [project(1)["id"], project(2)["id"]], {"pg_size": 50})
+
+        assert fetched == 1
+        assert 'ids: ["gid://gitlab/Project/2"]' in requests_mock.last_request.json()["query"]
+        assert store.get("gid://gitlab/Project/2") == project(2, name="b")
+
+    def test_iter_nodes_does_not_share_stored_nodes(self, store, requests_mock):
+        client = MockClient(host="some_url", authenticator=PersonalAccessTokenAuthenticator(token="token"),
+                            entity_store=store)
+        page = starred_page("alice", [project(1, name="a"), project(2, name="b")])
+        user = {"id": "gid://gitlab/User/1"}
+        page["data"]["user"].update(user)
+        requests_mock.post("https://some_url/not/enterprise", [{'json': page}])
+
+        for node in client.iter_nodes(query=UserStarredProjects(), substitutions={"user": "alice", "pg_size": 10}):
+            node["name"] = "changed"
+
+        assert store.hydrate([project(1), project(2)]) == [project(1, name="a"), project(2, name="b")]
+        assert len(store.hydrate(user)["starredProjects"]["nodes"]) == 2
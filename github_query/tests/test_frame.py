@@ -0,0 +1,59 @@
+import pandas as pd
+import pytest
+
+from github_query.model.authentication import PersonalAccessTokenAuthenticator
+from github_query.queries.contributions.user_repositories import UserRepositories
+from github_query.tests.helpers.mock_client import MockClient
+from github_query.util.frame import to_frame
+
+
+def repository(name, created_at, edges):
+    return {"name": name, "createdAt": created_at, "forkCount": 1, "watchers": {"totalCount": 2},
+            "languages": {"totalSize": sum(edge["size"] for edge in edges), "edges": edges}}
+
+
+def page(nodes, end_cursor, has_next_page):
+    return {"data": {"user": {"repositories": {
+        "nodes": nodes, "pageInfo": {"endCursor": end_cursor, "hasNextPage": has_next_page}
+    }}}}
+
+
+class TestToFrame:
+
+    substitutions = {"user": "tester", "pg_size": 2, "is_fork": False, "ownership": "OWNER",
+                     "order_by": {"field": "CREATED_AT", "direction": "ASC"}}
+
+    @pytest.fixture
+    def client(self):
+        return MockClient(host="some_url", authenticator=PersonalAccessTokenAuthenticator(token="token"))
+
+    @pytest.mark.parametrize("chunk_size", [1, 10000])
+    def test_flattens_pages_into_tables(self, client, requests_mock, chunk_size):
+        requests_mock.post("https://some_url/not/enterprise", [
+            {'json': page([repository("a", "2021-01-01T00:00:00Z", [{"size": 7, "node": {"name": "Go"}},
+                                                                    {"size": 3, "node": {"name": "C"}}])],
+                          "cursor", True)},
+            {'json': page([repository("b", "2022-01-01T00:00:00Z", [{"size": 5, "node": {"name": "Go"}}])],
+                          None, False)},
+        ])
+        query = UserRepositories()
+
+        frames = to_frame(client.execute(query, self.substitutions), query, self.substitutions, chunk_size=chunk_size)
+
+        assert frames.nodes["name"].tolist() == ["a", "b"]
+        assert frames.nodes["watchers.totalCount"].tolist() == [2, 2]
+        assert frames.nodes["createdAt"].dtype == "datetime64[ns, UTC]"
+        edges = frames["languages.edges"]
+        assert edges["_parent"].tolist() == [0, 0, 1]
+        assert edges.groupby("node.name")["size"].sum().to_dict() == {"C": 3, "Go": 12}
+
+    def test_accepts_nodes_and_scalar_lists(self):
+        frames = to_frame(iter([{"name": "a", "topics": ["x", "y"], "closedAt": None}]), time_columns=["closedAt"])
+
+        assert frames["topics"].to_dict("list") == {"_parent": [0, 0], "value": ["x", "y"]}
+        assert pd.isna(frames.nodes["closedAt"][0])
+
+    def test_empty_run(self):
+        frames = to_frame(iter([]))
+
+        assert frames.nodes.empty and frames.children == {}
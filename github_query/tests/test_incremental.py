@@ -0,0 +1,87 @@
+import pytest
+
+from github_query.model.authentication import PersonalAccessTokenAuthenticator
+from github_query.model.incremental import IncrementalSync, SyncStore, ResumeCursor, NewestFirst, SinceFilter
+from github_query.queries.contributions.user_pull_requests import UserPullRequests
+from github_query.queries.gitlab_contributions.user_authored_merge_requests import UserAuthoredMergeRequests
+from github_query.queries.gitlab_contributions.user_issues_contribution import UserIssuesContributions
+from github_query.tests.helpers.mock_client import MockClient
+
+
+def pull_request_page(dates, end_cursor, has_next_page=False):
+    return {"json": {"data": {"user": {"login": "tester", "pullRequests": {
+        "totalCount": len(dates),
+        "nodes": [{"createdAt": date} for date in dates],
+        "pageInfo": {"endCursor": end_cursor, "hasNextPage": has_next_page}
+    }}}}}
+
+
+def merge_request_page(dates, has_next_page=False):
+    return {"json": {"data": {"user": {"username": "tester", "authoredMergeRequests": {
+        "count": len(dates),
+        "nodes": [{"createdAt": date} for date in dates],
+        "pageInfo": {"endCursor": "cursor", "hasNextPage": has_next_page}
+    }}}}}
+
+
+class TestIncrementalSync:
+
+    @pytest.fixture
+    def store(self):
+        store = SyncStore(path=":memory:")
+        yield store
+        store.close()
+
+    @pytest.fixture
+    def sync(self, store):
+        client = MockClient(host="some_url", authenticator=PersonalAccessTokenAuthenticator(token="token"))
+        return IncrementalSync(client, store)
+
+    def test_resume_cursor_continues_after_stored_cursor(self, sync, store, requests_mock):
+        requests_mock.post("https://some_url/not/enterprise", [
+            pull_request_page(["2022-01-01T00:00:00Z", "2022-02-01T00:00:00Z"], "c1"),
+            pull_request_page(["2022-03-01T00:00:00Z"], "c2"),
+        ])
+        substitutions = {"user": "tester", "pg_size": 10}
+
+        sync.sync(UserPullRequests(), substitutions, ResumeCursor())
+        nodes, fetched = sync.sync(UserPullRequests(), substitutions, ResumeCursor())
+
+        assert 'after: "c1"' in requests_mock.last_request.json()["query"]
+        assert fetched == 1
+        assert [node["createdAt"][5:7] for node in nodes] == ["01", "02", "03"]
+        assert store.load("https://some_url/not/enterprise|tester|UserPullRequests")[:2] == ("2022-03-01T00:00:00Z", "c2")
+
+    def test_newest_first_stops_before_watermark(self, sync, requests_mock):
+        requests_mock.post("https://some_url/not/enterprise", [
+            merge_request_page(["2022-02-01T00:00:00Z", "2022-01-01T00:00:00Z"]),
+            # a second node was created in the second of the watermark after the first run
+            merge_request_page(["2022-03-01T00:00:00Z", "2022-02-01T00:00:00Z", "2022-02-01T00:00:00Z",
+                                "2022-01-01T00:00:00Z"], has_next_page=True),
+        ])
+        substitutions = {"user": "tester", "pg_size": 4}
+
+        sync.sync(UserAuthoredMergeRequests(), substitutions, NewestFirst())
+        nodes, fetched = sync.sync(UserAuthoredMergeRequests(), substitutions, NewestFirst())
+
+        assert requests_mock.call_count == 2
+        assert fetched == 3
+        assert [node["createdAt"][5:7] for node in nodes] == ["03", "02", "02", "01"]
+
+    def test_since_filter_sends_watermark_and_replaces_updated_nodes(self, sync, requests_mock):
+        def issues(nodes):
+            return {"json": {"data": {"issues": {"nodes": nodes,
+                                                 "pageInfo": {"endCursor": None, "hasNextPage": False}}}}}
+
+        requests_mock.post("https://some_url/not/enterprise", [
+            issues([{"id": "1", "state": "opened", "updatedAt": "2022-01-01T00:00:00Z"},
+                    {"id": "2", "state": "opened", "updatedAt": "2022-01-02T00:00:00Z"}]),
+            issues([{"id": "1", "state": "closed", "updatedAt": "2022-02-01T00:00:00Z"}]),
+        ])
+        substitutions = {"user": "tester", "pg_size": 10}
+
+        sync.sync(UserIssuesContributions(), substitutions, SinceFilter())
+        nodes, _ = sync.sync(UserIssuesContributions(), substitutions, SinceFilter())
+
+        assert 'updatedAfter: "2022-01-02T00:00:00Z"' in requests_mock.last_request.json()["query"]
+        assert [(node["id"], node["state"]) for node in nodes] == [("2", "opened"), ("1", "closed")]
@@ -0,0 +1,108 @@
+import warnings
+
+import numpy as np
+import pytest
+
+from github_query.model.authentication import GitLabPersonalAccessTokenAuthenticator
+from github_query.queries.gitlab_contributions.user_contributed_and_personal_projects import \
+    UserContributedAndPersonalProjects
+from github_query.queries.gitlab_contributions.user_starred_projects import UserStarredProjects
+from github_query.tests.helpers.mock_client import MockClient
+from github_query.util.language_profile import LanguageProfileBuilder, language_profiles, page_projects
+
+
+def project(number, star_count=0, **shares):
+    return {"id": f"gid://gitlab/Project/{number}", "name": f"p{number}", "starCount": star_count,
+            "languages": [{"name": name, "share": share} for name, share in shares.items()]}
+
+
+def starred(*projects):
+    return {"user": {"username": "u", "starredProjects": {"nodes": list(projects)}}}
+
+
+def member(*projects):
+    return {"user": {"username": "u", "projectMemberships": {"nodes": [{"project": p} for p in projects]}}}
+
+
+class TestLanguageProfiles:
+
+    @pytest.fixture
+    def profiles(self):
+        return language_profiles({
+            "alice": [starred(project(1, Go=50, C=50), project(2, Go=100)), member(project(1, Go=50, C=50))],
+            "bob": [member(project(3, Python=100))],
+            "carol": [starred(project(4, Go=80, Python=20))],
+            "dave": [{"user": None}],
+        })
+
+    def test_page_projects(self):
+        assert page_projects(member(project(1))) == [project(1)]
+        assert page_projects({"user": None}) == []
+
+    def test_dedupes_projects_across_queries(self, profiles):
+        assert profiles.languages == ["Go", "C", "Python"]
+        assert profiles.vector("alice").tolist() == [1.5, 0.5, 0.0]
+        assert profiles.vector("dave").tolist() == [0.0, 0.0, 0.0]
+
+    def test_weights_by_project_field(self):
+        profiles = language_profiles({"alice": [starred(project(1, 3, Go=50, C=50), project(2, 1, Go=100))]},
+                                     weight="starCount")
+
+        assert profiles.top_languages("alice") == [("Go", 2.5), ("C", 1.5)]
+
+    def test_zero_weight_projects_add_nothing(self):
+        profiles = language_profiles({"alice": [starred(project(1, 0, C=100))],
+                                      "bob": [starred(project(2, 0, Go=100), project(3, 2, C=100))]},
+                                     weight="starCount")
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            cohort = profiles.cohort_languages(5)
+
+        assert profiles.languages == ["C"]
+        assert profiles.vector("alice").tolist() == [0.0]
+        assert cohort == [("C", 1.0)]
+
+    def test_builds_from_executed_queries(self, requests_mock):
+        client = MockClient(host="some_url", authenticator=GitLabPersonalAccessTokenAuthenticator(token="token"))
+        page_info = {"endCursor": "cursor", "hasNextPage": False}
+        go = {"id": "gid://gitlab/Project/1", "name": "p1", "starCount": 4, "forksCount": 1,
+              "languages": [{"name": "Go", "share": 75.0}, {"name": "C", "share": 25.0}]}
+        python = {"id": "gid://gitlab/Project/2", "name": "p2", "starCount": 0, "forksCount": 0,
+                  "languages": [{"name": "Python", "share": 100.0}]}
+        requests_mock.post("https://some_url/not/enterprise", [
+            {"json": {"data": {"user": {"username": "alice",
+                                        "starredProjects": {"nodes": [go, python], "pageInfo": page_info}}}}},
+            {"json": {"data": {"user": {"username": "alice",
+                                        "projectMemberships": {"nodes": [{"project": go}], "pageInfo": page_info}}}}},
+        ])
+        substitutions = {"user": "alice", "pg_size": 10}
+
+        pages = [*client.execute(query=UserStarredProjects(), substitutions=substitutions),
+                 *client.execute(query=UserContributedAndPersonalProjects(), substitutions=substitutions)]
+        profiles = language_profiles({"alice": pages}, weight="starCount")
+
+        assert all("starCount" in request.json()["query"] for request in requests_mock.request_history)
+        assert profiles.top_languages("alice") == [("Go", 3.0), ("C", 1.0)]
+
+    def test_cohort_queries(self, profiles):
+        assert [language for language, _ in profiles.cohort_languages(2)] == ["Go", "Python"]
+        assert profiles.cohort_languages(1, normalize=False) == [("Go", pytest.approx(2.3))]
+        assert [user for user, _ in profiles.top_users("Python", 5)] == ["bob", "carol"]
+
+    def test_similar_users(self, profiles):
+        similar = profiles.similar_users("carol", 2)
+
+        assert [user for user, _ in similar] == ["alice", "bob"]
+        expected = np.dot([0.8, 0, 0.2], [1.5, 0.5, 0]) / np.linalg.norm([0.8, 0, 0.2]) / np.linalg.norm([1.5, 0.5, 0])
+        assert similar[0][1] == pytest.approx(expected, rel=1e-6)
+        assert profiles.similarities("dave").tolist() == [0.0] * 4
+
+    def test_builder_is_incremental(self):
+        builder = LanguageProfileBuilder()
+        builder.add("alice", [starred(project(1, Go=100))])
+        first = builder.build()
+        builder.add("bob", [starred(project(2, Rust=100))])
+
+        assert len(first) == 1 and len(builder.build()) == 2
+        assert builder.build().languages == ["Go", "Rust"]
@@ -0,0 +1,127 @@
+import time
+
+from github_query.gitlab_graphql.gitlab_client import GitLabClient
+from github_query.model.authentication import GitLabPersonalAccessTokenAuthenticator
+from github_query.model.page_size import AdaptivePageSize
+from github_query.queries.gitlab_contributions.user_assigned_merge_requests import UserAssignedMergeRequests
+from github_query.queries.gitlab_contributions.user_contributed_and_personal_projects import \
+    UserContributedAndPersonalProjects
+
+
+def merge_request_page(has_next_page):
+    return {"data": {"user": {
+        "username": "tester",
+        "assignedMergeRequests": {
+            "count": 2,
+            "nodes": [{"createdAt": "2022-04-17T21:12:06Z"}],
+            "pageInfo": {"endCursor": "cursor", "hasNextPage": has_next_page}
+        }
+    }}}
+
+
+class TestAdaptivePageSize:
+
+    def test_size_starts_from_substitutions(self):
+        page_size = AdaptivePageSize()
+
+        assert page_size.size(UserAssignedMergeRequests(), {"pg_size": 5}) == 5
+
+    def test_record_grows_with_headroom_and_shrinks_when_slow(self):
+        query = UserAssignedMergeRequests()
+        page_size = AdaptivePageSize(target_latency=1.0)
+        page_size.size(query, {"pg_size": 10})
+
+        page_size.record(query, 10, latency=0.1)
+        assert page_size.size(query, {}) == 20
+
+        page_size.record(query, 20, latency=1.6)
+        assert page_size.size(query, {}) == 12
+
+    def test_record_follows_target_cost(self):
+        query = UserAssignedMergeRequests()
+        page_size = AdaptivePageSize(target_latency=10.0)
+        page_size.size(query, {"pg_size": 10})
+
+        page_size.record(query, 10, latency=0.1, cost=200, target_cost=100)
+
+        assert page_size.size(query, {}) == 5
+
+    def test_shrink_stops_at_min_size(self):
+        query = UserAssignedMergeRequests()
+        page_size = AdaptivePageSize(min_size=2)
+        page_size.size(query, {"pg_size": 4})
+
+        assert page_size.shrink(query)
+        assert not page_size.shrink(query)
+
+    def test_best_size_is_remembered_between_runs(self, tmp_path):
+        path = str(tmp_path / "page_sizes.json")
+        query = UserAssignedMergeRequests()
+        page_size = AdaptivePageSize(path=path)
+        page_size.size(query, {"pg_size": 40})
+        page_size.record(query, 40, latency=1.5)
+
+        assert AdaptivePageSize(path=path).size(query, {"pg_size": 2}) == 40
+
+    def test_client_shrinks_page_on_complexity_error(self, requests_mock):
+        client = GitLabClient(host="gitlab.com", authenticator=GitLabPersonalAccessTokenAuthenticator(token="token"),
+                              page_size=AdaptivePageSize(target_latency=60))
+        client.split_complex_queries = False
+        requests_mock.post("https://gitlab.com/api/graphql", [
+            {'json': {"errors": [{"message": "Query has complexity of 300, which exceeds max complexity of 250"}]}},
+            {'json': merge_request_page(True)},
+            {'json': merge_request_page(False)},
+        ])
+
+        pages = list(client.execute(query=UserAssignedMergeRequests(), substitutions={"user": "tester", "pg_size": 8}))
+
+        sizes = [request.json()["query"].split("first: ")[1].split(",")[0] for request in requests_mock.request_history]
+        assert len(pages) == 2
+        assert sizes == ["8", "4", "8"]
+
+    def test_client_shrinks_page_before_splitting(self, requests_mock):
+        client = GitLabClient(host="gitlab.com", authenticator=GitLabPersonalAccessTokenAuthenticator(token="token"),
+                              page_size=AdaptivePageSize(target_latency=60))
+        # the estimate grows with pg_size: 28 at 100, 22 at 50 and 19 at 25
+        client.complexity_limit = 20
+        requests_mock.post("https://gitlab.com/api/graphql", json={"data": {"user": {
+            "username": "tester",
+            "projectMemberships": {"nodes": [], "pageInfo": {"endCursor": None, "hasNextPage": False}}
+        }}})
+
+        pages = list(client.execute(query=UserContributedAndPersonalProjects(),
+                                    substitutions={"user": "tester", "pg_size": 100}))
+
+        assert len(pages) == 1
+        assert [request.json()["query"].count("first: 25") for request in requests_mock.request_history] == [1]
+
+    def test_client_splits_page_at_min_size(self, requests_mock):
+        client = GitLabClient(host="gitlab.com", authenticator=GitLabPersonalAccessTokenAuthenticator(token="token"),
+                              page_size=AdaptivePageSize(min_size=50, target_latency=60))
+        client.complexity_limit = 20
+        requests_mock.post("https://gitlab.com/api/graphql", json={"data": {"user": {
+            "username": "tester",
+            "projectMemberships": {"nodes": [], "pageInfo": {"endCursor": None, "hasNextPage": False}}
+        }}})
+
+        list(client.execute(query=UserContributedAndPersonalProjects(), substitutions={"user": "tester", "pg_size": 100}))
+
+        queries = [request.json()["query"] for request in requests_mock.request_history]
+        assert len(queries) > 1
+        assert all("first: 50" in query for query in queries if "projectMemberships" in query)
+
+    def test_client_records_round_trip_latency_without_budget_waits(self, requests_mock):
+        page_size = AdaptivePageSize(target_latency=60)
+        latencies = []
+        record = page_size.record
+        page_size.record = lambda query, size, latency, *args: latencies.append(latency) or record(
+            query, size, latency, *args)
+        client = GitLabClient(host="gitlab.com", authenticator=GitLabPersonalAccessTokenAuthenticator(token="token"),
+                              page_size=page_size)
+        client.budget.acquire = lambda cost: time.sleep(0.2)
+        requests_mock.post("https://gitlab.com/api/graphql", json=merge_request_page(False))
+
+        list(client.execute(query=UserAssignedMergeRequests(), substitutions={"user": "tester", "pg_size": 8}))
+
+        assert len(latencies) == 1
+        assert latencies[0] < 0.1
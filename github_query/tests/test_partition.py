@@ -0,0 +1,117 @@
+import re
+from datetime import datetime, timedelta
+
+import pytest
+
+from github_query.model.authentication import PersonalAccessTokenAuthenticator
+from github_query.model.partition import PartitionedCrawler, CreatedAtWindow, SearchQualifierWindow
+from github_query.model.query import QueryNode, PaginatedQuery, QueryNodePaginator
+from github_query.queries.gitlab_contributions.user_issues_contribution import UserIssuesContributions
+from github_query.tests.helpers.mock_client import MockClient
+
+
+class SearchPullRequests(PaginatedQuery):
+
+    def __init__(self):
+        super().__init__(
+            fields=[
+                QueryNodePaginator(
+                    "search",
+                    args={"query": "\"author:$user is:pr\"", "type": "ISSUE", "first": "$pg_size"},
+                    fields=[
+                        QueryNode("nodes", fields=["... on PullRequest { createdAt }"]),
+                        QueryNode("pageInfo", fields=["endCursor", "hasNextPage"])
+                    ]
+                )
+            ]
+        )
+
+
+def issues_page(month, has_next_page, count=2):
+    return {"data": {"issues": {
+        "nodes": [{"createdAt": f"2022-{month:02d}-01T00:00:00Z"}] * count,
+        "pageInfo": {"endCursor": f"{month}_cursor", "hasNextPage": has_next_page}
+    }}}
+
+
+def stamp(time):
+    return datetime.fromisoformat(time.replace("Z", "+00:00"))
+
+
+class TestPartitionedCrawler:
+
+    @pytest.fixture
+    def client(self):
+        return MockClient(host="some_url", authenticator=PersonalAccessTokenAuthenticator(token="token"))
+
+    def test_created_at_window_restricts_a_copy(self):
+        query = UserIssuesContributions()
+        windowed = CreatedAtWindow().apply(query)
+        substitutions = dict(CreatedAtWindow().substitutions(datetime(2022, 1, 1), datetime(2022, 2, 1)),
+                             user="tester", pg_size=10)
+
+        rendered = windowed.substitute(**substitutions)
+
+        assert 'createdAfter: "2022-01-01T00:00:00Z", createdBefore: "2022-02-01T00:00:00Z"' in rendered
+        assert "createdAfter" not in query.substitute(user="tester", pg_size=10)
+        assert "$window_start: Time" in windowed.document()
+
+    def test_search_qualifier_window_extends_search_string(self):
+        windowed = SearchQualifierWindow().apply(SearchPullRequests())
+        substitutions = {"window_range": "2022-01-01T00:00:00Z..2022-02-01T00:00:00Z", "user": "tester", "pg_size": 10}
+
+        rendered = windowed.substitute(**substitutions)
+
+        assert 'query: "author:tester is:pr created:2022-01-01T00:00:00Z..2022-02-01T00:00:00Z"' in rendered
+        assert windowed.variables is None
+
+    def test_execute_yields_windows_in_order(self, client, requests_mock):
+        def respond(request, context):
+            query = request.json()["query"]
+            month = int(re.search(r'createdAfter: "2022-(\d\d)', query).group(1))
+            if f"{month}_cursor" in query:
+                return issues_page(month, False)
+            return issues_page(month, True)
+
+        requests_mock.post("https://some_url/not/enterprise", json=respond)
+        crawler = PartitionedCrawler(client, CreatedAtWindow(), max_workers=3, target_pages=2,
+                                     min_window=timedelta(days=31))
+
+        pages = list(crawler.execute(UserIssuesContributions(), {"user": "tester", "pg_size": 2},
+                                     "2022-01-01T00:00:00Z", "2022-04-01T00:00:00Z"))
+
+        months = [page["issues"]["nodes"][0]["createdAt"][5:7] for page in pages]
+        assert months == ["01", "01", "02", "02", "03", "03"]
+
+    def test_nodes_around_window_boundaries_are_yielded_once(self, client, requests_mock):
+        # the range is split into three 20 day windows starting on January 1st, January 21st and February 10th
+        # 2022-01-20T23:59:59.600Z is in the last second before a boundary, compared below the second
+        created = ["2022-01-01T00:00:00Z", "2022-01-15T00:00:00Z", "2022-01-20T23:59:59.600Z", "2022-01-21T00:00:00Z",
+                   "2022-02-10T00:00:00Z", "2022-03-02T00:00:00Z"]
+
+        def respond(request, context):
+            query = request.json()["query"]
+            after = re.search(r'createdAfter: "([^"]+)"', query).group(1)
+            before = re.search(r'createdBefore: "([^"]+)"', query).group(1)
+            # GitLab includes both bounds
+            nodes = [{"id": time, "createdAt": time} for time in reversed(created)
+                     if stamp(after) <= stamp(time) <= stamp(before)]
+            return {"data": {"issues": {"nodes": nodes, "pageInfo": {"endCursor": None, "hasNextPage": False}}}}
+
+        requests_mock.post("https://some_url/not/enterprise", json=respond)
+        crawler = PartitionedCrawler(client, CreatedAtWindow(), max_workers=3, min_window=timedelta(days=1))
+
+        pages = list(crawler.execute(UserIssuesContributions(), {"user": "tester", "pg_size": 10},
+                                     "2022-01-01T00:00:00Z", "2022-03-02T00:00:00Z"))
+
+        windows = [[node["id"] for node in page["issues"]["nodes"]] for page in pages]
+        assert windows == [["2022-01-21T00:00:00Z", "2022-01-20T23:59:59.600Z", "2022-01-15T00:00:00Z",
+                            "2022-01-01T00:00:00Z"], ["2022-02-10T00:00:00Z"], ["2022-03-02T00:00:00Z"]]
+
+    def test_window_length_follows_density(self, client):
+        crawler = PartitionedCrawler(client, CreatedAtWindow(), target_pages=4, min_window=timedelta(hours=1))
+
+        assert crawler._next_length([100] * 8, timedelta(days=8)) == timedelta(days=4)
+        assert crawler._next_length([100, 50], timedelta(days=3)) == timedelta(days=8)
+        assert crawler._next_length([], timedelta(days=3)) == timedelta(days=6)
+        assert crawler._next_length([100] * 400, timedelta(days=1)) == timedelta(hours=6)
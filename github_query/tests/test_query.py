@@ -1,5 +1,5 @@
 import pytest
-from github_query.model.query import QueryNode, Query, QueryNodePaginator, PaginatedQuery
+from github_query.model.query import QueryNode, Query, QueryNodePaginator, PaginatedQuery, PaginationCursor
 
 
 class TestQuery:
@@ -180,3 +180,91 @@ class TestQuery:
         assert path == expected_path
         assert paginator == expected_paginator
 
+
+    def test_query_substitute_compiles_template_once(self, monkeypatch):
+        query = Query(fields=[QueryNode("user", args={"login": "$user"}, fields=["login"])])
+        rendered = []
+        original_str = Query.__str__
+
+        def recording_str(node):
+            rendered.append(node)
+            return original_str(node)
+
+        monkeypatch.setattr(Query, "__str__", recording_str)
+        assert query.substitute(user="alice") == 'query { user(login: "alice") { login } }'
+        assert query.substitute(user="bob") == 'query { user(login: "bob") { login } }'
+        assert len(rendered) == 1
+
+    def test_paginated_query_template_follows_cursor(self):
+        query = PaginatedQuery(fields=[
+            QueryNodePaginator("issues", args={"first": "$pg_size"}, fields=[
+                QueryNode("pageInfo", fields=["endCursor", "hasNextPage"])
+            ])
+        ])
+
+        assert query.substitute(pg_size=2) == 'query { issues(first: 2) { pageInfo { endCursor hasNextPage } } }'
+        query.paginator.update_paginator(True, "abc")
+        assert query.substitute(pg_size=2) == \
+            'query { issues(first: 2, after: "abc") { pageInfo { endCursor hasNextPage } } }'
+
+    def test_query_test_time_format(self):
+        assert Query.test_time_format("2022-01-01T16:10:04Z")
+        assert not Query.test_time_format("2022-13-01T16:10:04Z")
+        assert not Query.test_time_format("tester")
+
+    def test_query_convert_dict_renders_lists(self):
+        assert Query.convert_dict({"ids": ["gid://gitlab/Project/1", "gid://gitlab/Project/2"], "sizes": [1, 2]}) == {
+            "ids": '["gid://gitlab/Project/1", "gid://gitlab/Project/2"]', "sizes": "[1, 2]"
+        }
+
+    def test_query_document_declares_variables(self):
+        query = Query(fields=[QueryNode("user", args={"login": "$user"}, fields=["login"])])
+        query.variables = {"user": "String!"}
+
+        assert query.document() == 'query($user: String!) { user(login: $user) { login } }'
+        assert query.variable_values(user="alice", unused=1) == {"user": "alice"}
+
+    def test_paginated_query_document_is_constant_across_pages(self):
+        query = PaginatedQuery(fields=[
+            QueryNode("user", args={"username": "\"$user\""}, fields=[
+                QueryNodePaginator("snippets", args={"first": "$pg_size"}, fields=[
+                    QueryNode("pageInfo", fields=["endCursor", "hasNextPage"])
+                ])
+            ])
+        ])
+        query.variables = {"user": "String!", "pg_size": "Int"}
+        cursor = PaginationCursor()
+        first_page = query.document()
+        assert query.page_variables(cursor, user="alice", pg_size=2) == {"user": "alice", "pg_size": 2, "after": None}
+
+        cursor.update(True, "abc")
+
+        assert query.document() == first_page
+        assert first_page == ('query($user: String!, $pg_size: Int, $after: String) '
+                              '{ user(username: $user) { snippets(first: $pg_size, after: $after) '
+                              '{ pageInfo { endCursor hasNextPage } } } }')
+        assert query.page_variables(cursor, user="alice", pg_size=2)["after"] == "abc"
+
+    def test_paginated_query_substitute_page_leaves_tree_untouched(self):
+        query = PaginatedQuery(fields=[
+            QueryNodePaginator("issues", args={"first": "$pg_size"}, fields=[
+                QueryNode("pageInfo", fields=["endCursor", "hasNextPage"])
+            ])
+        ])
+        first, second = PaginationCursor(), PaginationCursor("abc")
+
+        assert query.substitute_page(first, pg_size=2) == \
+            'query { issues(first: 2, after: null) { pageInfo { endCursor hasNextPage } } }'
+        assert query.substitute_page(second, pg_size=2) == \
+            'query { issues(first: 2, after: "abc") { pageInfo { endCursor hasNextPage } } }'
+        assert query.paginator.args == {"first": "$pg_size"}
+        assert query.paginator.has_next()
+
+    def test_pagination_cursor(self):
+        cursor = PaginationCursor()
+        assert cursor.has_next()
+        assert cursor.literal() == "null"
+
+        cursor.update(False, "abc")
+        assert not cursor.has_next()
+        assert cursor.literal() == '"abc"'
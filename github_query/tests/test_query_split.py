@@ -0,0 +1,48 @@
+from github_query.model.query import Query, QueryNode, PaginatedQuery, PaginationCursor
+from github_query.model.query_split import split_query, merge_responses
+from github_query.queries.gitlab_contributions.user_contributed_and_personal_projects import \
+    UserContributedAndPersonalProjects
+from github_query.queries.utils.cost_estimate import estimate_gitlab_complexity
+
+
+class TestQuerySplit:
+
+    substitutions = {"user": "tester", "pg_size": 10}
+
+    def test_split_query_separates_siblings_within_limit(self):
+        query = UserContributedAndPersonalProjects()
+
+        parts = split_query(query, self.substitutions, estimate_gitlab_complexity, 12)
+
+        assert estimate_gitlab_complexity(query, self.substitutions) > 12
+        assert len(parts) == 3
+        assert all(estimate_gitlab_complexity(part, self.substitutions) <= 12 for part in parts)
+        rendered = [part.substitute_page(PaginationCursor(), **self.substitutions)
+                    if isinstance(part, PaginatedQuery) else part.substitute(**self.substitutions) for part in parts]
+        assert sum("languages" in query for query in rendered) == 1
+        assert sum("{ username }" in query for query in rendered) == 1
+        assert all("pageInfo" in query for query, part in zip(rendered, parts) if isinstance(part, PaginatedQuery))
+
+    def test_split_query_keeps_the_original_untouched(self):
+        query = UserContributedAndPersonalProjects()
+        before = query.substitute(**self.substitutions)
+
+        split_query(query, self.substitutions, estimate_gitlab_complexity, 10)
+
+        assert query.substitute(**self.substitutions) == before
+
+    def test_split_query_returns_none_for_a_single_leaf(self):
+        query = Query(fields=[QueryNode("viewer", fields=["login"])])
+
+        assert split_query(query, {}, estimate_gitlab_complexity, 0) is None
+
+    def test_merge_responses_stitches_lists_by_index(self):
+        first = {"user": {"projects": {"nodes": [{"id": 1, "name": "a"}, {"id": 2, "name": "b"}]}}}
+        second = {"user": {"username": "tester", "projects": {"nodes": [{"id": 1, "languages": []},
+                                                                         {"id": 2, "languages": ["Go"]}]}}}
+
+        assert merge_responses(first, second) == {"user": {
+            "projects": {"nodes": [{"id": 1, "name": "a", "languages": []},
+                                   {"id": 2, "name": "b", "languages": ["Go"]}]},
+            "username": "tester"
+        }}
@@ -0,0 +1,60 @@
+import random
+
+from github_query.queries.contributions.user_repositories import UserRepositories
+from github_query.util.repository_stats import TOTALS, batch_repository_stats
+
+END = "2022-01-01T00:00:00Z"
+
+
+def repository(generator):
+    edges = [{"size": generator.randint(0, 1000), "node": {"name": name}}
+             for name in generator.sample(["Go", "C", "Python", "Rust"], generator.randint(0, 3))]
+    return {"createdAt": f"{generator.randint(2019, 2023)}-06-01T00:00:00Z",
+            "forkCount": generator.randint(0, 5), "stargazerCount": generator.randint(0, 50),
+            "watchers": {"totalCount": generator.randint(0, 5)},
+            "languages": {"totalSize": sum(edge["size"] for edge in edges), "edges": edges}}
+
+
+def pages(repositories, page_size=3):
+    return [{"user": {"repositories": {"nodes": repositories[start:start + page_size]}}}
+            for start in range(0, len(repositories), page_size)]
+
+
+class TestBatchRepositoryStats:
+
+    def test_matches_cumulated_repository_stats(self):
+        generator = random.Random(1)
+        user_pages = {f"user{user}": pages([repository(generator) for _ in range(generator.randint(0, 10))])
+                      for user in range(30)}
+
+        stats = batch_repository_stats(user_pages, END)
+
+        for user, user_page_list in user_pages.items():
+            repo_stats, lang_stats = dict.fromkeys(TOTALS, 0), {}
+            for page in user_page_list:
+                UserRepositories.cumulated_repository_stats(UserRepositories.user_repositories(page),
+                                                            repo_stats, lang_stats, END)
+            assert stats.repo_stats(user) == repo_stats
+            assert stats.lang_stats(user) == lang_stats
+
+    def test_frames(self):
+        go = {"size": 10, "node": {"name": "Go"}}
+        user_pages = {
+            "a": pages([{"createdAt": "2020-01-01T00:00:00Z", "forkCount": 1, "stargazerCount": 2,
+                         "watchers": {"totalCount": 3}, "languages": {"totalSize": 10, "edges": [go]}}]),
+            "b": pages([{"createdAt": "2023-01-01T00:00:00Z", "forkCount": 1, "stargazerCount": 2,
+                         "watchers": {"totalCount": 3}, "languages": {"totalSize": 7,
+                                                                      "edges": [{"size": 7, "node": {"name": "C"}}]}}]),
+        }
+
+        stats = batch_repository_stats(user_pages, END)
+
+        assert stats.totals.loc["a"].tolist() == [1, 1, 2, 3, 10]
+        assert stats.totals.loc["b"].tolist() == [0] * 5
+        assert stats.language_sizes.to_dict("index") == {"a": {"Go": 10}, "b": {"Go": 0}}
+
+    def test_empty_cohort(self):
+        stats = batch_repository_stats({"a": []}, END)
+
+        assert stats.repo_stats("a") == dict.fromkeys(TOTALS, 0)
+        assert stats.lang_stats("a") == {}
@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+
+import github_query.util.helper as helper
+from github_query.queries.contributions.user_gists import UserGists
+from github_query.util.timeline import Timeline, count_leading_before, to_epochs
+
+
+class TestTimeline:
+
+    times = ["2021-06-01T00:00:00Z", "2020-01-01T00:00:00Z", "2021-12-31T23:59:59Z", "2023-03-01T12:00:00Z"]
+
+    def test_to_epochs(self):
+        assert to_epochs("1970-01-01T00:00:10Z") == 10
+        assert to_epochs(["1970-01-02T00:00:00Z", "2021-01-01T00:00:00Z"]).tolist() == [86400, 1609459200]
+        assert to_epochs([]).tolist() == []
+
+    @pytest.mark.parametrize("time", ["2021-01-01T02:00:00+02:00", "2021-01-01T00:00:00.500Z",
+                                      "2021-01-01 00:00:00Z", "2021-01-01T00:00:00", "2021-01-01"])
+    def test_to_epochs_rejects_other_forms(self, time):
+        with pytest.raises(ValueError):
+            to_epochs(time)
+        with pytest.raises(ValueError):
+            to_epochs(["2021-01-01T00:00:00Z", time])
+
+    def test_counts(self):
+        timeline = Timeline(self.times)
+
+        assert timeline.count_before("2021-06-01T00:00:00Z") == 1
+        assert timeline.count_between("2021-06-01T00:00:00Z", "2022-01-01T00:00:00Z") == 2
+        assert timeline.count_between(["2020-01-01T00:00:00Z", "2022-01-01T00:00:00Z"],
+                                      ["2021-01-01T00:00:00Z", "2024-01-01T00:00:00Z"]).tolist() == [1, 1]
+
+    def test_count_by_year(self):
+        timeline = Timeline.from_nodes([{"createdAt": time} for time in self.times])
+
+        assert timeline.count_by_year() == {2020: 1, 2021: 2, 2022: 0, 2023: 1}
+        assert timeline.count_by_year(2019, 2020) == {2019: 0, 2020: 1}
+        assert Timeline([]).count_by_year() == {}
+
+    def test_count_leading_before_stops_at_first_later_record(self):
+        epochs = to_epochs(["2020-01-01T00:00:00Z", "2022-01-01T00:00:00Z", "2020-06-01T00:00:00Z"])
+
+        assert count_leading_before(epochs, "2021-01-01T00:00:00Z") == 1
+        assert count_leading_before(np.sort(epochs), "2021-01-01T00:00:00Z") == 2
+
+    def test_helpers_wrap_to_epochs(self, monkeypatch):
+        calls = []
+        monkeypatch.setattr(helper, "to_epochs", lambda times: calls.append(times) or to_epochs(times))
+
+        assert helper.created_before("2020-01-01T00:00:00Z", "2020-01-01T00:00:01Z") is True
+        assert helper.created_before("2020-01-01T00:00:01Z", "2020-01-01T00:00:01Z") is False
+        assert helper.in_time_period("2021-06-01T00:00:00Z", "2021-01-01T00:00:00Z", "2022-01-01T00:00:00Z") is True
+        assert helper.in_time_period("2021-01-01T00:00:00Z", "2021-01-01T00:00:00Z", "2022-01-01T00:00:00Z") is False
+        assert helper.in_time_period("2022-01-01T00:00:00Z", "2021-01-01T00:00:00Z", "2022-01-01T00:00:00Z") is False
+        assert len(calls) == 5
+
+    def test_helpers_reject_other_forms(self):
+        with pytest.raises(ValueError):
+            helper.created_before("2020-01-01T00:00:00+02:00", "2020-01-01T00:00:01Z")
+        with pytest.raises(ValueError):
+            helper.in_time_period("2021-06-01T00:00:00.5Z", "2021-01-01T00:00:00Z", "2022-01-01T00:00:00Z")
+
+    def test_created_before_time(self):
+        gists = [{"createdAt": time} for time in self.times]
+
+        assert UserGists.created_before_time(gists, "2022-01-01T00:00:00Z") == 3
+        assert UserGists.created_before_time([], "2022-01-01T00:00:00Z") == 0
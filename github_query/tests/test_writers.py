@@ -0,0 +1,153 @@
+import csv
+import json
+import threading
+import time
+
+import pytest
+
+import github_query.util.helper as helper
+from github_query.util import writers
+from github_query.util.writers import CSVWriter, JSONLinesWriter, ParquetWriter
+
+
+class TestWriters:
+
+    def test_csv_writer_publishes_file_atomically(self, tmp_path):
+        path = tmp_path / "out.csv"
+
+        with CSVWriter(str(path), flush_rows=2) as writer:
+            writer.write({"user": "a", "count": 1})
+            writer.write_many([{"user": "b", "count": 2}, ["c", 3], "d,4"])
+            assert not path.exists()
+
+        with open(path, newline="") as file:
+            assert list(csv.reader(file)) == [["user", "count"], ["a", "1"], ["b", "2"], ["c", "3"], ["d", "4"]]
+        assert [entry.name for entry in tmp_path.iterdir()] == ["out.csv"]
+
+    def test_concurrent_producers(self, tmp_path):
+        path = tmp_path / "out.jsonl"
+        writer = JSONLinesWriter(str(path), flush_rows=100, max_queue=8)
+
+        def produce(producer):
+            for row in range(500):
+                writer.write({"producer": producer, "row": row})
+
+        threads = [threading.Thread(target=produce, args=(producer,)) for producer in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        writer.close()
+
+        rows = [json.loads(line) for line in path.read_text().splitlines()]
+        assert len(rows) == writer.rows_written == 4000
+        assert {(row["producer"], row["row"]) for row in rows} == {(p, r) for p in range(8) for r in range(500)}
+
+    def test_flushes_by_time(self, tmp_path):
+        path = tmp_path / "out.csv"
+        writer = CSVWriter(str(path), append=True, flush_interval=0.05)
+
+        writer.write("a,1")
+        deadline = time.monotonic() + 5
+        while path.read_text() != "a,1\n" and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert path.read_text() == "a,1\n"
+        writer.close()
+
+    def test_failed_write_leaves_no_file(self, tmp_path):
+        path = tmp_path / "out.csv"
+        writer = CSVWriter(str(path), columns=["user"])
+        writer.write({"user": "a", "unexpected": 1})
+
+        with pytest.raises(ValueError):
+            writer.close()
+        assert list(tmp_path.iterdir()) == []
+
+    def test_closed_writer_rejects_rows(self, tmp_path):
+        writer = JSONLinesWriter(str(tmp_path / "out.jsonl"))
+        writer.close()
+
+        with pytest.raises(ValueError):
+            writer.write({})
+
+    def test_default_path_uses_helper_naming(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(helper, "get_abs_path", lambda file_name: str(tmp_path / "query_result" / file_name))
+        monkeypatch.setattr(helper, "generate_file_name", lambda: "ABC123")
+
+        with JSONLinesWriter() as writer:
+            writer.write({"a": 1})
+
+        assert writer.path == str(tmp_path / "query_result" / "ABC123.jsonl")
+        assert (tmp_path / "query_result" / "ABC123.jsonl").read_text() == '{"a": 1}\n'
+
+    def test_write_csv_is_synchronous(self, tmp_path):
+        path = str(tmp_path / "out.csv")
+        (tmp_path / "out.csv").write_text("header\n")
+
+        helper.write_csv(path, "a,1")
+        assert (tmp_path / "out.csv").read_text() == "header\na,1\n"
+        helper.write_csv(path, "b,2")
+
+        assert (tmp_path / "out.csv").read_text() == "header\na,1\nb,2\n"
+
+    def test_full_queue_blocks_only_the_producer(self, tmp_path):
+        writer = JSONLinesWriter(str(tmp_path / "out.jsonl"), max_queue=1)
+        release = threading.Event()
+        write_rows = writer._write_rows
+        writer._write_rows = lambda rows: release.wait() and write_rows(rows)
+        writer.write_many([{"a": 0}] * 1000)
+        writer.write({"a": 1})
+        blocked = threading.Thread(target=writer.write, args=({"a": 2},))
+        blocked.start()
+        time.sleep(0.1)
+
+        assert blocked.is_alive()
+        assert writer._condition.acquire(timeout=1)
+        writer._condition.release()
+        release.set()
+        blocked.join(1)
+        writer.close()
+
+        assert len((tmp_path / "out.jsonl").read_text().splitlines()) == 1002
+
+    @pytest.mark.skipif(writers.pyarrow is not None, reason="pyarrow is installed")
+    def test_parquet_requires_pyarrow(self, tmp_path):
+        with pytest.raises(ImportError):
+            ParquetWriter(str(tmp_path / "out.parquet"))
+
+    @pytest.mark.skipif(writers.pyarrow is None, reason="pyarrow is not installed")
+    def test_parquet_writer(self, tmp_path):
+        path = tmp_path / "out.parquet"
+
+        with ParquetWriter(str(path), flush_rows=2) as writer:
+            writer.write_many([{"user": "a", "count": 1}, {"user": "b", "count": 2}, {"user": "c", "count": 3}])
+
+        table = writers.parquet.read_table(str(path))
+        assert table.to_pylist() == [{"user": "a", "count": 1}, {"user": "b", "count": 2}, {"user": "c", "count": 3}]
+
+    @pytest.mark.skipif(writers.pyarrow is None, reason="pyarrow is not installed")
+    def test_parquet_writer_infers_schema_past_null_columns(self, tmp_path):
+        path = tmp_path / "out.parquet"
+
+        with ParquetWriter(str(path), flush_rows=2) as writer:
+            writer.write_many([{"user": "a", "email": None}, {"user": "b", "email": None}])
+            writer.write_many([{"user": "c", "email": "c@example.com"}])
+
+        table = writers.parquet.read_table(str(path))
+        assert table.schema.field("email").type == writers.pyarrow.string()
+        assert table.column("email").to_pylist() == [None, None, "c@example.com"]
+
+    @pytest.mark.skipif(writers.pyarrow is None, reason="pyarrow is not installed")
+    def test_parquet_writer_coalesces_small_batches(self, tmp_path):
+        path = tmp_path / "out.parquet"
+        schema = writers.pyarrow.schema([("count", writers.pyarrow.int64())])
+
+        with ParquetWriter(str(path), flush_rows=4, flush_interval=0.01, schema=schema) as writer:
+            for count in range(10):
+                writer.write({"count": count})
+                time.sleep(0.02)
+
+        file = writers.parquet.ParquetFile(str(path))
+        assert [file.metadata.row_group(i).num_rows for i in range(file.num_row_groups)] == [4, 4, 2]
+        assert file.read().column("count").to_pylist() == list(range(10))
@@ -0,0 +1,154 @@
+from typing import Iterable
+
+import pandas as pd
+
+from github_query.model.query import PaginatedQuery
+
+PARENT = "_parent"
+
+
+class NodeFrames:
+    """
+    Tables of the nodes of a paginated connection.
+
+    `nodes` has a row per node with nested objects flattened into dotted columns, e.g. languages.totalSize.
+    Every nested list becomes a child table named by its dotted path, e.g. languages.edges, with a row per
+    item and a _parent column holding the index of the row it belongs to.
+    """
+
+    def __init__(self, nodes: pd.DataFrame, children: dict):
+        """
+        Initializes the tables.
+        Args:
+            nodes: Table of the nodes
+            children: Map of dotted list paths to child tables
+        """
+        self.nodes = nodes
+        self.children = children
+
+    def __getitem__(self, name: str):
+        return self.children[name]
+
+
+class _Table:
+    """
+    Rows of one table, converted to a DataFrame chunk every chunk_size rows.
+    """
+
+    def __init__(self, chunk_size: int, time_columns: set):
+        self._chunk_size = chunk_size
+        self._time_columns = time_columns
+        self._rows = []
+        self._chunks = []
+        self.count = 0
+
+    def append(self, row: dict):
+        self._rows.append(row)
+        self.count += 1
+        if len(self._rows) >= self._chunk_size:
+            self.flush()
+
+    def flush(self):
+        if not self._rows:
+            return
+        chunk = pd.DataFrame(self._rows, index=pd.RangeIndex(self.count - len(self._rows), self.count))
+        for column in chunk.columns:
+            if column in self._time_columns or column.rsplit(".", 1)[-1].endswith("At"):
+                chunk[column] = pd.to_datetime(chunk[column], utc=True, format="ISO8601")
+        self._chunks.append(chunk)
+        self._rows = []
+
+    def frame(self):
+        self.flush()
+        if not self._chunks:
+            return pd.DataFrame()
+        return pd.concat(self._chunks) if len(self._chunks) > 1 else self._chunks[0]
+
+
+class FrameAccumulator:
+    """
+    Flattens nodes into NodeFrames as they arrive, keeping at most chunk_size pending rows per table.
+    """
+
+    def __init__(self, chunk_size: int = 10000, time_columns: Iterable[str] = ()):
+        """
+        Initializes the accumulator.
+        Args:
+            chunk_size: Number of rows converted to columns at once
+            time_columns: Columns parsed as UTC timestamps besides the ones ending with At, e.g. createdAt
+        """
+        self._chunk_size = chunk_size
+        self._time_columns = set(time_columns)
+        self._tables = {}
+
+    def _table(self, name: str):
+        if name not in self._tables:
+            self._tables[name] = _Table(self._chunk_size, self._time_columns)
+        return self._tables[name]
+
+    def add(self, nodes: Iterable):
+        """
+        Flattens nodes into the tables.
+        Args:
+            nodes: Nodes of the connection
+        """
+        for node in nodes:
+            self._add_row("", node, None)
+
+    def _add_row(self, name: str, item, parent):
+        row = {} if parent is None else {PARENT: parent}
+        lists = []
+        if isinstance(item, dict):
+            self._flatten(item, "", row, lists)
+        else:
+            row["value"] = item
+        table = self._table(name)
+        table.append(row)
+        index = table.count - 1
+        for path, items in lists:
+            child = f"{name}.{path}" if name else path
+            for child_item in items:
+                self._add_row(child, child_item, index)
+
+    def _flatten(self, item: dict, prefix: str, row: dict, lists: list):
+        for key, value in item.items():
+            column = f"{prefix}{key}"
+            if isinstance(value, dict):
+                self._flatten(value, f"{column}.", row, lists)
+            elif isinstance(value, list):
+                lists.append((column, value))
+            else:
+                row[column] = value
+
+    def frames(self):
+        """
+        Returns the tables of the nodes added so far.
+        Returns:
+            NodeFrames
+        """
+        nodes = self._tables.pop("", None)
+        children = {name: table.frame() for name, table in self._tables.items()}
+        return NodeFrames(nodes.frame() if nodes is not None else pd.DataFrame(), children)
+
+
+def to_frame(pages: Iterable, query: PaginatedQuery = None, substitutions: dict = None,
+             chunk_size: int = 10000, time_columns: Iterable[str] = ()):
+    """
+    Flattens the nodes of a paginated run into NodeFrames page by page, so only the current page and the
+    pending rows of the last chunk are held as dicts.
+    Args:
+        pages: Pages of client.execute, or nodes of client.iter_nodes when query is omitted
+        query: PaginatedQuery of the pages, whose path leads to the nodes
+        substitutions: Substitutions of the query
+        chunk_size: Number of rows converted to columns at once
+        time_columns: Columns parsed as UTC timestamps besides the ones ending with At, e.g. createdAt
+    Returns:
+        NodeFrames
+    """
+    accumulator = FrameAccumulator(chunk_size, time_columns)
+    if query is None:
+        accumulator.add(pages)
+    else:
+        for page in pages:
+            accumulator.add(query.nodes(page, substitutions or {}))
+    return accumulator.frames()
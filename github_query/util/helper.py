@@ -6,6 +6,7 @@ from datetime import datetime, timedelta
 from github_query.model.query import Query
 from github_query.model.client import Client
 from github_query.queries.utils.query_cost import QueryCost
+from github_query.util.timeline import to_epochs
 
 
 def print_methods(obj):
@@ -92,10 +93,8 @@ def in_time_period(time, start, end):
     Returns:
         bool: true if the given time is in the time period, false otherwise
     """
-    time = datetime.strptime(time, '%Y-%m-%dT%H:%M:%SZ')
-    start = datetime.strptime(start, '%Y-%m-%dT%H:%M:%SZ')
-    end = datetime.strptime(end, '%Y-%m-%dT%H:%M:%SZ')
-    return end > time > start
+    time, start, end = to_epochs([time, start, end])
+    return bool(end > time > start)
 
 
 def created_before(created, time):
@@ -107,9 +106,8 @@ def created_before(created, time):
     Returns:
         bool: true if the given time is in the time period, false otherwise
     """
-    time = datetime.strptime(time, '%Y-%m-%dT%H:%M:%SZ')
-    created = datetime.strptime(created, '%Y-%m-%dT%H:%M:%SZ')
-    return created < time
+    created, time = to_epochs([created, time])
+    return bool(created < time)
 
 
 def write_csv(file, data_row):
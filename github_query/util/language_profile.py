@@ -0,0 +1,234 @@
+from typing import Callable, Iterable, Union
+
+import numpy as np
+
+
+def page_projects(page: dict):
+    """
+    Returns the projects of a page of UserStarredProjects or UserContributedAndPersonalProjects.
+    Args:
+        page: Page returned by client.execute
+    Returns:
+        List of projects, empty if the user does not exist
+    """
+    user = page.get("user") or {}
+    projects = []
+    for connection in user.values():
+        if isinstance(connection, dict) and "nodes" in connection:
+            projects.extend(node.get("project", node) for node in connection["nodes"] if node)
+    return [project for project in projects if project]
+
+
+class LanguageProfiles:
+    """
+    Language vectors of a cohort of GitLab users over a shared language index.
+
+    The vectors are stored sparsely, as in a CSR matrix: the languages of user i are
+    language_ids[offsets[i]:offsets[i + 1]] with the weights at the same positions of values. A cohort of
+    100k users with a handful of languages each takes a few MB, and every cohort query is a single pass
+    over the non-zero entries.
+    """
+
+    def __init__(self, users: list, languages: list, offsets: np.ndarray, language_ids: np.ndarray,
+                 values: np.ndarray):
+        """
+        Initializes the profiles.
+        Args:
+            users: Users, in row order
+            languages: Language names, in index order
+            offsets: int64 array of the start of every user's entries, followed by the number of entries
+            language_ids: int32 array of the language index of every entry
+            values: float32 array of the weight of every entry
+        """
+        self.users = users
+        self.languages = languages
+        self.offsets = offsets
+        self.language_ids = language_ids
+        self.values = values
+        self._user_index = {user: row for row, user in enumerate(users)}
+        self._language_index = {language: column for column, language in enumerate(languages)}
+        self._rows = np.repeat(np.arange(len(users), dtype=np.int32), np.diff(offsets))
+        self._norms = np.sqrt(np.bincount(self._rows, weights=values.astype(np.float64) ** 2, minlength=len(users)))
+
+    def __len__(self):
+        return len(self.users)
+
+    def vector(self, user: str):
+        """
+        Returns the dense language vector of a user.
+        Args:
+            user: User
+        Returns:
+            float32 array indexed like languages
+        """
+        start, end = self._span(user)
+        vector = np.zeros(len(self.languages), dtype=np.float32)
+        vector[self.language_ids[start:end]] = self.values[start:end]
+        return vector
+
+    def _span(self, user: str):
+        row = self._user_index[user]
+        return self.offsets[row], self.offsets[row + 1]
+
+    def top_languages(self, user: str, k: int = 5):
+        """
+        Returns the heaviest languages of a user.
+        Args:
+            user: User
+            k: Number of languages
+        Returns:
+            List of (language, weight) tuples, heaviest first
+        """
+        start, end = self._span(user)
+        order = np.argsort(-self.values[start:end], kind="stable")[:k]
+        return [(self.languages[self.language_ids[start + i]], float(self.values[start + i])) for i in order]
+
+    def cohort_languages(self, k: int = 10, normalize: bool = True):
+        """
+        Returns the heaviest languages of the whole cohort.
+        Args:
+            k: Number of languages
+            normalize: Scale every user's vector to sum to 1 first, so every user counts equally
+        Returns:
+            List of (language, weight) tuples, heaviest first
+        """
+        weights = self.values.astype(np.float64)
+        if normalize:
+            totals = np.bincount(self._rows, weights=weights, minlength=len(self.users))
+            user_totals = totals[self._rows]
+            weights = np.divide(weights, user_totals, out=np.zeros_like(weights), where=user_totals > 0)
+        sums = np.bincount(self.language_ids, weights=weights, minlength=len(self.languages))
+        return [(self.languages[column], float(sums[column])) for column in _top(sums, k)]
+
+    def top_users(self, language: str, k: int = 10):
+        """
+        Returns the users with the heaviest weight in a language.
+        Args:
+            language: Language name
+            k: Number of users
+        Returns:
+            List of (user, weight) tuples, heaviest first
+        """
+        entries = np.flatnonzero(self.language_ids == self._language_index[language])
+        top = entries[_top(self.values[entries], k)]
+        return [(self.users[self._rows[entry]], float(self.values[entry])) for entry in top]
+
+    def similarities(self, user: str):
+        """
+        Computes the cosine similarity of a user's vector with every user of the cohort.
+        Args:
+            user: User
+        Returns:
+            float64 array of similarities in row order, 0 for users without languages
+        """
+        vector = self.vector(user).astype(np.float64)
+        dots = np.bincount(self._rows, weights=self.values * vector[self.language_ids], minlength=len(self.users))
+        norms = self._norms * self._norms[self._user_index[user]]
+        return np.divide(dots, norms, out=np.zeros_like(dots), where=norms > 0)
+
+    def similar_users(self, user: str, k: int = 10):
+        """
+        Returns the users whose language vectors are the most similar to a user's.
+        Args:
+            user: User
+            k: Number of users
+        Returns:
+            List of (user, cosine similarity) tuples, most similar first, without the user itself
+        """
+        scores = self.similarities(user)
+        scores[self._user_index[user]] = -np.inf
+        return [(self.users[row], float(scores[row])) for row in _top(scores, k) if scores[row] > -np.inf]
+
+
+def _top(scores: np.ndarray, k: int):
+    """
+    Returns the positions of the k largest scores, largest first, with argpartition instead of a full sort.
+    """
+    if k < len(scores):
+        candidates = np.argpartition(-scores, k)[:k]
+    else:
+        candidates = np.arange(len(scores))
+    return candidates[np.argsort(-scores[candidates], kind="stable")]
+
+
+class LanguageProfileBuilder:
+    """
+    Builds LanguageProfiles user by user from the pages of UserStarredProjects and
+    UserContributedAndPersonalProjects.
+
+    A project returned by both queries for the same user is counted once, by its id. Every project adds
+    its language shares, as fractions, times its weight to the user's vector. Projects of weight 0 add
+    nothing, so a language only gets an entry from a project that counts.
+    """
+
+    def __init__(self, weight: Union[str, Callable[[dict], float], None] = None):
+        """
+        Initializes the builder.
+        Args:
+            weight: Weight of a project, a numeric project field both queries select (starCount or
+                forksCount), a function of the project, or None to weigh every project equally
+        """
+        if weight is None:
+            self._weight = lambda project: 1.0
+        elif isinstance(weight, str):
+            self._weight = lambda project: float(project.get(weight) or 0)
+        else:
+            self._weight = weight
+        self._users = []
+        self._languages = {}
+        self._offsets = [0]
+        self._language_ids = []
+        self._values = []
+
+    def add(self, user: str, pages: Iterable[dict]):
+        """
+        Adds a user's vector.
+        Args:
+            user: User
+            pages: Pages of UserStarredProjects and UserContributedAndPersonalProjects of the user
+        """
+        seen = set()
+        vector = {}
+        for page in pages:
+            for project in page_projects(page):
+                key = project.get("id") or project.get("name")
+                if key in seen:
+                    continue
+                seen.add(key)
+                weight = self._weight(project)
+                if not weight:
+                    continue
+                for language in project.get("languages") or []:
+                    column = self._languages.setdefault(language["name"], len(self._languages))
+                    vector[column] = vector.get(column, 0.0) + weight * language["share"] / 100
+        self._users.append(user)
+        for column in sorted(vector):
+            self._language_ids.append(column)
+            self._values.append(vector[column])
+        self._offsets.append(len(self._values))
+
+    def build(self):
+        """
+        Returns the profiles of the users added so far.
+        Returns:
+            LanguageProfiles
+        """
+        return LanguageProfiles(list(self._users), list(self._languages),
+                                np.asarray(self._offsets, dtype=np.int64),
+                                np.asarray(self._language_ids, dtype=np.int32),
+                                np.asarray(self._values, dtype=np.float32))
+
+
+def language_profiles(user_pages: dict, weight: Union[str, Callable[[dict], float], None] = None):
+    """
+    Builds the LanguageProfiles of a cohort.
+    Args:
+        user_pages: Map of users to their pages of UserStarredProjects and UserContributedAndPersonalProjects
+        weight: Weight of a project, see LanguageProfileBuilder
+    Returns:
+        LanguageProfiles
+    """
+    builder = LanguageProfileBuilder(weight)
+    for user, pages in user_pages.items():
+        builder.add(user, pages)
+    return builder.build()
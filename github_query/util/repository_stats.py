@@ -0,0 +1,111 @@
+from itertools import chain
+from typing import Dict, Iterable
+
+import numpy as np
+import pandas as pd
+
+from github_query.queries.contributions.user_repositories import UserRepositories
+from github_query.util.timeline import to_epochs
+
+TOTALS = ["total_count", "fork_count", "stargazer_count", "watchers_count", "total_size"]
+
+
+class RepositoryStats:
+    """
+    Repository totals and language sizes of many users, as computed by UserRepositories.cumulated_repository_stats.
+    """
+
+    def __init__(self, users: list, languages: list, totals: np.ndarray, sizes: np.ndarray, present: np.ndarray):
+        """
+        Initializes the stats.
+        Args:
+            users: Users, in row order
+            languages: Languages, in column order
+            totals: users x TOTALS int64 array
+            sizes: users x languages int64 array of language sizes
+            present: users x languages boolean array of the languages found in a counted repository
+        """
+        self.users = users
+        self.languages = languages
+        self.totals = pd.DataFrame(totals, index=pd.Index(users, name="user"), columns=TOTALS)
+        self.language_sizes = pd.DataFrame(sizes, index=pd.Index(users, name="user"),
+                                           columns=pd.Index(languages, name="language"))
+        self._present = present
+        self._rows = {user: row for row, user in enumerate(users)}
+
+    def repo_stats(self, user: str):
+        """
+        Returns the totals of a user.
+        Args:
+            user: User
+        Returns:
+            Map of TOTALS to values, as cumulated_repository_stats fills repo_stats
+        """
+        return {name: int(value) for name, value in self.totals.loc[user].items()}
+
+    def lang_stats(self, user: str):
+        """
+        Returns the language sizes of a user.
+        Args:
+            user: User
+        Returns:
+            Map of language names to sizes, as cumulated_repository_stats fills lang_stats
+        """
+        row = self._rows[user]
+        columns = np.flatnonzero(self._present[row])
+        return {self.languages[column]: int(self.language_sizes.iat[row, column]) for column in columns}
+
+
+def batch_repository_stats(user_pages: Dict[str, Iterable[dict]], end: str):
+    """
+    Aggregates the UserRepositories pages of many users in one vectorized pass.
+
+    Like cumulated_repository_stats, only repositories created before end with a non-zero languages
+    totalSize are counted. The repositories are read into flat columns, then the time filter, the
+    per-user totals and the user x language matrix are computed with NumPy over every user at once.
+    Args:
+        user_pages: Map of users to the pages of UserRepositories returned by client.execute
+        end: Time string repositories must be created before
+    Returns:
+        RepositoryStats
+    """
+    users = list(user_pages)
+    repos, repo_counts = [], []
+    for user in users:
+        user_repos = [repo for page in user_pages[user] for repo in UserRepositories.user_repositories(page)]
+        repos.extend(user_repos)
+        repo_counts.append(len(user_repos))
+    repo_users = np.repeat(np.arange(len(users), dtype=np.int64), repo_counts)
+
+    languages = [repo["languages"] for repo in repos]
+    # one int column per field, building a row container per repository is several times slower
+    counts = np.column_stack([
+        np.fromiter((repo["forkCount"] for repo in repos), dtype=np.int64, count=len(repos)),
+        np.fromiter((repo["stargazerCount"] for repo in repos), dtype=np.int64, count=len(repos)),
+        np.fromiter((repo["watchers"]["totalCount"] for repo in repos), dtype=np.int64, count=len(repos)),
+        np.fromiter((repo_languages["totalSize"] for repo_languages in languages), dtype=np.int64, count=len(repos)),
+    ])
+    created = to_epochs([repo["createdAt"] for repo in repos])
+    counted = (created < to_epochs(end)) & (counts[:, 3] != 0)
+
+    totals = np.zeros((len(users), len(TOTALS)), dtype=np.int64)
+    np.add.at(totals[:, 0], repo_users[counted], 1)
+    np.add.at(totals[:, 1:], repo_users[counted], counts[counted])
+
+    edge_lists = [repo_languages["edges"] for repo_languages in languages]
+    edges = list(chain.from_iterable(edge_lists))
+    edge_repos = np.repeat(np.arange(len(repos), dtype=np.int64), [len(edge_list) for edge_list in edge_lists])
+    edge_sizes = np.fromiter((edge["size"] for edge in edges), dtype=np.int64, count=len(edges))
+    language_codes, languages = pd.factorize(pd.Series([edge["node"]["name"] for edge in edges], dtype=object))
+    edge_counted = counted[edge_repos]
+    edge_users = repo_users[edge_repos[edge_counted]]
+    edge_languages = language_codes[edge_counted]
+    sizes = np.zeros((len(users), len(languages)), dtype=np.int64)
+    np.add.at(sizes, (edge_users, edge_languages), edge_sizes[edge_counted])
+    present = np.zeros(sizes.shape, dtype=bool)
+    present[edge_users, edge_languages] = True
+
+    # languages found only in repositories that were not counted get no column
+    kept = present.any(axis=0)
+    languages = [language for language, keep in zip(languages, kept) if keep]
+    return RepositoryStats(users, languages, totals, sizes[:, kept], present[:, kept])
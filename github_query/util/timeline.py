@@ -0,0 +1,129 @@
+from typing import Iterable, Union
+
+import numpy as np
+
+Times = Union[str, Iterable[str]]
+
+# length of a %Y-%m-%dT%H:%M:%SZ string
+TIME_LENGTH = 20
+
+
+def to_epochs(times: Times):
+    """
+    Converts time strings such as 2021-06-01T00:00:00Z to epoch seconds in one pass.
+    Args:
+        times: Time string or iterable of time strings, in the %Y-%m-%dT%H:%M:%SZ form
+    Returns:
+        int64 NumPy array of epoch seconds, 0-d for a single string
+    Raises:
+        ValueError: if a string is in another form, e.g. with an offset or a fraction of a second
+    """
+    strings = np.asarray(times if isinstance(times, str) else list(times), dtype=np.str_)
+    if strings.size:
+        # every string takes exactly TIME_LENGTH code points, shorter ones are padded with zeros
+        codes = strings.reshape(-1).view(np.uint32).reshape(-1, strings.itemsize // 4)
+        valid = (codes.shape[1] == TIME_LENGTH and
+                 bool(np.all((codes[:, 10] == ord("T")) & (codes[:, TIME_LENGTH - 1] == ord("Z")))))
+        if not valid:
+            raise ValueError(f"Time strings must have the form YYYY-MM-DDTHH:MM:SSZ, got {_first_invalid(strings)}")
+    # datetime64 rejects the Z suffix, it is checked above and dropped here
+    return strings.astype(f"U{TIME_LENGTH - 1}").astype("datetime64[s]").astype(np.int64)
+
+
+def _first_invalid(strings: np.ndarray):
+    for string in strings.reshape(-1):
+        if len(string) != TIME_LENGTH or string[10] != "T" or not string.endswith("Z"):
+            return repr(string)
+    return None
+
+
+def count_leading_before(epochs: np.ndarray, time: Union[str, int]):
+    """
+    Counts the leading epochs that are before a time, stopping at the first one that is not.
+    Args:
+        epochs: Epoch seconds in the order of the records
+        time: Time string or epoch seconds
+    Returns:
+        Number of leading records created before the time
+    """
+    time = to_epochs(time) if isinstance(time, str) else time
+    if _is_sorted(epochs):
+        return int(np.searchsorted(epochs, time, side="left"))
+    not_before = np.flatnonzero(epochs >= time)
+    return int(not_before[0]) if not_before.size else len(epochs)
+
+
+def _is_sorted(epochs: np.ndarray):
+    return bool(np.all(epochs[:-1] <= epochs[1:]))
+
+
+class Timeline:
+    """
+    Sorted index of the createdAt times of a list of records, answering time-window counts in bulk.
+
+    The strings are parsed once into an int64 array of epoch seconds, and every count is a searchsorted
+    over it, so counting N windows over M records costs O(M log M + N log M) instead of N * M strptime calls.
+    """
+
+    def __init__(self, times: Times):
+        """
+        Initializes the timeline.
+        Args:
+            times: Time strings, e.g. [node["createdAt"] for node in nodes]
+        """
+        epochs = to_epochs(times)
+        self.epochs = epochs if _is_sorted(epochs) else np.sort(epochs)
+
+    @classmethod
+    def from_nodes(cls, nodes: list, field: str = "createdAt"):
+        """
+        Builds the timeline of a field of nodes.
+        Args:
+            nodes: Nodes of a connection
+            field: Time field of the nodes
+        Returns:
+            Timeline
+        """
+        return cls([node[field] for node in nodes])
+
+    def __len__(self):
+        return len(self.epochs)
+
+    def count_before(self, time: Times):
+        """
+        Counts the records created strictly before a time.
+        Args:
+            time: Time string or array of time strings
+        Returns:
+            Count, or array of counts for an array of times
+        """
+        return np.searchsorted(self.epochs, to_epochs(time), side="left")
+
+    def count_between(self, start: Times, end: Times):
+        """
+        Counts the records created in [start, end).
+        Args:
+            start: Start time string or array of start times
+            end: End time string or array of end times
+        Returns:
+            Count, or array of counts for arrays of windows
+        """
+        return np.searchsorted(self.epochs, to_epochs(end), side="left") - self.count_before(start)
+
+    def count_by_year(self, first_year: int = None, last_year: int = None):
+        """
+        Counts the records created in every calendar year.
+        Args:
+            first_year: First year to count, the year of the oldest record if omitted
+            last_year: Last year to count, the year of the newest record if omitted
+        Returns:
+            Map of years to counts
+        """
+        if not len(self.epochs) and (first_year is None or last_year is None):
+            return {}
+        years = self.epochs.astype("datetime64[s]").astype("datetime64[Y]").astype(np.int64) + 1970
+        first_year = int(years[0]) if first_year is None else first_year
+        last_year = int(years[-1]) if last_year is None else last_year
+        bounds = (np.arange(first_year, last_year + 2) - 1970).astype("datetime64[Y]")
+        counts = np.diff(np.searchsorted(self.epochs, bounds.astype("datetime64[s]").astype(np.int64)))
+        return {year: int(count) for year, count in zip(range(first_year, last_year + 1), counts)}
@@ -0,0 +1,331 @@
+import csv
+import json
+import os
+import queue
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Iterable
+
+import github_query.util.helper as helper
+
+try:
+    import pyarrow
+    import pyarrow.parquet as parquet
+except ImportError:
+    pyarrow = None
+
+_CLOSE = object()
+
+
+class ResultWriter(ABC):
+    """
+    Long-lived buffered writer of result rows.
+
+    Any number of producer threads put rows on a bounded queue and a single writer thread drains it, writing
+    a batch every flush_rows rows or flush_interval seconds. The rows go to a temporary file next to the
+    final path, which is fsynced and renamed over the final path on close, so readers never see a partial
+    export. Writers opened with append=True write to the final file directly.
+
+    Rows are durable once close() returns, not when write() does. Callers that need every row on disk as
+    soon as it is written, like helper.write_csv, should not buffer.
+    """
+
+    extension = ""
+
+    def __init__(self, path: str = None, flush_rows: int = 1000, flush_interval: float = 1.0,
+                 append: bool = False, max_queue: int = 1000):
+        """
+        Initializes the writer.
+        Args:
+            path: Output file, a random name from helper.generate_file_name under helper.get_abs_path if omitted
+            flush_rows: Number of buffered rows that triggers a write
+            flush_interval: Seconds buffered rows wait at most before they are written
+            append: Append to the final file instead of replacing it atomically on close
+            max_queue: Number of pending batches producers can queue before they block
+        """
+        self.path = path or helper.get_abs_path(helper.generate_file_name() + self.extension)
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._append = append
+        self._temp_path = self.path if append else f"{self.path}.tmp"
+        self._flush_rows = flush_rows
+        self._flush_interval = flush_interval
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._error = None
+        self._closed = False
+        # guards _closed and counts the producers putting rows, so close() queues _CLOSE after their rows
+        self._condition = threading.Condition()
+        self._producers = 0
+        self.rows_written = 0
+
+        self._open()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def write(self, row):
+        """
+        Queues a row.
+        Args:
+            row: Row to write
+        """
+        self.write_many([row])
+
+    def write_many(self, rows: Iterable):
+        """
+        Queues rows as one batch.
+        Args:
+            rows: Rows to write
+        """
+        rows = list(rows)
+        with self._condition:
+            if self._closed:
+                raise ValueError(f"Writer of {self.path} is closed")
+            if self._error is not None:
+                raise self._error
+            if not rows:
+                return
+            self._producers += 1
+        # a full queue blocks only this producer, not the others or close()
+        try:
+            self._queue.put(rows)
+        finally:
+            with self._condition:
+                self._producers -= 1
+                self._condition.notify_all()
+
+    def close(self):
+        """
+        Writes the pending rows and publishes the file. A write error is raised here, in which case the
+        temporary file is removed and the final path is left untouched.
+        """
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.wait_for(lambda: not self._producers)
+        self._queue.put(_CLOSE)
+        self._thread.join()
+        try:
+            self._close_file()
+        except Exception as error:
+            self._error = self._error or error
+        if self._error is not None:
+            if not self._append and os.path.exists(self._temp_path):
+                os.remove(self._temp_path)
+            raise self._error
+        with open(self._temp_path, "rb") as file:
+            os.fsync(file.fileno())
+        if not self._append:
+            os.replace(self._temp_path, self.path)
+
+    def _run(self):
+        pending = []
+        deadline = None
+        while True:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                batch = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                batch = None
+            if batch is _CLOSE:
+                self._flush(pending)
+                return
+            if batch is not None:
+                pending.extend(batch)
+                deadline = deadline or time.monotonic() + self._flush_interval
+            if len(pending) >= self._flush_rows or (deadline is not None and time.monotonic() >= deadline):
+                self._flush(pending)
+                pending, deadline = [], None
+
+    def _flush(self, rows: list):
+        if not rows or self._error is not None:
+            return
+        try:
+            self._write_rows(rows)
+            self.rows_written += len(rows)
+        except Exception as error:
+            self._error = error
+
+    @abstractmethod
+    def _open(self):
+        """
+        Opens the file rows are written to, self._temp_path.
+        """
+        return
+
+    @abstractmethod
+    def _write_rows(self, rows: list):
+        """
+        Writes a batch of rows and flushes it to the file. Runs on the writer thread.
+        Args:
+            rows: Rows to write
+        """
+        return
+
+    @abstractmethod
+    def _close_file(self):
+        """
+        Closes the file once every row is written.
+        """
+        return
+
+
+class CSVWriter(ResultWriter):
+    """
+    ResultWriter of CSV files. Rows are dicts, sequences, or strings written as preformatted lines like
+    helper.write_csv takes, so a crawl can opt into buffering by replacing write_csv calls with a writer.
+    """
+
+    extension = ".csv"
+
+    def __init__(self, path: str = None, columns: list = None, buffer_size: int = 1 << 20, **kwargs):
+        """
+        Initializes the writer.
+        Args:
+            path: Output file, see ResultWriter
+            columns: Header of dict rows, the keys of the first dict row if omitted
+            buffer_size: Size of the file buffer in bytes
+            **kwargs: Keyword arguments of ResultWriter
+        """
+        self._columns = columns
+        self._buffer_size = buffer_size
+        super().__init__(path, **kwargs)
+
+    def _open(self):
+        write_header = not (self._append and os.path.exists(self._temp_path) and os.path.getsize(self._temp_path))
+        self._file = open(self._temp_path, "a" if self._append else "w", newline="", buffering=self._buffer_size)
+        self._writer = csv.writer(self._file)
+        self._dict_writer = None
+        self._write_header = write_header
+
+    def _write_rows(self, rows: list):
+        for row in rows:
+            if isinstance(row, str):
+                self._file.write(row + "\n")
+            elif isinstance(row, dict):
+                if self._dict_writer is None:
+                    self._dict_writer = csv.DictWriter(self._file, fieldnames=self._columns or list(row))
+                    if self._write_header:
+                        self._dict_writer.writeheader()
+                self._dict_writer.writerow(row)
+            else:
+                self._writer.writerow(row)
+        self._file.flush()
+
+    def _close_file(self):
+        self._file.close()
+
+
+class JSONLinesWriter(ResultWriter):
+    """
+    ResultWriter of JSON Lines files, one JSON document per row.
+    """
+
+    extension = ".jsonl"
+
+    def __init__(self, path: str = None, buffer_size: int = 1 << 20, **kwargs):
+        """
+        Initializes the writer.
+        Args:
+            path: Output file, see ResultWriter
+            buffer_size: Size of the file buffer in bytes
+            **kwargs: Keyword arguments of ResultWriter
+        """
+        self._buffer_size = buffer_size
+        super().__init__(path, **kwargs)
+
+    def _open(self):
+        self._file = open(self._temp_path, "a" if self._append else "w", buffering=self._buffer_size)
+
+    def _write_rows(self, rows: list):
+        self._file.write("".join(json.dumps(row, default=str) + "\n" for row in rows))
+        self._file.flush()
+
+    def _close_file(self):
+        self._file.close()
+
+
+class ParquetWriter(ResultWriter):
+    """
+    ResultWriter of compressed Parquet files of dict rows. Requires pyarrow.
+
+    Batches smaller than flush_rows, like those of time-based flushes, are coalesced, so every row group
+    but the last holds flush_rows rows. Without an explicit schema, it is inferred from the rows buffered
+    for the first row group, which is held back while a column has only null values, up to infer_groups
+    row groups or close().
+    """
+
+    extension = ".parquet"
+    infer_groups = 10
+
+    def __init__(self, path: str = None, compression: str = "zstd", flush_rows: int = 10000, schema=None,
+                 **kwargs):
+        """
+        Initializes the writer.
+        Args:
+            path: Output file, see ResultWriter
+            compression: Parquet compression codec
+            flush_rows: Number of rows per row group
+            schema: pyarrow.Schema of the rows, inferred from the first rows if omitted
+            **kwargs: Keyword arguments of ResultWriter
+        """
+        if pyarrow is None:
+            raise ImportError("ParquetWriter requires pyarrow")
+        if kwargs.get("append"):
+            raise ValueError("Parquet files can't be appended to")
+        self._compression = compression
+        self._schema = schema
+        super().__init__(path, flush_rows=flush_rows, **kwargs)
+
+    def _open(self):
+        self._writer = None
+        self._pending = []
+
+    def _open_writer(self, final: bool):
+        """
+        Opens the Parquet file with the explicit or inferred schema.
+        Args:
+            final: Whether no more rows will come, in which case null columns are written as such
+        Returns:
+            False if the schema can't be inferred from the buffered rows yet
+        """
+        schema = self._schema
+        if schema is None:
+            schema = pyarrow.Table.from_pylist(self._pending).schema
+            if (not final and len(self._pending) < self.infer_groups * self._flush_rows
+                    and any(pyarrow.types.is_null(field.type) for field in schema)):
+                return False
+        self._writer = parquet.ParquetWriter(self._temp_path, schema, compression=self._compression)
+        return True
+
+    def _write_group(self, rows: list):
+        self._writer.write_table(pyarrow.Table.from_pylist(rows, schema=self._writer.schema))
+
+    def _write_rows(self, rows: list):
+        self._pending.extend(rows)
+        if len(self._pending) < self._flush_rows:
+            return
+        if self._writer is None and not self._open_writer(final=False):
+            return
+        while len(self._pending) >= self._flush_rows:
+            self._write_group(self._pending[:self._flush_rows])
+            del self._pending[:self._flush_rows]
+
+    def _close_file(self):
+        if self._pending and self._writer is None:
+            self._open_writer(final=True)
+        if self._pending:
+            self._write_group(self._pending)
+            self._pending = []
+        if self._writer is None:
+            parquet.write_table(pyarrow.table({}), self._temp_path, compression=self._compression)
+        else:
+            self._writer.close()